@@ -0,0 +1,92 @@
+"""
+Benchmark of the cost per guild of sending a reminder when the embed is built for each guild
+compared to building it once per reminder run and reusing its serialized payload.
+
+Run it from the root of the project with: PYTHONPATH=src python benchmarks/bench_reminder_embeds.py
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from command.birthday.birthday import build_birthday_reminder_embed
+from command.event.event import build_event_reminder_embed
+from karthuria.model.character import Character
+from karthuria.model.event import Boss, Challenge, Event
+
+GUILDS = 10000
+SCHOOL_ICON_URL = 'https://cdn.karth.top/assets/res/ui/images/chat/icon_school_{0}.png'
+
+
+async def send_message(channel_id: int, content: str, embed: dict) -> None:
+    """
+    Simulate the request that sends a message, without doing any network call.
+    """
+
+
+def build_events() -> list:
+    """
+    Build the events of a reminder with a boss, a challenge and an event.
+    """
+    end_date = (datetime.now() + timedelta(days=1)).timestamp()
+    boss = Boss(1, end_date=end_date)
+    boss.set_name('Boss Test')
+    boss.set_rarity(5)
+    challenge = Challenge(2, end_date=end_date)
+    challenge.set_name('Challenge Test')
+    challenge.set_rarity(4)
+    return [boss, challenge, Event(3, name='Event Test', end_date=end_date)]
+
+
+def build_birthday_girl() -> Character:
+    """
+    Build the character of a birthday reminder.
+    """
+    detailed_info = {
+        'introduction': {'en': 'Beautiful'},
+        'cv': {'en': 'Aina Aiba'},
+        'likes': {'en': 'Film/theater, training'},
+        'dislikes': {'en': 'Scary stories (esp. Japanese horror films)'},
+    }
+    return Character(104, 'Claudine Saijo', 1, 8, 1, detailed_info=detailed_info)
+
+
+async def send_built_per_guild(build_embed) -> float:
+    """
+    Send the reminder to every guild building and serializing the embed for each of them.
+    """
+    start = time.perf_counter()
+    for guild_id in range(GUILDS):
+        await send_message(guild_id, '@everyone', build_embed().to_dict())
+    return time.perf_counter() - start
+
+
+async def send_built_once(build_embed) -> float:
+    """
+    Send the reminder to every guild building and serializing the embed only once.
+    """
+    start = time.perf_counter()
+    embed_payload = build_embed().to_dict()
+    for guild_id in range(GUILDS):
+        await send_message(guild_id, '@everyone', embed_payload)
+    return time.perf_counter() - start
+
+
+async def run_benchmark(name: str, build_embed) -> None:
+    """
+    Measure and print the cost per guild of both ways of sending a reminder.
+    """
+    per_guild = await send_built_per_guild(build_embed)
+    once = await send_built_once(build_embed)
+    print('{0}: {1:.2f} us/guild built per guild, {2:.2f} us/guild built once ({3:.1f}x) for {4} guilds'
+          .format(name, per_guild / GUILDS * 1e6, once / GUILDS * 1e6, per_guild / once, GUILDS))
+
+
+async def main() -> None:
+    events = build_events()
+    birthday_girl = build_birthday_girl()
+    await run_benchmark('Events reminder', lambda: build_event_reminder_embed(events[0], events, True))
+    await run_benchmark('Birthday reminder', lambda: build_birthday_reminder_embed(birthday_girl, SCHOOL_ICON_URL))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
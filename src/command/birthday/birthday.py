@@ -2,11 +2,15 @@ import logging
 from datetime import datetime
 
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 from discord.ext.commands import Context
 
+from command.broadcaster import Broadcaster
+from command.configuration.model.channel_type import ChannelType
 from command.configuration.repository.server_repository import ServerRepository
 from command.initializer import Initializer
+from command.routing_table import RoutingTable
+from command.scheduler import Scheduler
 from karthuria.model.character import Character
 from karthuria.repository.character_repository import CharacterRepository
 from utils.date_utils import convert_date_to_str
@@ -14,6 +18,9 @@ from utils.discord_utils import get_discord_color
 
 LOG_ID = "BirthdayCommand"
 
+REMINDER_JOB = 'birthday_reminder'
+DEFAULT_REMINDER_TIME = '00:00'
+
 
 class BirthdayCommand(commands.Cog):
     """
@@ -21,11 +28,16 @@ class BirthdayCommand(commands.Cog):
     """
 
     def __init__(self, character_repository: CharacterRepository, server_repository: ServerRepository, cdn_url: str,
-                 my_bot=commands.Bot):
+                 my_bot=commands.Bot, broadcaster: Broadcaster = None, routing_table: RoutingTable = None,
+                 scheduler: Scheduler = None, reminder_time: str = DEFAULT_REMINDER_TIME):
         self.bot = my_bot
+        self.broadcaster = broadcaster if broadcaster is not None else Broadcaster(my_bot)
+        self.routing_table = routing_table if routing_table is not None else RoutingTable(my_bot, server_repository)
         self.character_repository = character_repository
         self.server_repository = server_repository
-        self.birthday_reminder.start()
+        self.scheduler = scheduler
+        if scheduler is not None:
+            scheduler.add_job(REMINDER_JOB, reminder_time, self.birthday_reminder)
         self.school_icon_url = '{0}/{1}'.format(cdn_url, 'res/ui/images/chat/icon_school_{0}.png')
 
     @commands.command(pass_context=True)
@@ -55,46 +67,35 @@ class BirthdayCommand(commands.Cog):
             message = "Je suis désolé, I don't know who '{0}' is".format(name)
         await ctx.send(message, embed=embed)
 
-    @tasks.loop(hours=24)
+    def cog_unload(self) -> None:
+        """
+        Stop the birthday reminder when the commands are unloaded.
+
+        :return: None
+        """
+        if self.scheduler is not None:
+            self.scheduler.remove_job(REMINDER_JOB)
+
     async def birthday_reminder(self) -> None:
         """
-        Background task that is executed one time each 24 hours to review if it is the birthday of
+        Background task that is executed one time each day, at the configured time, to review if it is the birthday of
         any stage girl. If it is then sends a message to the respective announcement channel.
 
         :return: None
         """
         logging.info('[{0}] - Reviewing today birthdays'.format(LOG_ID))
         self.server_repository.reload_servers()
-        today = convert_date_to_str(datetime.today().date(), '%d/%m')
-        birthday_girl = self.character_repository.get_character_birthday(today)
+        now = self.scheduler.now() if self.scheduler is not None else datetime.today()
+        today = convert_date_to_str(now.date(), '%d/%m')
+        birthday_girls = await self.character_repository.get_characters_birthday_async(today)
 
-        if birthday_girl is not None:
+        for birthday_girl in birthday_girls:
             logging.info('[{0}] - Birthday of {1} found'.format(LOG_ID, birthday_girl.name))
+            embed_payload = build_birthday_reminder_embed(birthday_girl, self.school_icon_url).to_dict()
 
-            for guild in self.bot.guilds:
-                server = self.server_repository.find_server_by_id(guild.id)
-                if server is None:
-                    logging.warning('[{0}] - Missing configuration for server [{1}]'.format(LOG_ID, guild.name))
-                else:
-                    if server.birthday_channel is not None:
-                        channel = self.bot.get_channel(server.birthday_channel.channel_id)
-                        rol = guild.get_role(server.birthday_channel.announcement_rol)
-                        embed = build_birthday_reminder_embed(birthday_girl, self.school_icon_url)
-                        await channel.send(rol.mention, embed=embed)
-                    else:
-                        logging.warning('[{0}] - Missing configuration for birthday channel '
-                                        'in server [{1}]'.format(LOG_ID, guild.name))
-
-    @birthday_reminder.before_loop
-    async def before_birthday_reminder(self):
-        """
-        Setup for the birthday reminder.
-
-        :return: None
-        """
-        logging.debug('[{0}] - Waiting to start birthdays reminders...'.format(LOG_ID))
-        await self.bot.wait_until_ready()
-        logging.debug('[{0}] - Birthday reminders ready!'.format(LOG_ID))
+            messages_by_shard = self.routing_table.get_messages_by_shard(ChannelType.BIRTHDAY, embed_payload)
+            await self.broadcaster.broadcast_shards('Birthday reminder of {0}'.format(birthday_girl.name),
+                                                    messages_by_shard)
 
 
 def build_birthday_reminder_embed(birthday_girl: Character, school_icon_url: str) -> discord.Embed:
@@ -148,7 +149,12 @@ def setup(my_bot: commands.Bot) -> None:
     :return: None
     """
     initializer = Initializer()
+    reminder_settings = initializer.get_reminder_settings()
     my_bot.add_cog(BirthdayCommand(initializer.get_character_repository(),
                                    initializer.get_servers_repository(),
                                    initializer.get_cdn_url(),
-                                   my_bot))
+                                   my_bot,
+                                   Broadcaster(my_bot, **initializer.get_broadcast_settings()),
+                                   initializer.get_routing_table(my_bot),
+                                   initializer.get_scheduler(my_bot),
+                                   reminder_settings.get('birthday_time', DEFAULT_REMINDER_TIME)))
@@ -0,0 +1,202 @@
+import asyncio
+import logging
+import time
+
+from aiohttp import ClientError
+from discord import Client, HTTPException
+
+from utils.discord_utils import send_embed_payload
+
+LOG_ID = "Broadcaster"
+
+DEFAULT_MAX_CONCURRENCY = 10
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF = 1.0
+DEFAULT_GLOBAL_RATE = 50
+DEFAULT_GLOBAL_PERIOD = 1.0
+DEFAULT_ROUTE_RATE = 5
+DEFAULT_ROUTE_PERIOD = 5.0
+
+
+class BroadcastMessage:
+    """
+    Model class of a message that is going to be sent to one channel in a broadcast
+    """
+
+    def __init__(self, channel_id: int, content: str, embed_payload: dict, label: str = ''):
+        self.channel_id = channel_id
+        self.content = content
+        self.embed_payload = embed_payload
+        self.label = label
+
+
+class BroadcastReport:
+    """
+    Result of a broadcast, with how long it took, how many messages were sent and the ones that failed
+    """
+
+    def __init__(self, name: str, sent: int, failures: list, elapsed: float):
+        self.name = name
+        self.sent = sent
+        self.failures = failures
+        self.elapsed = elapsed
+
+    def __str__(self):
+        return '{0}: {1} sent, {2} failed in {3:.2f} seconds'.format(self.name, self.sent, len(self.failures),
+                                                                    self.elapsed)
+
+
+class TokenBucket:
+    """
+    Rate limit that allows a number of requests in a period of time, waiting when there are no requests left.
+    It must be used inside a running event loop.
+    """
+
+    def __init__(self, rate: int, period: float):
+        """
+        Initialize the TokenBucket
+
+        :param rate: Number of requests allowed in each period
+        :param period: Seconds of the period
+        """
+        self.rate = rate
+        self.period = period
+        self.tokens = rate
+        self.updated_at = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """
+        Wait until a request is allowed and take it.
+
+        :return: None
+        """
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.rate, self.tokens + (now - self.updated_at) * self.rate / self.period)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) * self.period / self.rate)
+
+
+class Broadcaster:
+    """
+    Sends the same kind of message to many channels at the same time, like the reminders of each server.
+    The number of messages sent at once is bounded, each channel (route) and all the channels together have
+    their own rate limit, and messages that fail because of a temporary error are retried with an
+    exponential backoff.
+    """
+
+    def __init__(self, bot: Client, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 max_retries: int = DEFAULT_MAX_RETRIES, backoff: float = DEFAULT_BACKOFF,
+                 global_rate: int = DEFAULT_GLOBAL_RATE, global_period: float = DEFAULT_GLOBAL_PERIOD,
+                 route_rate: int = DEFAULT_ROUTE_RATE, route_period: float = DEFAULT_ROUTE_PERIOD):
+        """
+        Initialize the Broadcaster
+
+        :param bot: The discord client that sends the messages
+        :param max_concurrency: Max number of messages that are being sent at the same time
+        :param max_retries: Number of times that a message is sent again after a temporary error
+        :param backoff: Seconds to wait before the first retry, each retry waits the double
+        :param global_rate: Number of messages that can be sent in each global period
+        :param global_period: Seconds of the global rate limit
+        :param route_rate: Number of messages that can be sent to the same channel in each route period
+        :param route_period: Seconds of the rate limit of each channel
+        """
+        self.bot = bot
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.global_rate = global_rate
+        self.global_period = global_period
+        self.route_rate = route_rate
+        self.route_period = route_period
+
+    async def broadcast(self, name: str, messages: list, global_bucket: TokenBucket = None) -> BroadcastReport:
+        """
+        Send all the given messages and report how it went.
+
+        :param name: Name of the broadcast, used in the report
+        :param messages: List of BroadcastMessage to send
+        :param global_bucket: Rate limit shared with other broadcasts that run at the same time, a new one if not set
+        :return: The BroadcastReport of the run
+        """
+        start = time.monotonic()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        if global_bucket is None:
+            global_bucket = TokenBucket(self.global_rate, self.global_period)
+        route_buckets = {}
+        for message in messages:
+            if message.channel_id not in route_buckets:
+                route_buckets[message.channel_id] = TokenBucket(self.route_rate, self.route_period)
+
+        async def send(message: BroadcastMessage) -> None:
+            async with semaphore:
+                await self.__send_with_retries(message, global_bucket, route_buckets[message.channel_id])
+
+        results = await asyncio.gather(*[send(message) for message in messages], return_exceptions=True)
+
+        failures = []
+        for message, result in zip(messages, results):
+            if isinstance(result, Exception):
+                failures.append((message, result))
+                logging.error("[{0}] - Couldn't send {1} to [{2}]: {3}".format(LOG_ID, name, message.label, result))
+        report = BroadcastReport(name, len(messages) - len(failures), failures, time.monotonic() - start)
+        logging.info('[{0}] - {1}'.format(LOG_ID, report))
+        return report
+
+    async def broadcast_shards(self, name: str, messages_by_shard: dict) -> list:
+        """
+        Send the messages of each shard in its own broadcast, all of them at the same time.
+        Each shard has its own concurrency limit but all of them share the global rate limit, because it applies
+        to the whole bot and not to each gateway connection.
+
+        :param name: Name of the broadcast, used in the reports with the id of each shard
+        :param messages_by_shard: Dictionary with the id of each shard and its list of BroadcastMessage to send
+        :return: A list with the BroadcastReport of each shard
+        """
+        global_bucket = TokenBucket(self.global_rate, self.global_period)
+        return await asyncio.gather(*[self.broadcast('{0} (shard {1})'.format(name, shard_id), messages, global_bucket)
+                                      for shard_id, messages in messages_by_shard.items()])
+
+    async def __send_with_retries(self, message: BroadcastMessage, global_bucket: TokenBucket,
+                                  route_bucket: TokenBucket) -> None:
+        """
+        Send one message when the rate limits allow it, retrying it if it fails because of a temporary error.
+
+        :param message: The message to send
+        :param global_bucket: Rate limit of all the channels
+        :param route_bucket: Rate limit of the channel of the message
+        :return: None
+        :raise Exception: The last error if the message couldn't be sent
+        """
+        attempt = 0
+        while True:
+            await route_bucket.acquire()
+            await global_bucket.acquire()
+            try:
+                await send_embed_payload(self.bot, message.channel_id, message.content, message.embed_payload)
+                return
+            except Exception as error:
+                if attempt >= self.max_retries or not is_transient_error(error):
+                    raise
+                delay = self.backoff * 2 ** attempt
+                logging.warning('[{0}] - Retrying message to [{1}] in {2} seconds: {3}'.format(LOG_ID, message.label,
+                                                                                            delay, error))
+                attempt += 1
+                await asyncio.sleep(delay)
+
+
+def is_transient_error(error: Exception) -> bool:
+    """
+    Validates if an error sending a message is temporary, so sending it again could work.
+
+    :param error: The error raised sending the message
+    :return: True for rate limits, server errors, timeouts and connection errors
+    """
+    if isinstance(error, HTTPException):
+        return error.status == 429 or error.status >= 500
+    return isinstance(error, (ClientError, asyncio.TimeoutError, ConnectionError))
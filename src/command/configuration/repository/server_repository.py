@@ -1,21 +1,77 @@
+import json
 import logging
 from json import JSONDecodeError
 
 from command.configuration.model.channel_type import ChannelType
 from command.configuration.model.server import Server, Channel
-from utils.file_utils import is_file, load_json_file, write_json_file
+from utils.file_utils import is_file, load_json_file, write_file_atomically, append_json_line, read_json_lines, \
+    remove_file, get_file_signature, get_file_hash
 
 LOG_ID = "ServerRepository"
 
+DEFAULT_COMPACT_EVERY = 100
+JOURNAL_EXTENSION = '.journal'
+
 
 class ServerRepository:
     """
-    Repository with the different servers information
+    Repository with the different servers information.
+    Servers are kept by id, in the same order they have in the file, so they can be found without going
+    through all of them.
+
+    Each change is appended to a journal next to the servers file instead of writing all the servers again.
+    The journal is replayed over the servers file when they are loaded and, after some changes, all the servers
+    are saved again in the servers file and the journal starts empty.
+
+    Reloads only read what changed: the servers file is parsed again only if its content changed, otherwise
+    only the changes appended to the journal since the last load are applied.
+
+    Listeners can be added to know which servers were saved, changed by a reload or removed.
     """
 
-    def __init__(self, servers_path: str):
+    def __init__(self, servers_path: str, compact_every: int = DEFAULT_COMPACT_EVERY):
+        """
+        Initialize the ServerRepository
+
+        :param servers_path: Json file with the servers information
+        :param compact_every: Number of changes in the journal before saving them in the servers file
+        """
         self.file_path = servers_path
-        self.servers = self.__load_servers()
+        self.journal_path = servers_path + JOURNAL_EXTENSION
+        self.compact_every = compact_every
+        self.journal_size = 0
+        self.journal_offset = 0
+        self.file_signature = None
+        self.file_hash = None
+        self.listeners = []
+        self.servers_by_id = self.__load_servers()
+
+    @property
+    def servers(self) -> list:
+        """
+        Return the servers that are currently loaded, in the order they are saved in the file
+        :return: A list with the servers information
+        """
+        return list(self.servers_by_id.values())
+
+    def add_listener(self, listener) -> None:
+        """
+        Add a function that is called each time a server changes, with the server id and the new Server,
+        or None if the server was removed.
+        :param listener: The function to call
+        :return: None
+        """
+        self.listeners.append(listener)
+
+    def notify_listeners(self, server_id: int, server: Server) -> None:
+        """
+        Call all the listeners with a server that changed.
+        :param server_id: Id of the server that changed
+        :param server: The new information of the server, None if it was removed
+        :return: None
+        """
+        for listener in self.listeners:
+            listener(server_id, server)
 
     def find_server_by_id(self, server_id: int) -> Server:
         """
@@ -23,9 +79,7 @@ class ServerRepository:
         :param server_id: Id that identify the server
         :return: A server that is related to the given id
         """
-        for server in self.servers:
-            if server.server_id == server_id:
-                return server
+        return self.servers_by_id.get(server_id)
 
     def create_server(self, server_id: int, server_name: str, channel_id: int, channel_name: str,
                       channel_type: ChannelType, channel_rol: int) -> None:
@@ -47,7 +101,7 @@ class ServerRepository:
             server = Server(server_id, server_name)
         add_channel = getattr(server, 'add_{0}'.format(channel_type.value))
         add_channel(channel)
-        self.__save_server(server)
+        self.save_server(server)
 
     def remove_server_channel(self, server_id: int, channel_type: ChannelType) -> None:
         """
@@ -61,58 +115,133 @@ class ServerRepository:
         if server is not None:
             remove_channel = getattr(server, 'remove_{0}'.format(channel_type.value))
             remove_channel()
-            self.__save_server(server)
+            self.save_server(server)
 
-    def __save_server(self, new_server: Server) -> None:
+    def save_server(self, new_server: Server) -> None:
         """
-        Saves into a pre configured json file the information of a server.
+        Saves into the journal of the pre configured json file the information of a server.
         If the server already exist then it will update it.
 
-        This verification is done by the server name
+        This verification is done by the server id
         :param new_server: The server to save, it can be a new server or and old one
         :return: None
         """
         try:
-            index = 0
-            found = False
-            for server in self.servers:
-                if server.server_id == new_server.server_id:
-                    found = True
-                    self.servers[index] = new_server
-                index += 1
-            if not found:
-                self.servers.append(new_server)
-            write_json_file(self.file_path, [convert_to_dict(server) for server in self.servers])
+            self.servers_by_id[new_server.server_id] = new_server
+            append_json_line(self.journal_path, convert_to_dict(new_server))
+            self.journal_size += 1
             logging.debug('[{0}] - Successfully saved server [{1}] information'.format(LOG_ID, new_server.name))
-        except (TypeError, FileNotFoundError) as error:
+        except (TypeError, OSError) as error:
             logging.error("[{0}] - Couldn't saver server [{1}] information: {2}".format(LOG_ID, new_server.name, error))
+            return
+
+        self.notify_listeners(new_server.server_id, new_server)
+        if self.journal_size >= self.compact_every:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Save all the servers in the pre configured json file and empty the journal.
+        The file is replaced atomically, if the process stops before removing the journal its changes are
+        already part of the file and replaying them again doesn't change anything.
+
+        :return: None
+        """
+        try:
+            servers = [convert_to_dict(server) for server in self.servers_by_id.values()]
+            write_file_atomically(self.file_path, json.dumps(servers).encode('utf-8'))
+            remove_file(self.journal_path)
+            self.journal_size = 0
+            self.journal_offset = 0
+            self.file_signature = get_file_signature(self.file_path)
+            self.file_hash = get_file_hash(self.file_path)
+            logging.debug('[{0}] - Servers journal compacted'.format(LOG_ID))
+        except (TypeError, OSError) as error:
+            logging.error("[{0}] - Couldn't compact servers journal: {1}".format(LOG_ID, error))
 
-    def __load_servers(self) -> list:
+    def __load_servers(self, previous_servers: dict = None) -> dict:
         """
-        Load server information from a file if exists otherwise will return an empty list
-        :return: A list with the server information
+        Load server information from a file if exists otherwise will return an empty dictionary.
+        The changes saved in the journal are applied over the information of the file.
+        :param previous_servers: Servers loaded before, the ones that didn't change are kept instead of creating
+            them again
+        :return: A dictionary with the server information by server id
         """
-        servers = []
+        servers = {}
+        self.file_signature = get_file_signature(self.file_path)
+        self.file_hash = get_file_hash(self.file_path)
         try:
             if is_file(self.file_path):
                 servers_file = load_json_file(self.file_path)
-                for server in servers_file:
-                    servers.append(convert_to_server(server))
+                for server_dict in servers_file:
+                    server = get_updated_server(server_dict, previous_servers or {})
+                    servers[server.server_id] = server
                 logging.debug('[{0}] - Server information loaded successfully'.format(LOG_ID))
             else:
                 logging.error("[{0}] - Couldn't load server information, Not file found".format(LOG_ID))
         except (JSONDecodeError, TypeError) as error:
             logging.error("[{0}] - Couldn't load server information: {1}".format(LOG_ID, error))
+
+        self.journal_size = 0
+        self.journal_offset = 0
+        self.__replay_journal(servers, previous_servers or {})
         return servers
 
+    def __replay_journal(self, servers: dict, previous_servers: dict) -> None:
+        """
+        Apply over the given servers the changes appended to the journal since the last time it was read.
+        :param servers: The servers where the changes are applied
+        :param previous_servers: Servers loaded before, the ones that didn't change are kept instead of creating
+            them again
+        :return: None
+        """
+        journal, self.journal_offset = read_json_lines(self.journal_path, self.journal_offset)
+        try:
+            for server_dict in journal:
+                server = get_updated_server(server_dict, previous_servers)
+                servers[server.server_id] = server
+        except (KeyError, TypeError) as error:
+            logging.error("[{0}] - Couldn't replay servers journal: {1}".format(LOG_ID, error))
+        self.journal_size += len(journal)
+
     def reload_servers(self) -> None:
         """
         Refresh the current server information of the file into the ServerRepository.
         This is a measure to keep data updated.
 
+        If the content of the file didn't change only the new changes of the journal are applied, and if
+        nothing changed at all nothing is read again.
+
+        :return: None
+        """
+        signature = get_file_signature(self.file_path)
+        if signature is None or signature != self.file_signature:
+            if signature is None or get_file_hash(self.file_path) != self.file_hash:
+                self.__set_servers(self.__load_servers(self.servers_by_id))
+                return
+            self.file_signature = signature
+
+        journal_signature = get_file_signature(self.journal_path)
+        journal_bytes = journal_signature[1] if journal_signature is not None else 0
+        if journal_bytes < self.journal_offset:
+            self.__set_servers(self.__load_servers(self.servers_by_id))
+        elif journal_bytes > self.journal_offset:
+            servers = dict(self.servers_by_id)
+            self.__replay_journal(servers, self.servers_by_id)
+            self.__set_servers(servers)
+
+    def __set_servers(self, servers: dict) -> None:
+        """
+        Replace the loaded servers and notify the listeners about the ones that changed or were removed.
+
+        :param servers: The new servers by server id
         :return: None
         """
-        self.servers = self.__load_servers()
+        previous_servers = self.servers_by_id
+        self.servers_by_id = servers
+        for server_id in {**previous_servers, **servers}:
+            if previous_servers.get(server_id) is not servers.get(server_id):
+                self.notify_listeners(server_id, servers.get(server_id))
 
 
 def convert_to_server(server_dict: dict) -> Server:
@@ -140,6 +269,21 @@ def convert_to_server(server_dict: dict) -> Server:
     return server
 
 
+def get_updated_server(server_dict: dict, previous_servers: dict) -> Server:
+    """
+    Transform a dictionary with the server and channel information, reusing the Server that was loaded before
+    if its information is the same.
+
+    :param server_dict: Server dictionary that was retrieved from a JSON file
+    :param previous_servers: Servers loaded before by server id
+    :return: The previous Server if it didn't change, otherwise a new instance with the given information
+    """
+    server = previous_servers.get(server_dict['server_id'])
+    if server is not None and convert_to_dict(server) == server_dict:
+        return server
+    return convert_to_server(server_dict)
+
+
 def convert_to_dict(server: Server) -> dict:
     """
     Transform a Server object into a dict, including its channels
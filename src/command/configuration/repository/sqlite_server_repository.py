@@ -0,0 +1,198 @@
+import logging
+import sqlite3
+import threading
+
+from command.configuration.model.channel_type import ChannelType
+from command.configuration.model.server import Server, Channel
+from command.configuration.repository.server_repository import ServerRepository
+from utils.file_utils import is_file
+
+LOG_ID = "SqliteServerRepository"
+
+SCHEMA_VERSION = 1
+
+CREATE_SERVERS_TABLE = 'CREATE TABLE IF NOT EXISTS servers (' \
+                       'server_id INTEGER NOT NULL UNIQUE, ' \
+                       'name TEXT NOT NULL)'
+CREATE_CHANNELS_TABLE = 'CREATE TABLE IF NOT EXISTS channels (' \
+                        'server_id INTEGER NOT NULL REFERENCES servers (server_id), ' \
+                        'channel_type TEXT NOT NULL, ' \
+                        'channel_id INTEGER NOT NULL, ' \
+                        'name TEXT NOT NULL, ' \
+                        'announcement_rol INTEGER, ' \
+                        'PRIMARY KEY (server_id, channel_type))'
+SELECT_SERVER = 'SELECT server_id, name FROM servers WHERE server_id = ?'
+SELECT_SERVERS = 'SELECT server_id, name FROM servers ORDER BY rowid'
+SELECT_SERVER_CHANNELS = 'SELECT server_id, channel_type, channel_id, name, announcement_rol ' \
+                         'FROM channels WHERE server_id = ?'
+SELECT_CHANNELS = 'SELECT server_id, channel_type, channel_id, name, announcement_rol FROM channels'
+UPDATE_SERVER = 'UPDATE servers SET name = ? WHERE server_id = ?'
+INSERT_SERVER = 'INSERT INTO servers (server_id, name) VALUES (?, ?)'
+DELETE_SERVER_CHANNELS = 'DELETE FROM channels WHERE server_id = ?'
+INSERT_CHANNEL = 'INSERT INTO channels (server_id, channel_type, channel_id, name, announcement_rol) ' \
+                 'VALUES (?, ?, ?, ?, ?)'
+
+
+class SqliteServerRepository(ServerRepository):
+    """
+    Repository with the different servers information saved in a SQLite database.
+    Servers are searched by id directly in the database and each change is saved in its own transaction,
+    so there is nothing to load or reload in memory. The first time the database is created the servers of
+    the json file, and its journal, are migrated into it.
+    """
+
+    def __init__(self, database_path: str, servers_path: str = None):
+        """
+        Initialize the SqliteServerRepository
+
+        :param database_path: SQLite file with the servers information
+        :param servers_path: Json file with the servers information to migrate, if there is one
+        """
+        self.database_path = database_path
+        self.file_path = servers_path
+        self.lock = threading.Lock()
+        self.listeners = []
+        self.connection = sqlite3.connect(database_path, check_same_thread=False)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA foreign_keys=ON')
+        self.__create_schema()
+
+    @property
+    def servers(self) -> list:
+        """
+        Return all the saved servers, in the order they were created
+        :return: A list with the servers information
+        """
+        with self.lock:
+            channels = self.connection.execute(SELECT_CHANNELS).fetchall()
+            servers = [convert_rows_to_server(row, []) for row in self.connection.execute(SELECT_SERVERS)]
+        servers_by_id = {server.server_id: server for server in servers}
+        for channel_row in channels:
+            add_channel(servers_by_id[channel_row[0]], channel_row)
+        return servers
+
+    def find_server_by_id(self, server_id: int) -> Server:
+        """
+        Search for a server in the database with the configured id
+        :param server_id: Id that identify the server
+        :return: A server that is related to the given id
+        """
+        with self.lock:
+            server_row = self.connection.execute(SELECT_SERVER, (server_id,)).fetchone()
+            if server_row is None:
+                return None
+            return convert_rows_to_server(server_row, self.connection.execute(SELECT_SERVER_CHANNELS, (server_id,)))
+
+    def save_server(self, new_server: Server) -> None:
+        """
+        Saves into the database the information of a server and its channels in one transaction.
+        If the server already exist then it will update it.
+
+        :param new_server: The server to save, it can be a new server or and old one
+        :return: None
+        """
+        try:
+            with self.lock, self.connection:
+                insert_server(self.connection, new_server)
+            logging.debug('[{0}] - Successfully saved server [{1}] information'.format(LOG_ID, new_server.name))
+        except sqlite3.Error as error:
+            logging.error("[{0}] - Couldn't saver server [{1}] information: {2}".format(LOG_ID, new_server.name, error))
+            return
+        self.notify_listeners(new_server.server_id, new_server)
+
+    def compact(self) -> None:
+        """
+        Changes are saved directly in the database, so there is no journal to compact.
+
+        :return: None
+        """
+
+    def reload_servers(self) -> None:
+        """
+        Servers are always read from the database, so there is nothing to reload.
+
+        :return: None
+        """
+
+    def close(self) -> None:
+        """
+        Close the connection with the database.
+
+        :return: None
+        """
+        with self.lock:
+            self.connection.close()
+
+    def __create_schema(self) -> None:
+        """
+        Create the tables of the database if they don't exist and, the first time, migrate into them
+        the servers of the json file.
+
+        :return: None
+        """
+        with self.lock, self.connection:
+            version = self.connection.execute('PRAGMA user_version').fetchone()[0]
+            if version >= SCHEMA_VERSION:
+                return
+            self.connection.execute(CREATE_SERVERS_TABLE)
+            self.connection.execute(CREATE_CHANNELS_TABLE)
+            servers = self.__load_json_servers()
+            for server in servers:
+                insert_server(self.connection, server)
+            self.connection.execute('PRAGMA user_version = {0}'.format(SCHEMA_VERSION))
+        logging.info('[{0}] - Database created, {1} servers migrated'.format(LOG_ID, len(servers)))
+
+    def __load_json_servers(self) -> list:
+        """
+        Load the servers of the json file and its journal, if it was configured.
+
+        :return: A list with the servers information
+        """
+        if self.file_path is None or not is_file(self.file_path):
+            return []
+        return ServerRepository(self.file_path).servers
+
+
+def insert_server(connection: sqlite3.Connection, server: Server) -> None:
+    """
+    Insert or update a server and replace its channels, it must be called inside a transaction.
+
+    :param connection: Connection with the database
+    :param server: The server to save
+    :return: None
+    """
+    if connection.execute(UPDATE_SERVER, (server.name, server.server_id)).rowcount == 0:
+        connection.execute(INSERT_SERVER, (server.server_id, server.name))
+    connection.execute(DELETE_SERVER_CHANNELS, (server.server_id,))
+    for channel_type in ChannelType:
+        channel = getattr(server, channel_type.value)
+        if channel is not None:
+            connection.execute(INSERT_CHANNEL, (server.server_id, channel_type.value, channel.channel_id,
+                                                channel.name, channel.announcement_rol))
+
+
+def convert_rows_to_server(server_row: tuple, channel_rows) -> Server:
+    """
+    Transform the rows of a server and its channels into a Server.
+
+    :param server_row: Row with the server id and name
+    :param channel_rows: Rows with the channels of the server
+    :return: A new instance of the Server model with the given information
+    """
+    server = Server(server_row[0], server_row[1])
+    for channel_row in channel_rows:
+        add_channel(server, channel_row)
+    return server
+
+
+def add_channel(server: Server, channel_row: tuple) -> None:
+    """
+    Add to a server the channel of a row.
+
+    :param server: The server of the channel
+    :param channel_row: Row with the server id, channel type, channel id, name and announcement rol
+    :return: None
+    """
+    _, channel_type, channel_id, name, announcement_rol = channel_row
+    add = getattr(server, 'add_{0}'.format(ChannelType(channel_type).value))
+    add(Channel(channel_id, name, announcement_rol))
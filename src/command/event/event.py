@@ -2,15 +2,20 @@ import logging
 from datetime import datetime
 
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 from discord.ext.commands import Context
 
+from command.broadcaster import Broadcaster
+from command.configuration.model.channel_type import ChannelType
 from command.configuration.repository.server_repository import ServerRepository
 from command.initializer import Initializer
+from command.routing_table import RoutingTable
+from command.scheduler import Scheduler
 from karthuria.model.event import Challenge, Boss, Event
 from karthuria.repository.dress_repository import DressRepository
 from karthuria.repository.enemy_repository import EnemyRepository
 from karthuria.repository.event_repository import EventRepository
+from utils.async_utils import gather_with_limit
 from utils.date_utils import get_days_diff
 from utils.discord_utils import get_discord_color
 
@@ -18,6 +23,11 @@ LOG_ID = "EventCommand"
 
 RELIVE_RGB = (234, 1, 36)
 
+MAX_CONCURRENT_LOOKUPS = 10
+
+REMINDER_JOB = 'events_reminder'
+DEFAULT_REMINDER_TIME = '00:00'
+
 
 class EventCommand(commands.Cog):
     """
@@ -25,13 +35,19 @@ class EventCommand(commands.Cog):
     """
 
     def __init__(self, event_repository: EventRepository, dress_repository: DressRepository,
-                 enemy_repository: EnemyRepository, server_repository: ServerRepository, my_bot=commands.Bot):
+                 enemy_repository: EnemyRepository, server_repository: ServerRepository, my_bot=commands.Bot,
+                 broadcaster: Broadcaster = None, routing_table: RoutingTable = None, scheduler: Scheduler = None,
+                 reminder_time: str = DEFAULT_REMINDER_TIME):
         self.bot = my_bot
+        self.broadcaster = broadcaster if broadcaster is not None else Broadcaster(my_bot)
+        self.routing_table = routing_table if routing_table is not None else RoutingTable(my_bot, server_repository)
         self.event_repository = event_repository
         self.dress_repository = dress_repository
         self.enemy_repository = enemy_repository
         self.server_repository = server_repository
-        self.events_reminder.start()
+        self.scheduler = scheduler
+        if scheduler is not None:
+            scheduler.add_job(REMINDER_JOB, reminder_time, self.events_reminder)
 
     @commands.command(pass_context=True)
     async def current_events(self, ctx: Context) -> None:
@@ -53,8 +69,9 @@ class EventCommand(commands.Cog):
         description = 'This is what I could find:'
         embed = discord.Embed(title=title, description=description, color=get_discord_color(RELIVE_RGB))
 
-        current_events = self.event_repository.get_current_events()
-        events = self.__get_complete_event_data([inner for outer in current_events for inner in current_events[outer]])
+        current_events = await self.event_repository.get_current_events_async()
+        events = await self.__get_complete_event_data([inner for outer in current_events
+                                                       for inner in current_events[outer]])
 
         for event in events:
             if isinstance(event, Challenge):
@@ -71,21 +88,30 @@ class EventCommand(commands.Cog):
 
         await ctx.send(embed=embed)
 
-    @tasks.loop(hours=24)
+    def cog_unload(self) -> None:
+        """
+        Stop the events reminder when the commands are unloaded.
+
+        :return: None
+        """
+        if self.scheduler is not None:
+            self.scheduler.remove_job(REMINDER_JOB)
+
     async def events_reminder(self) -> None:
         """
-        Background task that is executed one time each 24 hours to review if an event is about one day to end.
+        Background task that is executed one time each day, at the configured time, to review if an event is about
+        one day to end.
         If it is then sends a message to the respective announcement channel.
 
         :return: None
         """
         logging.info('[{0}] - Reviewing today events'.format(LOG_ID))
 
-        self.event_repository.reload_events()
+        await self.event_repository.reload_events_async()
 
         events_about_to_end = []
         events_about_to_start = []
-        current_events = self.event_repository.get_current_events()
+        current_events = await self.event_repository.get_current_events_async()
 
         for current_event in current_events:
             events_about_to_end += get_events_about_to_end(current_events[current_event])
@@ -103,64 +129,67 @@ class EventCommand(commands.Cog):
             logging.info('[{0}] - Found {1} Events About to Start'.format(LOG_ID, events_about_to_start_count))
             await self.__send_info_events_reminder(events_about_to_start, is_ending=False)
 
-    @events_reminder.before_loop
-    async def before_events_reminder(self):
-        """
-        Setup for events reminder.
-
-        :return: None
-        """
-        logging.debug('[{0}] - Waiting to start events reminders...'.format(LOG_ID))
-        await self.bot.wait_until_ready()
-        logging.debug('[{0}] - Events reminders ready!'.format(LOG_ID))
+        Initializer().log_pool_stats()
 
     async def __send_info_events_reminder(self, events_about_to_remind: list, is_ending: bool):
 
         self.server_repository.reload_servers()
 
-        events_about_to_remind = self.__get_complete_event_data(events_about_to_remind)
+        events_about_to_remind = await self.__get_complete_event_data(events_about_to_remind)
+        if len(events_about_to_remind) == 0:
+            logging.warning('[{0}] - None of the events to remind could be completed'.format(LOG_ID))
+            return
         super_event = events_about_to_remind[0]
+        embed_payload = build_event_reminder_embed(super_event, events_about_to_remind, is_ending).to_dict()
 
-        for guild in self.bot.guilds:
-            server = self.server_repository.find_server_by_id(guild.id)
-            if server is None:
-                logging.warning('[{0}] - Missing configuration for server [{1}]'.format(LOG_ID, guild.name))
-            else:
-                if server.event_channel is not None:
-                    channel = self.bot.get_channel(server.event_channel.channel_id)
-                    rol = guild.get_role(server.event_channel.announcement_rol)
-                    embed = build_event_reminder_embed(super_event, events_about_to_remind, is_ending)
-                    await channel.send(rol.mention, embed=embed)
-                else:
-                    logging.warning('[{0}] - Missing configuration for event channel '
-                                    'in server [{1}]'.format(LOG_ID, guild.name))
-
-    def __get_complete_event_data(self, events: list) -> list:
+        messages_by_shard = self.routing_table.get_messages_by_shard(ChannelType.EVENT, embed_payload)
+        await self.broadcaster.broadcast_shards('Events reminder', messages_by_shard)
+
+    async def __get_complete_event_data(self, events: list) -> list:
         """
         Retrieve complete data from an Event, Challenge or Boss and return a list with that information.
+        All the lookups are done concurrently, so it takes as long as the slowest of them.
 
         :param events: List of events to retrieve their information
-        :return: A list of each event with its complete data like names, rarity or hp percentage.
+        :return: A list of each event with its complete data like names, rarity or hp percentage, in the same order.
+            Events whose information couldn't be retrieved are left out.
         """
+        results = await gather_with_limit([self.__complete_event(event) for event in events], MAX_CONCURRENT_LOOKUPS)
+
         complete_data = []
-        for event in events:
-            if isinstance(event, Challenge):
-                dress = self.dress_repository.get_dress_by_id(event.event_id)
-                event.set_name(dress.name)
-                event.set_rarity(dress.rarity)
-                complete_data.append(event)
-            elif isinstance(event, Boss):
-                enemy = self.enemy_repository.get_enemy_by_id(event.event_id)
-                event.set_name(enemy.name)
-                event.set_rarity(enemy.rarity)
-                event.set_icon(enemy.icon)
-                complete_data.append(event)
+        for event, result in zip(events, results):
+            if isinstance(result, Exception):
+                logging.error("[{0}] - Couldn't complete event [{1}]: {2}".format(LOG_ID, event.event_id, result))
+            elif result is None:
+                logging.warning("[{0}] - Missing information of event [{1}]".format(LOG_ID, event.event_id))
             else:
-                event_name = self.event_repository.get_event_name_by_id(event.event_id)
-                event.set_name(event_name)
-                complete_data.append(event)
+                complete_data.append(result)
         return complete_data
 
+    async def __complete_event(self, event: Event) -> Event:
+        """
+        Retrieve complete data of one Event, Challenge or Boss.
+
+        :param event: The event to retrieve its information
+        :return: The same event with its name, rarity or icon set. None if its information wasn't found
+        """
+        if isinstance(event, Challenge):
+            dress = await self.dress_repository.get_dress_by_id_async(event.event_id)
+            if dress is None:
+                return None
+            event.set_name(dress.name)
+            event.set_rarity(dress.rarity)
+        elif isinstance(event, Boss):
+            enemy = await self.enemy_repository.get_enemy_by_id_async(event.event_id)
+            if enemy is None:
+                return None
+            event.set_name(enemy.name)
+            event.set_rarity(enemy.rarity)
+            event.set_icon(enemy.icon)
+        else:
+            event.set_name(await self.event_repository.get_event_name_by_id_async(event.event_id))
+        return event
+
 
 def get_events_about_to_end(current_events: list) -> list:
     """
@@ -238,8 +267,13 @@ def setup(my_bot: commands.Bot) -> None:
     :return: None
     """
     initializer = Initializer()
+    reminder_settings = initializer.get_reminder_settings()
     my_bot.add_cog(EventCommand(initializer.get_event_repository(),
                                 initializer.get_dress_repository(),
                                 initializer.get_enemy_repository(),
                                 initializer.get_servers_repository(),
-                                my_bot))
+                                my_bot,
+                                Broadcaster(my_bot, **initializer.get_broadcast_settings()),
+                                initializer.get_routing_table(my_bot),
+                                initializer.get_scheduler(my_bot),
+                                reminder_settings.get('events_time', DEFAULT_REMINDER_TIME)))
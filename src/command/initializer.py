@@ -1,7 +1,21 @@
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 
-from command.configuration.repository.server_repository import ServerRepository
+from discord import Client
+
+from command.configuration.repository.server_repository import ServerRepository, DEFAULT_COMPACT_EVERY
+from command.configuration.repository.sqlite_server_repository import SqliteServerRepository
+from command.routing_table import RoutingTable
+from command.scheduler import Scheduler, DEFAULT_STATE_PATH, DEFAULT_UTC_OFFSET
+from karthuria.async_client import AsyncKarthuriaClient
+from karthuria.cache.disk_cache import DiskCache, DEFAULT_MAX_BYTES
+from karthuria.cache.memory_cache import MemoryCache
+from karthuria.cache.snapshot import CatalogSnapshot
+from karthuria.cache.validator_cache import ValidatorCache
+from karthuria.catalog_diff import IncrementalParser
 from karthuria.client import KarthuriaClient
+from karthuria.repository.catalog_refresher import CatalogRefresher
 from karthuria.repository.character_repository import CharacterRepository
 from karthuria.repository.dress_repository import DressRepository
 from karthuria.repository.enemy_repository import EnemyRepository
@@ -9,6 +23,10 @@ from karthuria.repository.equip_repository import EquipRepository
 from karthuria.repository.event_repository import EventRepository
 from utils.file_utils import load_json_file
 
+LOG_ID = "Initializer"
+
+WARM_UP_WORKERS = 4
+
 
 class Singleton(type):
     """
@@ -27,18 +45,109 @@ class Initializer(metaclass=Singleton):
     Class to initialize and inject all the dependencies of different classes.
     This can be done way better with a dependency injection framework or library, but right know lets just
     do it in the easy way.
+    The Karthuria catalogs of characters, events, dresses and equips are downloaded at the same time, so
+    starting the bot takes as long as the slowest of them, unless they are configured as lazy in the
+    'karthuria_lazy_catalogs' settings, then they are downloaded the first time they are used. With a
+    'karthuria_snapshot' the catalogs parsed in the last run are used while they are downloaded in the background.
+    Both clients share the same IncrementalParser, so each refresh only converts the entries that changed.
     """
 
     def __init__(self):
         self.settings = load_json_file(os.getenv('SETTINGS_PATH', 'settings.json'))
+        self.validator_cache = ValidatorCache()
+        self.incremental_parser = IncrementalParser()
+        self.disk_cache = self.__build_disk_cache(self.settings.get('karthuria_cache'))
         self.karthuria_client = KarthuriaClient(self.settings.get('karthuria_api_url'),
-                                                self.settings.get("karthuria_cdn_url"))
-        self.character_repository = CharacterRepository(self.karthuria_client)
-        self.server_repository = ServerRepository(self.settings.get('servers_path'))
-        self.event_repository = EventRepository(self.karthuria_client)
-        self.dress_repository = DressRepository(self.karthuria_client)
-        self.enemy_repository = EnemyRepository(self.karthuria_client)
-        self.equip_repository = EquipRepository(self.karthuria_client)
+                                                self.settings.get("karthuria_cdn_url"),
+                                                self.settings.get('karthuria_http'),
+                                                self.validator_cache,
+                                                self.disk_cache,
+                                                self.incremental_parser)
+        self.async_karthuria_client = AsyncKarthuriaClient(self.settings.get('karthuria_api_url'),
+                                                           self.settings.get("karthuria_cdn_url"),
+                                                           self.settings.get('karthuria_http'),
+                                                           self.validator_cache,
+                                                           self.disk_cache,
+                                                           self.incremental_parser)
+        lookup_cache_settings = self.settings.get('karthuria_lookup_cache', {})
+        lazy_catalogs = self.settings.get('karthuria_lazy_catalogs', {})
+        self.snapshot = self.__build_snapshot(self.settings.get('karthuria_snapshot'))
+        with ThreadPoolExecutor(max_workers=WARM_UP_WORKERS) as executor:
+            character_repository = executor.submit(CharacterRepository, self.karthuria_client,
+                                                   self.async_karthuria_client,
+                                                   lazy_catalogs.get('characters', False), self.snapshot)
+            event_repository = executor.submit(EventRepository, self.karthuria_client, self.async_karthuria_client,
+                                               lazy_catalogs.get('events', False), self.snapshot)
+            dress_repository = executor.submit(DressRepository, self.karthuria_client, self.async_karthuria_client,
+                                               MemoryCache(**lookup_cache_settings),
+                                               lazy_catalogs.get('dresses', False), self.snapshot)
+            equip_repository = executor.submit(EquipRepository, self.karthuria_client,
+                                               lazy_catalogs.get('equips', False), self.snapshot)
+            self.server_repository = self.__build_server_repository(self.settings)
+            self.enemy_repository = EnemyRepository(self.karthuria_client, self.async_karthuria_client,
+                                                    MemoryCache(**lookup_cache_settings))
+            self.character_repository = character_repository.result()
+            self.event_repository = event_repository.result()
+            self.dress_repository = dress_repository.result()
+            self.equip_repository = equip_repository.result()
+        self.catalog_refresher = CatalogRefresher({'characters': self.character_repository,
+                                                   'dresses': self.dress_repository,
+                                                   'equips': self.equip_repository,
+                                                   'events': self.event_repository},
+                                                  self.settings.get('karthuria_refresh_intervals'))
+        self.routing_table = None
+        self.scheduler = None
+        self.log_pool_stats()
+
+    def log_pool_stats(self) -> None:
+        """
+        Log how many requests of the Karthuria clients reused a pooled connection and how many opened a new one,
+        the hits and misses of the dress and enemy lookup caches and the seconds since each catalog was refreshed.
+        :return: None
+        """
+        logging.info('[{0}] - Karthuria client pool: {1}'.format(LOG_ID, self.karthuria_client.get_pool_stats()))
+        logging.info('[{0}] - Async Karthuria client pool: {1}'.format(LOG_ID,
+                                                                      self.async_karthuria_client.get_pool_stats()))
+        logging.info('[{0}] - Dress lookup cache: {1}'.format(LOG_ID, self.dress_repository.cache.stats()))
+        logging.info('[{0}] - Enemy lookup cache: {1}'.format(LOG_ID, self.enemy_repository.cache.stats()))
+        logging.info('[{0}] - Catalogs age in seconds: {1}'.format(LOG_ID, self.catalog_refresher.get_refresh_ages()))
+
+    @staticmethod
+    def __build_disk_cache(cache_settings: dict) -> DiskCache:
+        """
+        Build the persistent cache of Karthuria responses if it was configured in the settings file.
+        :param cache_settings: Configuration of the cache with its 'path', 'max_bytes' and 'ttl' of each path pattern
+        :return: An instance of the Disk Cache, None if it wasn't configured
+        """
+        if cache_settings is None:
+            return None
+        return DiskCache(cache_settings.get('path'),
+                         cache_settings.get('max_bytes', DEFAULT_MAX_BYTES),
+                         cache_settings.get('ttl'))
+
+    @staticmethod
+    def __build_snapshot(snapshot_settings: dict) -> CatalogSnapshot:
+        """
+        Build the persistent snapshot of the parsed catalogs if it was configured in the settings file.
+        :param snapshot_settings: Configuration of the snapshot with its 'path'
+        :return: An instance of the Catalog Snapshot, None if it wasn't configured
+        """
+        if snapshot_settings is None:
+            return None
+        return CatalogSnapshot(snapshot_settings.get('path'))
+
+    @staticmethod
+    def __build_server_repository(settings: dict) -> ServerRepository:
+        """
+        Build the repository of servers with the storage selected in the settings file, 'json' or 'sqlite'.
+        When sqlite is used for the first time the servers of the json file are migrated into the database.
+        :param settings: The settings of the bot
+        :return: An instance of the Server Repository
+        """
+        if settings.get('servers_storage') == 'sqlite':
+            return SqliteServerRepository(settings.get('servers_database_path'), settings.get('servers_path'))
+        return ServerRepository(settings.get('servers_path'),
+                                settings.get('servers_compact_every', DEFAULT_COMPACT_EVERY))
 
     def get_karthuria_client(self) -> KarthuriaClient:
         """
@@ -47,6 +156,13 @@ class Initializer(metaclass=Singleton):
         """
         return self.karthuria_client
 
+    def get_async_karthuria_client(self) -> AsyncKarthuriaClient:
+        """
+        Based on the class initialization return the specific non blocking client that was configured.
+        :return: An instance of the Async Karthuria Client
+        """
+        return self.async_karthuria_client
+
     def get_character_repository(self) -> CharacterRepository:
         """
         Based on the class initialization return the specific character repository that was configured.
@@ -89,6 +205,52 @@ class Initializer(metaclass=Singleton):
         """
         return self.equip_repository
 
+    def get_catalog_refresher(self) -> CatalogRefresher:
+        """
+        Based on the class initialization return the background refresher of the Karthuria catalogs.
+        :return: An instance of the Catalog Refresher
+        """
+        return self.catalog_refresher
+
+    def get_routing_table(self, bot: Client) -> RoutingTable:
+        """
+        Return the routing table of announcements shared by all the commands, creating it the first time.
+        :param bot: The discord client with the guilds of the bot
+        :return: An instance of the Routing Table
+        """
+        if self.routing_table is None:
+            self.routing_table = RoutingTable(bot, self.server_repository)
+        return self.routing_table
+
+    def get_scheduler(self, bot: Client) -> Scheduler:
+        """
+        Return the scheduler of the daily tasks shared by all the commands, creating and starting it the first time.
+        :param bot: The discord client whose loop runs the tasks
+        :return: An instance of the Scheduler
+        """
+        if self.scheduler is None:
+            reminder_settings = self.get_reminder_settings()
+            self.scheduler = Scheduler(reminder_settings.get('state_path', DEFAULT_STATE_PATH),
+                                       reminder_settings.get('utc_offset', DEFAULT_UTC_OFFSET))
+            self.scheduler.start(bot)
+        return self.scheduler
+
+    def get_reminder_settings(self) -> dict:
+        """
+        Based on the settings file returns the configuration of the daily reminders, like the 'utc_offset' of
+        their time zone and the 'birthday_time' and 'events_time' when they are sent
+        :return A dictionary with the reminders configuration
+        """
+        return self.settings.get('reminders', {})
+
+    def get_broadcast_settings(self) -> dict:
+        """
+        Based on the settings file returns the configuration of the reminders broadcasts, like 'max_concurrency',
+        'max_retries', 'backoff' and the rate limits
+        :return A dictionary with the broadcast configuration
+        """
+        return self.settings.get('broadcast', {})
+
     def get_cdn_url(self) -> str:
         """
         Based on the settings file returns the cdn url that was configured
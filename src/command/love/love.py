@@ -36,8 +36,6 @@ class LoveCommand(commands.Cog):
         self.no_love_url_thumbnail = '{0}/res_en/res/item_root/medium/32_10412.png'.format(cdn_url)
         self.dress_url = '{0}/{1}'.format(cdn_url, 'dlc/res/dress/cg/{0}/image.png')
         self.equip_url = '{0}/{1}'.format(cdn_url, 'dlc/res/equip/cg/{0}/image.png')
-        self.claudine_dresses = []
-        self.claudine_equips = []
 
     @commands.command(pass_context=True)
     async def i_love_you(self, ctx: Context) -> None:
@@ -50,13 +48,11 @@ class LoveCommand(commands.Cog):
         """
         logging.debug('[{0}] - Love command called'.format(LOG_ID))
 
-        if len(self.claudine_dresses) == 0:
-            self.claudine_dresses = self.dress_repository.get_dresses_by_character_id(self.CLAUDINE_CHARACTER_ID)
-        if len(self.claudine_equips) == 0:
-            self.claudine_equips = self.equip_repository.get_equips_by_character_id(self.CLAUDINE_CHARACTER_ID)
+        claudine_dresses = self.dress_repository.get_dresses_by_character_id(self.CLAUDINE_CHARACTER_ID)
+        claudine_equips = self.equip_repository.get_equips_by_character_id(self.CLAUDINE_CHARACTER_ID)
 
-        options = [self.I_LOVE_YOU_TEXT, get_random_dress(self.claudine_dresses, self.dress_url),
-                   get_random_equip(self.claudine_equips, self.equip_url)]
+        options = [self.I_LOVE_YOU_TEXT, get_random_dress(claudine_dresses, self.dress_url),
+                   get_random_equip(claudine_equips, self.equip_url)]
         random_option = random.choices(options, weights=(1, 50, 80), k=1)
 
         if random_option[0] == self.I_LOVE_YOU_TEXT:
@@ -0,0 +1,215 @@
+import logging
+
+from discord import Client, Guild, Role
+from discord.abc import GuildChannel
+
+from command.broadcaster import BroadcastMessage
+from command.configuration.model.channel_type import ChannelType
+from command.configuration.model.server import Server
+from command.configuration.repository.server_repository import ServerRepository
+
+LOG_ID = "RoutingTable"
+
+
+class Route:
+    """
+    Model class of where an announcement of a guild is sent, with its channel and the mention of its role
+    already resolved, and the shard that receives the guild events
+    """
+
+    def __init__(self, guild_id: int, guild_name: str, channel_id: int, mention: str, shard_id: int = 0):
+        self.guild_id = guild_id
+        self.guild_name = guild_name
+        self.channel_id = channel_id
+        self.mention = mention
+        self.shard_id = shard_id
+
+
+class RoutingTable:
+    """
+    Routes of the announcements of each type for all the guilds that configured them.
+    Only the guilds of the shards connected by this process are known by the bot, so when the bot is sharded in
+    several processes each one only has the routes of its own guilds.
+    The table is built the first time it is used and then only the routes of one guild are updated when its
+    configuration changes or when the bot joins or leaves it, or its channels and roles change. This way sending
+    an announcement is a single pass over the routes, without searching servers, channels or roles.
+    """
+
+    def __init__(self, bot: Client, server_repository: ServerRepository):
+        """
+        Initialize the RoutingTable and start listening to the changes of configurations, guilds, channels
+        and roles.
+
+        :param bot: The discord client with the guilds of the bot
+        :param server_repository: Repository with the configuration of each guild
+        """
+        self.bot = bot
+        self.server_repository = server_repository
+        self.routes = None
+        server_repository.add_listener(self.update_server)
+        bot.add_listener(self.update_guild, 'on_guild_join')
+        bot.add_listener(self.remove_guild, 'on_guild_remove')
+        bot.add_listener(self.on_guild_update, 'on_guild_update')
+        bot.add_listener(self.on_guild_role_update, 'on_guild_role_update')
+        bot.add_listener(self.on_guild_role_change, 'on_guild_role_create')
+        bot.add_listener(self.on_guild_role_change, 'on_guild_role_delete')
+        bot.add_listener(self.on_guild_channel_change, 'on_guild_channel_create')
+        bot.add_listener(self.on_guild_channel_change, 'on_guild_channel_delete')
+
+    def get_routes(self, channel_type: ChannelType) -> list:
+        """
+        Return the routes of all the guilds that configured a channel for the given type of announcement.
+
+        :param channel_type: The type of announcement
+        :return: A list of Route
+        """
+        if self.routes is None:
+            self.rebuild()
+        return list(self.routes[channel_type].values())
+
+    def get_routes_by_shard(self, channel_type: ChannelType) -> dict:
+        """
+        Return the routes of the given type of announcement grouped by the shard of their guilds.
+
+        :param channel_type: The type of announcement
+        :return: A dictionary with the id of each shard and its list of Route
+        """
+        routes_by_shard = {}
+        for route in self.get_routes(channel_type):
+            routes_by_shard.setdefault(route.shard_id, []).append(route)
+        return routes_by_shard
+
+    def get_messages_by_shard(self, channel_type: ChannelType, embed_payload: dict) -> dict:
+        """
+        Build the message of each route of the given type of announcement, grouped by shard, mentioning the
+        configured role of each guild.
+
+        :param channel_type: The type of announcement
+        :param embed_payload: The serialized embed of the announcement, shared by all the messages
+        :return: A dictionary with the id of each shard and its list of BroadcastMessage
+        """
+        return {shard_id: [BroadcastMessage(route.channel_id, route.mention, embed_payload, route.guild_name)
+                           for route in routes]
+                for shard_id, routes in self.get_routes_by_shard(channel_type).items()}
+
+    def rebuild(self) -> None:
+        """
+        Build the routes of all the guilds of the bot again.
+
+        :return: None
+        """
+        routes = {channel_type: {} for channel_type in ChannelType}
+        for guild in self.bot.guilds:
+            server = self.server_repository.find_server_by_id(guild.id)
+            for channel_type in ChannelType:
+                route = build_route(guild, server, channel_type)
+                if route is not None:
+                    routes[channel_type][guild.id] = route
+        self.routes = routes
+        logging.info('[{0}] - Routes built: {1}'.format(LOG_ID, ', '.join(
+            '{0} {1}'.format(len(routes[channel_type]), channel_type.value) for channel_type in ChannelType)))
+
+    def update_server(self, server_id: int, server: Server) -> None:
+        """
+        Update the routes of a guild whose configuration changed.
+
+        :param server_id: Id of the guild
+        :param server: The new configuration of the guild, None if it was removed
+        :return: None
+        """
+        guild = self.bot.get_guild(server_id)
+        if guild is None:
+            self.remove_guild_by_id(server_id)
+        else:
+            self.__update_routes(guild, server)
+
+    async def update_guild(self, guild: Guild) -> None:
+        """
+        Update the routes of a guild with its current configuration.
+
+        :param guild: The guild to update
+        :return: None
+        """
+        self.__update_routes(guild, self.server_repository.find_server_by_id(guild.id))
+
+    async def remove_guild(self, guild: Guild) -> None:
+        """
+        Remove the routes of a guild that the bot left.
+
+        :param guild: The guild to remove
+        :return: None
+        """
+        self.remove_guild_by_id(guild.id)
+
+    async def on_guild_update(self, _, after: Guild) -> None:
+        """
+        Update the routes of a guild that changed, like its name.
+        """
+        await self.update_guild(after)
+
+    async def on_guild_role_update(self, _, after: Role) -> None:
+        """
+        Update the routes of the guild of a role that changed.
+        """
+        await self.update_guild(after.guild)
+
+    async def on_guild_role_change(self, role: Role) -> None:
+        """
+        Update the routes of the guild of a role that was created or deleted.
+        """
+        await self.update_guild(role.guild)
+
+    async def on_guild_channel_change(self, channel: GuildChannel) -> None:
+        """
+        Update the routes of the guild of a channel that was created or deleted.
+        """
+        await self.update_guild(channel.guild)
+
+    def remove_guild_by_id(self, guild_id: int) -> None:
+        """
+        Remove the routes of a guild.
+
+        :param guild_id: Id of the guild to remove
+        :return: None
+        """
+        if self.routes is None:
+            return
+        for channel_type in ChannelType:
+            self.routes[channel_type].pop(guild_id, None)
+
+    def __update_routes(self, guild: Guild, server: Server) -> None:
+        """
+        Build again the routes of one guild, if the table was already built.
+
+        :param guild: The guild to update
+        :param server: The configuration of the guild
+        :return: None
+        """
+        if self.routes is None:
+            return
+        for channel_type in ChannelType:
+            route = build_route(guild, server, channel_type)
+            if route is None:
+                self.routes[channel_type].pop(guild.id, None)
+            else:
+                self.routes[channel_type][guild.id] = route
+
+
+def build_route(guild: Guild, server: Server, channel_type: ChannelType) -> Route:
+    """
+    Resolve where an announcement of a guild must be sent.
+
+    :param guild: The guild of the announcement
+    :param server: The configuration of the guild, it can be None
+    :param channel_type: The type of announcement
+    :return: The Route of the announcement, None if it isn't configured or its channel doesn't exist anymore
+    """
+    channel = getattr(server, channel_type.value, None)
+    if channel is None:
+        return None
+    if guild.get_channel(channel.channel_id) is None:
+        logging.warning('[{0}] - Channel [{1}] of server [{2}] not found'.format(LOG_ID, channel.name, guild.name))
+        return None
+    role = guild.get_role(channel.announcement_rol)
+    mention = role.mention if role is not None else ''
+    return Route(guild.id, guild.name, channel.channel_id, mention, guild.shard_id or 0)
@@ -0,0 +1,214 @@
+import asyncio
+import json
+import logging
+import os
+from datetime import datetime, date, time, timedelta, timezone
+
+from discord import Client
+
+from utils.file_utils import is_file, load_json_file, write_file_atomically
+
+LOG_ID = "Scheduler"
+
+DEFAULT_STATE_PATH = 'data/scheduler.json'
+DEFAULT_UTC_OFFSET = 0
+DEFAULT_MAX_SLEEP = 60 * 60
+TIME_FORMAT = '%H:%M'
+
+
+class Job:
+    """
+    Model class of a task that is executed one time each day at the same wall clock time
+    """
+
+    def __init__(self, name: str, run_at: time, callback):
+        self.name = name
+        self.run_at = run_at
+        self.callback = callback
+
+
+class Scheduler:
+    """
+    Executes daily tasks at a fixed wall clock time of the configured time zone, instead of each 24 hours
+    since the bot started. The day of the last run of each task is saved in a file, so after a restart a task
+    that was missed that day is executed one time as soon as possible and a task that was already executed
+    isn't executed again until the next day.
+    Time zones are configured as an offset from UTC, daylight saving time isn't taken into account.
+    """
+
+    def __init__(self, state_path: str, utc_offset: float = DEFAULT_UTC_OFFSET, max_sleep: float = DEFAULT_MAX_SLEEP):
+        """
+        Initialize the Scheduler
+
+        :param state_path: Json file where the day of the last run of each task is saved, it must be in a folder
+            that is kept between restarts, otherwise the tasks of the day are executed again after each restart
+        :param utc_offset: Hours of difference of the time zone of the tasks with UTC
+        :param max_sleep: Max seconds to wait before checking again the tasks, in case the system clock changes
+        """
+        self.state_path = state_path
+        os.makedirs(os.path.dirname(self.state_path) or '.', exist_ok=True)
+        self.timezone = timezone(timedelta(hours=utc_offset))
+        self.max_sleep = max_sleep
+        self.jobs = {}
+        self.last_runs = self.__load_last_runs()
+        self.task = None
+        self.wake_up = None
+
+    def add_job(self, name: str, run_at: str, callback) -> None:
+        """
+        Register a daily task, replacing any other task with the same name.
+
+        :param name: Unique name of the task, used to save its last run
+        :param run_at: Time of the day when the task is executed, with the format HH:MM
+        :param callback: Coroutine function without arguments that executes the task
+        :return: None
+        """
+        self.jobs[name] = Job(name, datetime.strptime(run_at, TIME_FORMAT).time(), callback)
+        logging.info('[{0}] - Task [{1}] scheduled, next run at {2}'.format(LOG_ID, name, self.get_next_run(name)))
+        if self.wake_up is not None:
+            self.wake_up.set()
+
+    def remove_job(self, name: str) -> None:
+        """
+        Stop executing a daily task.
+
+        :param name: Name of the task
+        :return: None
+        """
+        self.jobs.pop(name, None)
+
+    def start(self, bot: Client) -> None:
+        """
+        Start executing the registered tasks, and the ones registered later, once the bot is ready.
+
+        :param bot: The discord client whose loop runs the tasks
+        :return: None
+        """
+        if self.task is None:
+            self.task = bot.loop.create_task(self.run(bot))
+
+    def stop(self) -> None:
+        """
+        Stop executing all the tasks.
+
+        :return: None
+        """
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    def get_next_run(self, name: str) -> datetime:
+        """
+        Calculate when a task is going to be executed.
+
+        :param name: Name of the task
+        :return: The date and time of the next run, in the past if the run of today was missed.
+            None if the task doesn't exist
+        """
+        job = self.jobs.get(name)
+        if job is None:
+            return None
+        today = self.now().date()
+        run_day = today + timedelta(days=1) if self.last_runs.get(name) == today else today
+        return datetime.combine(run_day, job.run_at, tzinfo=self.timezone)
+
+    def get_next_runs(self) -> dict:
+        """
+        Calculate when each task is going to be executed, to know if the tasks are running as expected.
+
+        :return: A dictionary with the name of each task and the date and time of its next run
+        """
+        return {name: self.get_next_run(name) for name in self.jobs}
+
+    def now(self) -> datetime:
+        """
+        Return the current date and time in the time zone of the tasks.
+
+        :return: An aware datetime
+        """
+        return datetime.now(self.timezone)
+
+    async def run(self, bot: Client) -> None:
+        """
+        Wait until the bot is ready and then execute each task when it is due, forever.
+
+        :param bot: The discord client that must be ready before executing the tasks
+        :return: None
+        """
+        self.wake_up = asyncio.Event()
+        await bot.wait_until_ready()
+        logging.info('[{0}] - Scheduler ready, next runs: {1}'.format(LOG_ID, self.__format_next_runs()))
+        while True:
+            await self.run_pending()
+            self.wake_up.clear()
+            try:
+                await asyncio.wait_for(self.wake_up.wait(), self.__get_sleep_seconds())
+            except asyncio.TimeoutError:
+                pass
+
+    async def run_pending(self) -> None:
+        """
+        Execute the tasks whose time of today already passed and that weren't executed today.
+        The run is saved before executing the task, so a task that fails isn't executed again the same day.
+
+        :return: None
+        """
+        now = self.now()
+        for job in list(self.jobs.values()):
+            if self.get_next_run(job.name) > now:
+                continue
+            self.last_runs[job.name] = now.date()
+            self.__save_last_runs()
+            logging.info('[{0}] - Running task [{1}]'.format(LOG_ID, job.name))
+            try:
+                await job.callback()
+            except Exception as error:
+                logging.error('[{0}] - Task [{1}] failed: {2}'.format(LOG_ID, job.name, error))
+            logging.info('[{0}] - Task [{1}] finished, next run at {2}'.format(LOG_ID, job.name,
+                                                                             self.get_next_run(job.name)))
+
+    def __get_sleep_seconds(self) -> float:
+        """
+        Calculate the seconds until the next task is due, never more than the max sleep.
+
+        :return: Seconds to wait
+        """
+        next_runs = self.get_next_runs().values()
+        if len(next_runs) == 0:
+            return self.max_sleep
+        return max(0.0, min(self.max_sleep, (min(next_runs) - self.now()).total_seconds()))
+
+    def __format_next_runs(self) -> str:
+        """
+        Describe the next run of each task to log it.
+
+        :return: A string with the name and next run of each task
+        """
+        return ', '.join('{0} at {1}'.format(name, next_run) for name, next_run in self.get_next_runs().items())
+
+    def __load_last_runs(self) -> dict:
+        """
+        Load the day of the last run of each task from the state file.
+
+        :return: A dictionary with the name of each task and the date of its last run
+        """
+        if not is_file(self.state_path):
+            return {}
+        try:
+            state = load_json_file(self.state_path)
+            return {name: date.fromisoformat(last_run) for name, last_run in state.items()}
+        except ValueError as error:
+            logging.error("[{0}] - Couldn't load the state of the tasks: {1}".format(LOG_ID, error))
+            return {}
+
+    def __save_last_runs(self) -> None:
+        """
+        Save the day of the last run of each task in the state file.
+
+        :return: None
+        """
+        state = {name: last_run.isoformat() for name, last_run in self.last_runs.items()}
+        try:
+            write_file_atomically(self.state_path, json.dumps(state).encode('utf-8'))
+        except OSError as error:
+            logging.error("[{0}] - Couldn't save the state of the tasks: {1}".format(LOG_ID, error))
@@ -0,0 +1,197 @@
+import asyncio
+import json
+from http import HTTPStatus
+
+import aiohttp
+
+from karthuria.cache.disk_cache import DiskCache
+from karthuria.cache.validator_cache import ValidatorCache
+from karthuria.catalog_diff import IncrementalParser
+from karthuria.client import parse_characters, parse_character, parse_dress, parse_dresses_incrementally, \
+    parse_equips_incrementally, parse_enemy, parse_events_incrementally, parse_current_events, parse_cached_response, \
+    get_entry_headers
+from karthuria.model.character import Character, Dress, Enemy
+from karthuria.session import PoolStats, build_async_session
+
+
+class AsyncKarthuriaClient:
+    """
+    Non blocking client to connect an retrieve information from the Karthuria API.
+    It returns the same information than KarthuriaClient, but all the requests are awaitable and share one
+    aiohttp session so they don't block the bot event loop while waiting for the API.
+    More information can be found in their web site: https://karth.top/home
+    """
+
+    def __init__(self, endpoint: str, cdn_url: str, http_settings: dict = None,
+                 validator_cache: ValidatorCache = None, disk_cache: DiskCache = None,
+                 incremental_parser: IncrementalParser = None):
+        """
+        Initialize the AsyncKarthuriaClient
+
+        :param endpoint: Base url to retrieve information from the Karthuria API
+        :param cdn_url: Base url to retrieve assets from the Karthuria CDN
+        :param http_settings: Configuration of the connection pool, like 'pool_size', 'pool_per_host'
+            and 'keepalive_timeout'
+        :param validator_cache: Cache of the catalogs validators, it can be shared with other clients
+        :param disk_cache: Persistent cache of the responses, if it is not set responses are not saved in disk
+        :param incremental_parser: Parser of the dresses, equips and events catalogs that only converts the entries
+            that changed, it can be shared with other clients
+        """
+        self.endpoint = endpoint
+        self.cdn_url = cdn_url
+        self.validator_cache = validator_cache if validator_cache is not None else ValidatorCache()
+        self.disk_cache = disk_cache
+        self.incremental_parser = incremental_parser if incremental_parser is not None else IncrementalParser()
+        self.http_settings = http_settings or {}
+        self.pool_stats = PoolStats()
+        self.session = None
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared session of the client, creating it the first time.
+        It must be called inside a running event loop.
+
+        :return: The aiohttp session used by all the requests
+        """
+        if self.session is None or self.session.closed:
+            self.session = build_async_session(self.pool_stats, **self.http_settings)
+        return self.session
+
+    def get_pool_stats(self) -> PoolStats:
+        """
+        Return the counters of new and reused connections of the client session.
+
+        :return: The PoolStats of the client session
+        """
+        return self.pool_stats
+
+    async def close(self) -> None:
+        """
+        Close the shared session and its connections if it was opened.
+
+        :return: None
+        """
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+    async def get_characters(self, revalidate: bool = False) -> list:
+        """
+        Get all existing character information.
+
+        :param revalidate: True to ask the server even if the disk cache has a fresh response, to find new characters
+        :return: A list of Character information
+        """
+        return await self.__request('/chara.json',
+                                    lambda characters_json: parse_characters(characters_json, self.cdn_url),
+                                    is_catalog=True, revalidate=revalidate)
+
+    async def get_character(self, chara_id: int) -> Character:
+        """
+        Retrieve detailed information of one character based on if its given id
+
+        :param chara_id: the identifier of the character
+        :return: An object of Character type with the detailed information
+        """
+        return await self.__request('/chara/{0}.json'.format(chara_id),
+                                    lambda character_json: parse_character(character_json, self.cdn_url))
+
+    async def get_dress(self, dress_id: int) -> Dress:
+        """
+        Retrieve detailed information of one dress based on if its given id
+
+        :param dress_id: the identifier of the dress
+        :return: An object of Dress type with the detailed information
+        """
+        return await self.__request('/dress/{0}.json'.format(dress_id), parse_dress)
+
+    async def get_dresses(self, revalidate: bool = False) -> list:
+        """
+        Get all existing dresses information.
+
+        :param revalidate: True to ask the server even if the disk cache has a fresh response, to find new dresses
+        :return: A list with the found dresses, with the diff against the previous time they were parsed
+        """
+        return await self.__request('/dress.json', lambda dresses_json: parse_dresses_incrementally(
+            dresses_json, self.incremental_parser), is_catalog=True, revalidate=revalidate)
+
+    async def get_equips(self, revalidate: bool = False) -> list:
+        """
+        Get all existing equips information.
+
+        :param revalidate: True to ask the server even if the disk cache has a fresh response, to find new equips
+        :return: A list with the found equips, with the diff against the previous time they were parsed
+        """
+        return await self.__request('/equip.json', lambda equips_json: parse_equips_incrementally(
+            equips_json, self.incremental_parser), is_catalog=True, revalidate=revalidate)
+
+    async def get_enemy(self, enemy_id: int) -> Enemy:
+        """
+        Retrieve detailed information of one enemy based on if its given id
+
+        :param enemy_id: the identifier of the dress
+        :return: An object of Enemy type with the detailed information
+        """
+        return await self.__request('/enemy/{0}_0.json'.format(enemy_id), parse_enemy)
+
+    async def get_events(self, revalidate: bool = False) -> list:
+        """
+        Get all existing events information.
+
+        :param revalidate: True to ask the server even if the disk cache has a fresh response, to find new events
+        :return: A list of Event with its id and name, with the diff against the previous time they were parsed
+        """
+        return await self.__request('/event.json', lambda events_json: parse_events_incrementally(
+            events_json, self.incremental_parser), is_catalog=True, revalidate=revalidate)
+
+    async def get_current_events(self) -> dict:
+        """
+        Retrieve basic information of current events.
+
+        :return: A dictionary with different type of active events, challenges or boss battles
+        """
+        return await self.__request('/event/ww/current.json',
+                                    lambda events_json: parse_current_events(events_json, self.cdn_url))
+
+    async def __request(self, path: str, parser, is_catalog: bool = False, revalidate: bool = False):
+        """
+        Request a resource of the Karthuria API and parse it.
+        Fresh responses of the disk cache are used without asking the server, unless they must be revalidated,
+        otherwise the request is sent with the validators of the last response and, if the server answers that it
+        wasn't modified, the saved response is used. For catalogs the information parsed the last time is reused
+        instead of parsing the json again.
+        Disk operations are executed outside of the event loop.
+
+        :param path: Path of the resource to request
+        :param parser: Function that transforms the json of the resource into its models
+        :param is_catalog: True if the parsed information can be shared between calls
+        :param revalidate: True to send the request even if the disk cache has a fresh response
+        :return: The parsed resource
+        :raise aiohttp.ClientResponseError: If the response was not successful
+        """
+        loop = asyncio.get_event_loop()
+        validator_cache = self.validator_cache if is_catalog else None
+
+        entry = await loop.run_in_executor(None, self.disk_cache.get, path) if self.disk_cache is not None else None
+        if entry is not None and not revalidate and self.disk_cache.is_fresh(path, entry):
+            return parse_cached_response(path, entry, parser, validator_cache)
+
+        catalog = self.validator_cache.get_value(path) if is_catalog else None
+        headers = self.validator_cache.get_headers(path) if catalog is not None else get_entry_headers(entry)
+        session = self.get_session()
+        async with session.get(self.endpoint + path, headers=headers) as response:
+            if response.status == HTTPStatus.NOT_MODIFIED:
+                if entry is not None:
+                    await loop.run_in_executor(None, self.disk_cache.touch, path)
+                if catalog is not None:
+                    return catalog
+                return parse_cached_response(path, entry, parser, validator_cache)
+            response.raise_for_status()
+            body = await response.read()
+            response_headers = response.headers
+
+        if self.disk_cache is not None:
+            await loop.run_in_executor(None, self.disk_cache.put, path, body, response_headers)
+        value = parser(json.loads(body))
+        if is_catalog:
+            self.validator_cache.store(path, response_headers, value)
+        return value
@@ -0,0 +1,204 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from fnmatch import fnmatch
+
+from utils.file_utils import write_file_atomically, remove_file
+
+LOG_ID = "DiskCache"
+
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+ENTRY_EXTENSION = '.cache'
+
+
+class DiskCacheEntry:
+    """
+    Model class of a response saved in the disk cache, with its body and the validators sent by the server
+    """
+
+    def __init__(self, body: bytes, stored_at: float, etag: str = None, last_modified: str = None):
+        self.body = body
+        self.stored_at = stored_at
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def get_headers(self) -> dict:
+        """
+        Build the headers of a conditional request to revalidate this entry.
+
+        :return: A dictionary with the If-None-Match and If-Modified-Since headers of the known validators
+        """
+        headers = {}
+        if self.etag is not None:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified is not None:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class DiskCache:
+    """
+    Persistent cache of Karthuria API responses.
+    Each path is kept during the TTL configured for it and, when all the saved responses exceed the max number
+    of bytes, the least recently used ones are removed. Files are replaced atomically so a crash while writing
+    never leaves a broken entry.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES, ttl: dict = None):
+        """
+        Initialize the DiskCache
+
+        :param directory: Folder where the responses are saved
+        :param max_bytes: Max number of bytes of all the saved responses together
+        :param ttl: Dictionary of path patterns, like '/dress/*', and the seconds that their responses are fresh.
+            Paths that don't match any pattern are never saved.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl = ttl or {}
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+        self.__load_entries()
+
+    def get_ttl(self, path: str) -> int:
+        """
+        Return the seconds that the response of a path is fresh, based on the first pattern that matches it.
+
+        :param path: Path of the resource
+        :return: The seconds of the TTL, 0 if the path is not cached
+        """
+        for pattern, seconds in self.ttl.items():
+            if fnmatch(path, pattern):
+                return seconds
+        return 0
+
+    def get(self, path: str) -> DiskCacheEntry:
+        """
+        Return the saved response of a path even if it is not fresh anymore, so it can be revalidated.
+
+        :param path: Path of the resource
+        :return: The saved entry, None if the path was never saved or it couldn't be read
+        """
+        file_name = get_file_name(path)
+        with self.lock:
+            if file_name not in self.entries:
+                return None
+            self.entries.move_to_end(file_name)
+
+        try:
+            file_path = os.path.join(self.directory, file_name)
+            stored_at = os.path.getmtime(file_path)
+            with open(file_path, 'rb') as file:
+                metadata = json.loads(file.readline())
+                body = file.read()
+            return DiskCacheEntry(body, stored_at, metadata.get('etag'), metadata.get('last_modified'))
+        except (OSError, ValueError) as error:
+            logging.error("[{0}] - Couldn't read cached response of [{1}]: {2}".format(LOG_ID, path, error))
+            self.__remove(file_name)
+            return None
+
+    def is_fresh(self, path: str, entry: DiskCacheEntry) -> bool:
+        """
+        Validates if a saved response can be used without asking the server.
+
+        :param path: Path of the resource
+        :param entry: The saved response of the path
+        :return: True if the entry is younger than the TTL of the path
+        """
+        return time.time() - entry.stored_at < self.get_ttl(path)
+
+    def put(self, path: str, body: bytes, headers) -> None:
+        """
+        Save the response of a path, replacing the previous one, and evict the least recently used responses
+        if the max number of bytes was exceeded.
+
+        :param path: Path of the resource
+        :param body: Raw body of the response
+        :param headers: Headers of the response, to keep its validators
+        :return: None
+        """
+        if self.get_ttl(path) <= 0:
+            return
+
+        file_name = get_file_name(path)
+        metadata = {'path': path, 'etag': headers.get('ETag'), 'last_modified': headers.get('Last-Modified')}
+        content = json.dumps(metadata).encode('utf-8') + b'\n' + body
+        try:
+            write_file_atomically(os.path.join(self.directory, file_name), content)
+        except OSError as error:
+            logging.error("[{0}] - Couldn't save response of [{1}]: {2}".format(LOG_ID, path, error))
+            return
+
+        with self.lock:
+            self.total_bytes += len(content) - self.entries.pop(file_name, 0)
+            self.entries[file_name] = len(content)
+            evicted = []
+            while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+                evicted_name, evicted_size = self.entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+                evicted.append(evicted_name)
+
+        for evicted_name in evicted:
+            remove_file(os.path.join(self.directory, evicted_name))
+        if len(evicted) > 0:
+            logging.debug('[{0}] - Evicted {1} cached responses'.format(LOG_ID, len(evicted)))
+
+    def touch(self, path: str) -> None:
+        """
+        Mark the saved response of a path as fresh again, used when the server confirmed it was not modified.
+
+        :param path: Path of the resource
+        :return: None
+        """
+        try:
+            os.utime(os.path.join(self.directory, get_file_name(path)))
+        except OSError as error:
+            logging.error("[{0}] - Couldn't refresh cached response of [{1}]: {2}".format(LOG_ID, path, error))
+
+    def __remove(self, file_name: str) -> None:
+        """
+        Remove a saved response from the index and the disk.
+
+        :param file_name: Name of the file of the response
+        :return: None
+        """
+        with self.lock:
+            self.total_bytes -= self.entries.pop(file_name, 0)
+        remove_file(os.path.join(self.directory, file_name))
+
+    def __load_entries(self) -> None:
+        """
+        Build the index of saved responses from the cache folder, the oldest ones are the first to be evicted.
+        Temporary files of interrupted writes are removed.
+
+        :return: None
+        """
+        files = []
+        for file_name in os.listdir(self.directory):
+            file_path = os.path.join(self.directory, file_name)
+            if file_name.endswith(ENTRY_EXTENSION):
+                files.append((os.path.getmtime(file_path), file_name, os.path.getsize(file_path)))
+            elif file_name.endswith('.tmp'):
+                remove_file(file_path)
+
+        for _, file_name, size in sorted(files):
+            self.entries[file_name] = size
+            self.total_bytes += size
+        logging.debug('[{0}] - Loaded {1} cached responses'.format(LOG_ID, len(self.entries)))
+
+
+def get_file_name(path: str) -> str:
+    """
+    Build the name of the file where the response of a path is saved.
+
+    :param path: Path of the resource
+    :return: A file name that is safe to use in any file system
+    """
+    return hashlib.sha1(path.encode('utf-8')).hexdigest() + ENTRY_EXTENSION
+
@@ -0,0 +1,94 @@
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL = 24 * 60 * 60
+DEFAULT_NEGATIVE_TTL = 10 * 60
+
+MISSING = object()
+
+
+class MemoryCache:
+    """
+    Bounded in memory cache where each value expires after a TTL and, when the max number of entries is reached,
+    the least recently used one is discarded. It can also remember that a key doesn't exist (negative cache)
+    for a shorter time, to avoid asking again for something that was not found.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL,
+                 negative_ttl: float = DEFAULT_NEGATIVE_TTL):
+        """
+        Initialize the MemoryCache
+
+        :param max_entries: Max number of keys that are kept at the same time
+        :param ttl: Seconds that a value is kept
+        :param negative_ttl: Seconds that a not found key is kept
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Return the value saved for a key if it didn't expire yet.
+
+        :param key: The key to search
+        :return: The saved value, None if the key was saved as not found or MISSING if there is nothing saved
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                self.entries.pop(key, None)
+                self.misses += 1
+                return MISSING
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value) -> None:
+        """
+        Save a value for a key during the cache TTL.
+
+        :param key: The key of the value
+        :param value: The value to save
+        :return: None
+        """
+        self.__save(key, value, self.ttl)
+
+    def put_not_found(self, key) -> None:
+        """
+        Save that a key doesn't exist during the negative TTL.
+
+        :param key: The key that was not found
+        :return: None
+        """
+        self.__save(key, None, self.negative_ttl)
+
+    def stats(self) -> dict:
+        """
+        Return the counters of the cache
+
+        :return: A dictionary with the number of entries, hits and misses
+        """
+        return {'entries': len(self.entries), 'hits': self.hits, 'misses': self.misses}
+
+    def __save(self, key, value, ttl: float) -> None:
+        """
+        Save a value that expires after the given seconds, discarding the least recently used entries
+        if the cache is full.
+
+        :param key: The key of the value
+        :param value: The value to save
+        :param ttl: Seconds that the value is kept
+        :return: None
+        """
+        with self.lock:
+            self.entries.pop(key, None)
+            self.entries[key] = (value, time.monotonic() + ttl)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
@@ -0,0 +1,81 @@
+import logging
+import os
+import pickle
+
+from utils.file_utils import write_file_atomically, is_file
+
+LOG_ID = "CatalogSnapshot"
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_EXTENSION = '.snapshot'
+
+
+class CatalogSnapshot:
+    """
+    Persistent copy of the catalogs already parsed and indexed by the repositories, so after a restart they can be
+    used right away instead of downloading and parsing them again.
+    Snapshots are saved with pickle, they must only be loaded from a folder that only the bot can write. A snapshot
+    of another version or that can't be read is ignored.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Initialize the CatalogSnapshot
+
+        :param directory: Folder where the snapshots are saved
+        """
+        self.directory = directory
+        os.makedirs(self.directory, exist_ok=True)
+
+    def save(self, name: str, source, attributes: list) -> None:
+        """
+        Save the given attributes of an object, like a repository, in the snapshot with the given name.
+        Objects shared by several attributes, like the ones of a list and its indexes, are saved only one time.
+
+        :param name: Name of the snapshot
+        :param source: The object whose attributes are saved
+        :param attributes: Names of the attributes to save
+        :return: None
+        """
+        state = {attribute: getattr(source, attribute) for attribute in attributes}
+        try:
+            content = pickle.dumps((SNAPSHOT_VERSION, state), protocol=pickle.HIGHEST_PROTOCOL)
+            write_file_atomically(self.get_path(name), content)
+            logging.debug('[{0}] - Snapshot [{1}] saved, {2} bytes'.format(LOG_ID, name, len(content)))
+        except (OSError, pickle.PicklingError) as error:
+            logging.error("[{0}] - Couldn't save snapshot [{1}]: {2}".format(LOG_ID, name, error))
+
+    def restore(self, name: str, target, attributes: list) -> bool:
+        """
+        Set in an object, like a repository, the attributes saved in the snapshot with the given name.
+
+        :param name: Name of the snapshot
+        :param target: The object whose attributes are set
+        :param attributes: Names of the attributes to set, all of them must be in the snapshot
+        :return: True if the attributes were restored, False if there is no valid snapshot
+        """
+        path = self.get_path(name)
+        if not is_file(path):
+            return False
+        try:
+            with open(path, 'rb') as file:
+                version, state = pickle.load(file)
+        except Exception as error:
+            logging.error("[{0}] - Couldn't load snapshot [{1}]: {2}".format(LOG_ID, name, error))
+            return False
+        if version != SNAPSHOT_VERSION or any(attribute not in state for attribute in attributes):
+            logging.warning('[{0}] - Snapshot [{1}] is outdated, ignoring it'.format(LOG_ID, name))
+            return False
+        for attribute in attributes:
+            setattr(target, attribute, state[attribute])
+        logging.info('[{0}] - Snapshot [{1}] restored'.format(LOG_ID, name))
+        return True
+
+    def get_path(self, name: str) -> str:
+        """
+        Return the file of the snapshot with the given name.
+
+        :param name: Name of the snapshot
+        :return: Path of the snapshot file
+        """
+        return os.path.join(self.directory, name + SNAPSHOT_EXTENSION)
@@ -0,0 +1,68 @@
+import threading
+
+
+class CachedResponse:
+    """
+    Model class of an already parsed response with the validators that were sent by the server with it
+    """
+
+    def __init__(self, value, etag: str = None, last_modified: str = None):
+        self.value = value
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+class ValidatorCache:
+    """
+    Remembers the ETag and Last-Modified validators of the responses of each path together with the information
+    that was parsed from them, so the next request can be conditional and, if the server answers that the resource
+    was not modified, the already parsed information can be reused.
+    """
+
+    def __init__(self):
+        self.responses = {}
+        self.lock = threading.Lock()
+
+    def get_headers(self, path: str) -> dict:
+        """
+        Build the conditional headers of a request based on the validators that were stored for a path.
+
+        :param path: Path of the resource that is going to be requested
+        :return: A dictionary with the If-None-Match and If-Modified-Since headers, empty if nothing was stored
+        """
+        headers = {}
+        cached_response = self.responses.get(path)
+        if cached_response is not None:
+            if cached_response.etag is not None:
+                headers['If-None-Match'] = cached_response.etag
+            if cached_response.last_modified is not None:
+                headers['If-Modified-Since'] = cached_response.last_modified
+        return headers
+
+    def get_value(self, path: str):
+        """
+        Return the information that was parsed the last time that a path was successfully requested.
+
+        :param path: Path of the resource
+        :return: The stored information, None if nothing was stored
+        """
+        cached_response = self.responses.get(path)
+        return cached_response.value if cached_response is not None else None
+
+    def store(self, path: str, headers, value) -> None:
+        """
+        Save the parsed information of a response if the server sent validators with it.
+        Responses without ETag or Last-Modified can't be revalidated so they are not stored.
+
+        :param path: Path of the resource that was requested
+        :param headers: Headers of the response
+        :param value: Information that was parsed from the response
+        :return: None
+        """
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        with self.lock:
+            if etag is None and last_modified is None:
+                self.responses.pop(path, None)
+            else:
+                self.responses[path] = CachedResponse(value, etag, last_modified)
@@ -0,0 +1,154 @@
+import hashlib
+import json
+import threading
+import uuid
+
+
+class CatalogDiff:
+    """
+    Model class of the changes of a catalog since the previous time it was parsed, with the models that were added,
+    the pairs of old and new models that changed, the models that were removed and the version of the previous
+    catalog
+    """
+
+    def __init__(self, name: str, added: list, changed: list, removed: list, previous_version: str = None):
+        self.name = name
+        self.added = added
+        self.changed = changed
+        self.removed = removed
+        self.previous_version = previous_version
+
+    def is_initial(self) -> bool:
+        """
+        Validates if there was no previous catalog to compare, so all the models are added.
+
+        :return: True if it is the first time that the catalog was parsed, False otherwise
+        """
+        return self.previous_version is None
+
+    def is_empty(self) -> bool:
+        """
+        Validates if the catalog didn't change.
+
+        :return: True if nothing was added, changed or removed, False otherwise
+        """
+        return len(self.added) == 0 and len(self.changed) == 0 and len(self.removed) == 0
+
+    def get_outgoing(self) -> list:
+        """
+        Return the models that are no longer in the catalog, the removed ones and the old version of the changed ones.
+
+        :return: A list with the outgoing models
+        """
+        return self.removed + [old for old, _ in self.changed]
+
+    def get_incoming(self) -> list:
+        """
+        Return the models that are new in the catalog, the added ones and the new version of the changed ones.
+
+        :return: A list with the incoming models
+        """
+        return self.added + [new for _, new in self.changed]
+
+    def __str__(self):
+        return '{0}: {1} added, {2} changed, {3} removed'.format(self.name, len(self.added), len(self.changed),
+                                                                len(self.removed))
+
+
+class Catalog(list):
+    """
+    List with the models of a catalog, a unique version of this parse and the diff against the previous one
+    """
+
+    def __init__(self, items: list, diff: CatalogDiff):
+        super().__init__(items)
+        self.diff = diff
+        self.version = uuid.uuid4().hex
+
+
+class IncrementalParser:
+    """
+    Parses catalogs of the Karthuria API keeping the raw information of each entry by its key, so the next time
+    the same catalog is parsed only the entries whose raw information changed are converted again and the others
+    reuse the model of the previous time. Each parse also returns the diff against the previous one.
+    It can be shared by several clients, the diff is always against the last catalog parsed by any of them.
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.versions = {}
+        self.lock = threading.Lock()
+
+    def parse(self, name: str, catalog_json: dict, convert, get_raw=None) -> Catalog:
+        """
+        Transform a catalog into its models, converting only the new entries and the ones that changed.
+
+        :param name: Name of the catalog
+        :param catalog_json: The catalog with the information of each entry by its key
+        :param convert: Function that receives the key and raw information of an entry and returns its model
+        :param get_raw: Function that returns the raw information of an entry, by default its 'basicInfo'
+        :return: The Catalog with the models in the same order than the json and its diff
+        """
+        get_raw = get_raw if get_raw is not None else get_basic_info
+        with self.lock:
+            previous_entries = self.entries.get(name, {})
+            entries = {}
+            items = []
+            added = []
+            changed = []
+            for key in catalog_json:
+                raw = get_raw(catalog_json[key])
+                content_hash = get_content_hash(raw)
+                previous_entry = previous_entries.get(key)
+                if previous_entry is not None and previous_entry[0] == content_hash:
+                    model = previous_entry[1]
+                else:
+                    model = convert(key, raw)
+                    if previous_entry is None:
+                        added.append(model)
+                    else:
+                        changed.append((previous_entry[1], model))
+                entries[key] = (content_hash, model)
+                items.append(model)
+            removed = [entry[1] for key, entry in previous_entries.items() if key not in entries]
+
+            previous_version = self.versions.get(name) if len(previous_entries) > 0 else None
+            catalog = Catalog(items, CatalogDiff(name, added, changed, removed, previous_version))
+            self.entries[name] = entries
+            self.versions[name] = catalog.version
+            return catalog
+
+
+def get_basic_info(entry_json: dict) -> dict:
+    """
+    Return the raw information of an entry of the dress or equip catalogs.
+
+    :param entry_json: The information of one entry of the catalog
+    :return: Its 'basicInfo'
+    """
+    return entry_json['basicInfo']
+
+
+def get_content_hash(raw) -> str:
+    """
+    Calculate a hash of the raw information of an entry that only changes when its content changes.
+
+    :param raw: The raw information, it must be serializable to json
+    :return: The hexadecimal sha1 of the information
+    """
+    return hashlib.sha1(json.dumps(raw, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def get_incremental_diff(current: list, catalog: list) -> CatalogDiff:
+    """
+    Return the diff of a new catalog only if it was computed against the current one, so it can be applied to the
+    indexes of the current one instead of building them again.
+
+    :param current: The catalog that is being used
+    :param catalog: The new catalog
+    :return: The diff of the new catalog, None if it has no diff or it is against another catalog
+    """
+    diff = getattr(catalog, 'diff', None)
+    if diff is None or diff.is_initial() or diff.previous_version != getattr(current, 'version', None):
+        return None
+    return diff
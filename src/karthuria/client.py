@@ -1,8 +1,14 @@
-import requests
+import json
 
+from requests import codes
+
+from karthuria.cache.disk_cache import DiskCache, DiskCacheEntry
+from karthuria.cache.validator_cache import ValidatorCache
+from karthuria.catalog_diff import IncrementalParser
 from karthuria.model.character import Character, Dress, Enemy, Equip
 from karthuria.model.event import Event, Challenge, Boss
 from karthuria.model.school import School
+from karthuria.session import PoolStats, build_session
 
 
 class KarthuriaClient:
@@ -11,35 +17,45 @@ class KarthuriaClient:
     More information can be found in their web site: https://karth.top/home
     """
 
-    def __init__(self, endpoint: str, cdn_url: str):
+    def __init__(self, endpoint: str, cdn_url: str, http_settings: dict = None,
+                 validator_cache: ValidatorCache = None, disk_cache: DiskCache = None,
+                 incremental_parser: IncrementalParser = None):
         """
         Initialize the KarthuriaClient
 
         :param endpoint: Base url to retrieve information from the Karthuria API
         :param cdn_url: Base url to retrieve assets from the Karthuria CDN
+        :param http_settings: Configuration of the connection pool, like 'pool_size' and 'pool_per_host'
+        :param validator_cache: Cache of the catalogs validators, it can be shared with other clients
+        :param disk_cache: Persistent cache of the responses, if it is not set responses are not saved in disk
+        :param incremental_parser: Parser of the dresses, equips and events catalogs that only converts the entries
+            that changed, it can be shared with other clients
         """
         self.endpoint = endpoint
         self.cdn_url = cdn_url
+        self.validator_cache = validator_cache if validator_cache is not None else ValidatorCache()
+        self.disk_cache = disk_cache
+        self.incremental_parser = incremental_parser if incremental_parser is not None else IncrementalParser()
+        self.pool_stats = PoolStats()
+        self.session = build_session(self.pool_stats, **(http_settings or {}))
 
-    def get_characters(self) -> list:
+    def get_pool_stats(self) -> PoolStats:
         """
-        Get all existing character information.
+        Return the counters of new and reused connections of the client session.
 
-        :return: A list of Character information
+        :return: The PoolStats of the client session
         """
-        path = '/chara.json'
-        list_of_characters = []
+        return self.pool_stats
 
-        response = requests.get(self.endpoint + path)
-        schools = set(item.value for item in School)
-        if response.ok:
-            characters_json = response.json()
-            for character in characters_json:
-                basic_info = characters_json[character]['basicInfo']
-                if basic_info['birth_day'] != 0 and basic_info['school_id'] in schools:
-                    list_of_characters.append(convert_to_character(basic_info, self.cdn_url))
+    def get_characters(self, revalidate: bool = False) -> list:
+        """
+        Get all existing character information.
 
-        return list_of_characters if response.ok else response.raise_for_status()
+        :param revalidate: True to ask the server even if the disk cache has a fresh response, to find new characters
+        :return: A list of Character information
+        """
+        return self.__request('/chara.json', lambda characters_json: parse_characters(characters_json, self.cdn_url),
+                              is_catalog=True, revalidate=revalidate)
 
     def get_character(self, chara_id: int) -> Character:
         """
@@ -48,15 +64,8 @@ class KarthuriaClient:
         :param chara_id: the identifier of the character
         :return: An object of Character type with the detailed information
         """
-        path = '/chara/{0}.json'.format(chara_id)
-        response = requests.get(self.endpoint + path)
-
-        if response.ok:
-            character_json = response.json()
-            basic_info = character_json['basicInfo']
-            info = character_json['info']
-
-        return convert_to_character(basic_info, self.cdn_url, info) if response.ok else response.raise_for_status()
+        return self.__request('/chara/{0}.json'.format(chara_id),
+                              lambda character_json: parse_character(character_json, self.cdn_url))
 
     def get_dress(self, dress_id: int) -> Dress:
         """
@@ -65,50 +74,29 @@ class KarthuriaClient:
         :param dress_id: the identifier of the dress
         :return: An object of Dress type with the detailed information
         """
-        path = '/dress/{0}.json'.format(dress_id)
-        response = requests.get(self.endpoint + path)
+        return self.__request('/dress/{0}.json'.format(dress_id), parse_dress)
 
-        if response.ok:
-            dress_json = response.json()
-            basic_info = dress_json['basicInfo']
-
-        return convert_to_dress(basic_info) if response.ok else response.raise_for_status()
-
-    def get_dresses(self) -> list:
+    def get_dresses(self, revalidate: bool = False) -> list:
         """
         Get all existing dresses information.
 
-        :return: A list with the found dresses
+        :param revalidate: True to ask the server even if the disk cache has a fresh response, to find new dresses
+        :return: A list with the found dresses, with the diff against the previous time they were parsed
         """
-        path = '/dress.json'
-        list_of_dresses = []
-        response = requests.get(self.endpoint + path)
-
-        if response.ok:
-            dresses_json = response.json()
-            for dress in dresses_json:
-                basic_info = dresses_json[dress]['basicInfo']
-                list_of_dresses.append(convert_to_dress(basic_info))
+        return self.__request('/dress.json',
+                              lambda dresses_json: parse_dresses_incrementally(dresses_json, self.incremental_parser),
+                              is_catalog=True, revalidate=revalidate)
 
-        return list_of_dresses if response.ok else response.raise_for_status()
-
-    def get_equips(self) -> Equip:
+    def get_equips(self, revalidate: bool = False) -> list:
         """
         Get all existing equips information.
 
-        :return: A list with the found equips.
+        :param revalidate: True to ask the server even if the disk cache has a fresh response, to find new equips
+        :return: A list with the found equips, with the diff against the previous time they were parsed
         """
-        path = '/equip.json'
-        list_of_equips = []
-        response = requests.get(self.endpoint + path)
-
-        if response.ok:
-            equips_json = response.json()
-            for equip in equips_json:
-                basic_info = equips_json[equip]['basicInfo']
-                list_of_equips.append(convert_to_equip(basic_info))
-
-        return list_of_equips if response.ok else response.raise_for_status()
+        return self.__request('/equip.json',
+                              lambda equips_json: parse_equips_incrementally(equips_json, self.incremental_parser),
+                              is_catalog=True, revalidate=revalidate)
 
     def get_enemy(self, enemy_id: int) -> Enemy:
         """
@@ -117,33 +105,18 @@ class KarthuriaClient:
         :param enemy_id: the identifier of the dress
         :return: An object of Enemy type with the detailed information
         """
-        path = '/enemy/{0}_0.json'.format(enemy_id)
-        response = requests.get(self.endpoint + path)
+        return self.__request('/enemy/{0}_0.json'.format(enemy_id), parse_enemy)
 
-        if response.ok:
-            enemy_json = response.json()
-            basic_info = enemy_json['basicInfo']
-
-        return convert_to_enemy(basic_info) if response.ok else response.raise_for_status()
-
-    def get_events(self) -> list:
+    def get_events(self, revalidate: bool = False) -> list:
         """
         Get all existing events information.
 
-        :return: A list of Event with its id and name
+        :param revalidate: True to ask the server even if the disk cache has a fresh response, to find new events
+        :return: A list of Event with its id and name, with the diff against the previous time they were parsed
         """
-        path = '/event.json'
-        response = requests.get(self.endpoint + path)
-        events = []
-
-        if response.ok:
-            events_json = response.json()
-            for event in events_json:
-                name = events_json[event]['name']['en'] \
-                    if events_json[event]['name']['en'] is not None else events_json[event]['name']['ja']
-                events.append(Event(event, name=name))
-
-        return events if response.ok else response.raise_for_status()
+        return self.__request('/event.json',
+                              lambda events_json: parse_events_incrementally(events_json, self.incremental_parser),
+                              is_catalog=True, revalidate=revalidate)
 
     def get_current_events(self) -> dict:
         """
@@ -151,28 +124,231 @@ class KarthuriaClient:
 
         :return: A dictionary with different type of active events, challenges or boss battles
         """
-        path = '/event/ww/current.json'
-        response = requests.get(self.endpoint + path)
-        current_events = {}
-
-        if response.ok:
-            events_json = response.json()
-            if 'event' in events_json:
-                event_info = events_json['event']
-                events = [convert_to_event(event_info[event], self.cdn_url) for event in event_info if
-                          event_info[event]['info'] != 0]
-                current_events['events'] = events
-            if 'rogue' in events_json:
-                rogue_info = events_json['rogue']
-                challenges = [convert_to_challenge(rogue_info[challenge], self.cdn_url) for challenge in rogue_info]
-                current_events['challenges'] = challenges
-            if 'titan' in events_json:
-                titan_info = events_json['titan']
-                boss_end_at = titan_info['endAt']
-                bosses = [convert_to_boss(titan_info['enemy'][boss], boss_end_at, self.cdn_url) for boss in titan_info['enemy']]
-                current_events['bosses'] = bosses
-
-        return current_events if response.ok else response.raise_for_status()
+        return self.__request('/event/ww/current.json',
+                              lambda events_json: parse_current_events(events_json, self.cdn_url))
+
+    def __request(self, path: str, parser, is_catalog: bool = False, revalidate: bool = False):
+        """
+        Request a resource of the Karthuria API and parse it.
+        Fresh responses of the disk cache are used without asking the server, unless they must be revalidated,
+        otherwise the request is sent with the validators of the last response and, if the server answers that it
+        wasn't modified, the saved response is used. For catalogs the information parsed the last time is reused
+        instead of parsing the json again.
+
+        :param path: Path of the resource to request
+        :param parser: Function that transforms the json of the resource into its models
+        :param is_catalog: True if the parsed information can be shared between calls
+        :param revalidate: True to send the request even if the disk cache has a fresh response
+        :return: The parsed resource
+        """
+        entry = self.disk_cache.get(path) if self.disk_cache is not None else None
+        if entry is not None and not revalidate and self.disk_cache.is_fresh(path, entry):
+            return parse_cached_response(path, entry, parser, self.validator_cache if is_catalog else None)
+
+        catalog = self.validator_cache.get_value(path) if is_catalog else None
+        headers = self.validator_cache.get_headers(path) if catalog is not None else get_entry_headers(entry)
+        response = self.session.get(self.endpoint + path, headers=headers)
+        if response.status_code == codes.not_modified:
+            if entry is not None:
+                self.disk_cache.touch(path)
+            if catalog is not None:
+                return catalog
+            return parse_cached_response(path, entry, parser, self.validator_cache if is_catalog else None)
+        if not response.ok:
+            return response.raise_for_status()
+
+        if self.disk_cache is not None:
+            self.disk_cache.put(path, response.content, response.headers)
+        value = parser(response.json())
+        if is_catalog:
+            self.validator_cache.store(path, response.headers, value)
+        return value
+
+
+def is_not_found_error(error: Exception) -> bool:
+    """
+    Validates if an error raised by KarthuriaClient or AsyncKarthuriaClient was caused by a resource
+    that doesn't exist.
+
+    :param error: The error raised by the client
+    :return: True if the server answered with a 404 status
+    """
+    response = getattr(error, 'response', None)
+    status = response.status_code if response is not None else getattr(error, 'status', None)
+    return status == codes.not_found
+
+
+def get_entry_headers(entry: DiskCacheEntry) -> dict:
+    """
+    Build the conditional headers to revalidate a response of the disk cache.
+
+    :param entry: The saved response, it can be None
+    :return: A dictionary with the conditional headers, empty if there is no entry
+    """
+    return entry.get_headers() if entry is not None else {}
+
+
+def parse_cached_response(path: str, entry: DiskCacheEntry, parser, validator_cache: ValidatorCache = None):
+    """
+    Parse a response saved in the disk cache. If a validator cache is given and it has the information parsed
+    from the same response, that information is reused, otherwise the parsed information is saved on it.
+
+    :param path: Path of the resource
+    :param entry: The saved response of the path
+    :param parser: Function that transforms the json of the resource into its models
+    :param validator_cache: Cache of the parsed catalogs, None if the resource is not a catalog
+    :return: The parsed resource
+    """
+    entry_headers = entry.get_headers()
+    if validator_cache is not None and len(entry_headers) > 0 and validator_cache.get_headers(path) == entry_headers:
+        return validator_cache.get_value(path)
+
+    value = parser(json.loads(entry.body))
+    if validator_cache is not None:
+        validator_cache.store(path, {'ETag': entry.etag, 'Last-Modified': entry.last_modified}, value)
+    return value
+
+
+def parse_characters(characters_json: dict, cdn_url: str = '') -> list:
+    """
+    Transform the 'chara.json' response of Karthuria API into a list of Character objects.
+    Characters without birthday or without a known school are discarded.
+
+    :param characters_json: Information retrieved from the 'chara.json' response
+    :param cdn_url: Base url of the Karthuria CDN to build the portraits
+    :return: A list of Character information
+    """
+    list_of_characters = []
+    schools = set(item.value for item in School)
+    for character in characters_json:
+        basic_info = characters_json[character]['basicInfo']
+        if basic_info['birth_day'] != 0 and basic_info['school_id'] in schools:
+            list_of_characters.append(convert_to_character(basic_info, cdn_url))
+    return list_of_characters
+
+
+def parse_character(character_json: dict, cdn_url: str = '') -> Character:
+    """
+    Transform the 'chara/{id}.json' response of Karthuria API into a Character object with its detailed information.
+
+    :param character_json: Information retrieved from the 'chara/{id}.json' response
+    :param cdn_url: Base url of the Karthuria CDN to build the portrait
+    :return: An object of Character type with the detailed information
+    """
+    return convert_to_character(character_json['basicInfo'], cdn_url, character_json['info'])
+
+
+def parse_dress(dress_json: dict) -> Dress:
+    """
+    Transform the 'dress/{id}.json' response of Karthuria API into a Dress object.
+
+    :param dress_json: Information retrieved from the 'dress/{id}.json' response
+    :return: An object of Dress type with the detailed information
+    """
+    return convert_to_dress(dress_json['basicInfo'])
+
+
+def parse_dresses(dresses_json: dict) -> list:
+    """
+    Transform the 'dress.json' response of Karthuria API into a list of Dress objects.
+
+    :param dresses_json: Information retrieved from the 'dress.json' response
+    :return: A list with the found dresses
+    """
+    return [convert_to_dress(dresses_json[dress]['basicInfo']) for dress in dresses_json]
+
+
+def parse_equips(equips_json: dict) -> list:
+    """
+    Transform the 'equip.json' response of Karthuria API into a list of Equip objects.
+
+    :param equips_json: Information retrieved from the 'equip.json' response
+    :return: A list with the found equips
+    """
+    return [convert_to_equip(equips_json[equip]['basicInfo']) for equip in equips_json]
+
+
+def parse_enemy(enemy_json: dict) -> Enemy:
+    """
+    Transform the 'enemy/{id}_0.json' response of Karthuria API into an Enemy object.
+
+    :param enemy_json: Information retrieved from the 'enemy/{id}_0.json' response
+    :return: An object of Enemy type with the detailed information
+    """
+    return convert_to_enemy(enemy_json['basicInfo'])
+
+
+def parse_events(events_json: dict) -> list:
+    """
+    Transform the 'event.json' response of Karthuria API into a list of Event objects with its id and name.
+
+    :param events_json: Information retrieved from the 'event.json' response
+    :return: A list of Event with its id and name
+    """
+    return [convert_to_event_name(event, events_json[event]['name']) for event in events_json]
+
+
+def parse_dresses_incrementally(dresses_json: dict, incremental_parser: IncrementalParser) -> list:
+    """
+    Transform the 'dress.json' response of Karthuria API into a list of Dress objects, converting only the dresses
+    that changed since the previous time it was parsed.
+
+    :param dresses_json: Information retrieved from the 'dress.json' response
+    :param incremental_parser: Parser with the dresses of the previous time
+    :return: A Catalog with the found dresses and its diff
+    """
+    return incremental_parser.parse('dresses', dresses_json, lambda _, basic_info: convert_to_dress(basic_info))
+
+
+def parse_equips_incrementally(equips_json: dict, incremental_parser: IncrementalParser) -> list:
+    """
+    Transform the 'equip.json' response of Karthuria API into a list of Equip objects, converting only the equips
+    that changed since the previous time it was parsed.
+
+    :param equips_json: Information retrieved from the 'equip.json' response
+    :param incremental_parser: Parser with the equips of the previous time
+    :return: A Catalog with the found equips and its diff
+    """
+    return incremental_parser.parse('equips', equips_json, lambda _, basic_info: convert_to_equip(basic_info))
+
+
+def parse_events_incrementally(events_json: dict, incremental_parser: IncrementalParser) -> list:
+    """
+    Transform the 'event.json' response of Karthuria API into a list of Event objects with its id and name,
+    converting only the events whose name changed since the previous time it was parsed.
+
+    :param events_json: Information retrieved from the 'event.json' response
+    :param incremental_parser: Parser with the events of the previous time
+    :return: A Catalog with the found events and its diff
+    """
+    return incremental_parser.parse('events', events_json, convert_to_event_name,
+                                    lambda event_json: event_json['name'])
+
+
+def parse_current_events(events_json: dict, cdn_url: str = '') -> dict:
+    """
+    Transform the 'event/ww/current.json' response of Karthuria API into a dictionary of current events.
+
+    :param events_json: Information retrieved from the 'event/ww/current.json' response
+    :param cdn_url: Base url of the Karthuria CDN to build the banners and icons
+    :return: A dictionary with different type of active events, challenges or boss battles
+    """
+    current_events = {}
+    if 'event' in events_json:
+        event_info = events_json['event']
+        events = [convert_to_event(event_info[event], cdn_url) for event in event_info if
+                  event_info[event]['info'] != 0]
+        current_events['events'] = events
+    if 'rogue' in events_json:
+        rogue_info = events_json['rogue']
+        challenges = [convert_to_challenge(rogue_info[challenge], cdn_url) for challenge in rogue_info]
+        current_events['challenges'] = challenges
+    if 'titan' in events_json:
+        titan_info = events_json['titan']
+        boss_end_at = titan_info['endAt']
+        bosses = [convert_to_boss(titan_info['enemy'][boss], boss_end_at, cdn_url) for boss in titan_info['enemy']]
+        current_events['bosses'] = bosses
+    return current_events
 
 
 def convert_to_character(basic_info: dict, portrait_url: str = '', detailed_info: dict = None) -> Character:
@@ -245,6 +421,19 @@ def convert_to_enemy(basic_info: dict) -> Enemy:
     return enemy
 
 
+def convert_to_event_name(event_id: str, name_info: dict) -> Event:
+    """
+    Transform the id and the dictionary with the 'name' information returned by Karthuria API into an Event object.
+    The english name is used if it exists, otherwise the japanese one.
+
+    :param event_id: Id of the event
+    :param name_info: Information retrieved from the 'name' response
+    :return: A new instance of the Event model with its id and name
+    """
+    name = name_info['en'] if name_info['en'] is not None else name_info['ja']
+    return Event(event_id, name=name)
+
+
 def convert_to_event(event_info: dict, event_url: str = '') -> Event:
     """
     Transform a dictionary with the 'event' information returned by Karthuria API into a Event object
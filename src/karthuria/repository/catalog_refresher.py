@@ -0,0 +1,118 @@
+import asyncio
+import logging
+import time
+
+LOG_ID = "CatalogRefresher"
+
+DEFAULT_INTERVAL = 6 * 60 * 60
+MIN_SLEEP = 1.0
+
+
+class CatalogRefresher:
+    """
+    Refreshes the catalogs of the Karthuria repositories in the background, each one with its own interval, so new
+    cards appear without restarting the bot. Refreshes are executed in another thread to not block the event loop,
+    and while a catalog is being refreshed, or if its refresh fails, the previous one keeps being used.
+    Catalogs in lazy mode that were never used are not refreshed.
+    """
+
+    def __init__(self, repositories: dict, intervals: dict = None, default_interval: float = DEFAULT_INTERVAL):
+        """
+        Initialize the CatalogRefresher
+
+        :param repositories: Dictionary with the name of each catalog and its repository, which must have a
+            refresh method, a refreshed_at time and a loader
+        :param intervals: Dictionary with the name of each catalog and the seconds between its refreshes
+        :param default_interval: Seconds between refreshes of the catalogs without an interval
+        """
+        self.repositories = repositories
+        intervals = intervals or {}
+        self.intervals = {name: intervals.get(name, default_interval) for name in repositories}
+        self.next_refreshes = {name: time.monotonic() + self.intervals[name] for name in repositories}
+        self.failures = {name: 0 for name in repositories}
+        self.task = None
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Start refreshing the catalogs in the given event loop.
+
+        :param loop: The event loop that runs the refreshes
+        :return: None
+        """
+        if self.task is None:
+            self.task = loop.create_task(self.run())
+
+    def stop(self) -> None:
+        """
+        Stop refreshing the catalogs.
+
+        :return: None
+        """
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    async def run(self) -> None:
+        """
+        Refresh each catalog when its interval has passed, forever.
+
+        :return: None
+        """
+        while True:
+            await self.refresh_due()
+            await asyncio.sleep(max(MIN_SLEEP, min(self.next_refreshes.values()) - time.monotonic()))
+
+    async def refresh_due(self) -> None:
+        """
+        Refresh the catalogs whose interval has passed since their last refresh.
+
+        :return: None
+        """
+        for name, next_refresh in list(self.next_refreshes.items()):
+            if next_refresh <= time.monotonic():
+                await self.refresh(name)
+
+    async def refresh(self, name: str) -> bool:
+        """
+        Refresh one catalog in another thread, any error is logged and the previous catalog is kept.
+
+        :param name: Name of the catalog
+        :return: True if the catalog was refreshed, False otherwise
+        """
+        repository = self.repositories[name]
+        self.next_refreshes[name] = time.monotonic() + self.intervals[name]
+        if not repository.loader.loaded:
+            return False
+        try:
+            refreshed = await asyncio.get_event_loop().run_in_executor(None, repository.refresh)
+        except Exception as error:
+            logging.error("[{0}] - Couldn't refresh catalog [{1}]: {2}".format(LOG_ID, name, error))
+            refreshed = False
+        if refreshed:
+            self.failures[name] = 0
+            logging.debug('[{0}] - Catalog [{1}] refreshed'.format(LOG_ID, name))
+        else:
+            self.failures[name] += 1
+            logging.warning('[{0}] - Catalog [{1}] not refreshed, using the one of {2} seconds ago'.format(
+                LOG_ID, name, self.get_refresh_age(name)))
+        return refreshed
+
+    def get_refresh_age(self, name: str) -> float:
+        """
+        Return how old is the catalog with the given name.
+
+        :param name: Name of the catalog
+        :return: Seconds since its last successful refresh, None if it was never refreshed
+        """
+        refreshed_at = self.repositories[name].refreshed_at
+        if refreshed_at is None:
+            return None
+        return round(time.time() - refreshed_at, 1)
+
+    def get_refresh_ages(self) -> dict:
+        """
+        Return how old is each catalog, to know if they are being refreshed as expected.
+
+        :return: A dictionary with the name of each catalog and the seconds since its last successful refresh
+        """
+        return {name: self.get_refresh_age(name) for name in self.repositories}
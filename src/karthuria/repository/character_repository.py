@@ -1,21 +1,42 @@
 import logging
+import threading
+import time
 
+from aiohttp import ClientError
 from requests.exceptions import HTTPError
 
+from karthuria.async_client import AsyncKarthuriaClient
+from karthuria.cache.snapshot import CatalogSnapshot
 from karthuria.client import KarthuriaClient
 from karthuria.model.character import Character
+from utils.lazy_loader import LazyLoader
+from utils.search_index import SearchIndex
 
 LOG_ID = "CharacterRepository"
 
+SNAPSHOT_NAME = 'characters'
+SNAPSHOT_ATTRIBUTES = ['characters', 'characters_by_id', 'characters_by_birthday', 'name_index', 'refreshed_at']
+
 
 class CharacterRepository:
     """
-    Repository with the information of characters
+    Repository with the information of characters.
+    Characters are indexed by id, birthday and name when they are loaded, so those searches don't need to go
+    through the whole list. In lazy mode they are loaded the first time they are needed instead of at the start.
+    With a snapshot the indexed characters of the last run are used right away while they are refreshed.
     """
 
-    def __init__(self, client: KarthuriaClient):
+    def __init__(self, client: KarthuriaClient, async_client: AsyncKarthuriaClient = None, lazy: bool = False,
+                 snapshot: CatalogSnapshot = None):
         self.client = client
-        self.characters = self.__load_characters()
+        self.async_client = async_client
+        self.snapshot = snapshot
+        self.refreshed_at = None
+        self.characters = []
+        self.characters_by_id = {}
+        self.characters_by_birthday = {}
+        self.name_index = SearchIndex([], lambda character: character.name)
+        self.loader = LazyLoader(self.__load, lazy)
 
     def get_characters(self) -> list:
         """
@@ -23,6 +44,7 @@ class CharacterRepository:
 
         :return: A list with characters information
         """
+        self.loader.ensure_loaded()
         return self.characters
 
     def get_character_by_name(self, name: str) -> Character:
@@ -32,30 +54,155 @@ class CharacterRepository:
         :param name: Of the character to search, can be the first name, the last name or the full name
         :return: A character that match with the queried name
         """
-        result = [character for character in self.characters if name.lower() in character.name.lower()]
+        self.loader.ensure_loaded()
+        result = self.name_index.search(name, limit=1)
         if len(result) > 0:
             return result[0]
 
+    def search_characters_by_name(self, name: str, limit: int = None) -> list:
+        """
+        Looks for all the characters whose name contains the given text, the best matches go first.
+
+        :param name: Text to search in the characters names
+        :param limit: Max number of characters to return, all of them if it is not set
+        :return: A list with the characters that match with the queried name
+        """
+        self.loader.ensure_loaded()
+        return self.name_index.search(name, limit)
+
+    def complete_character_name(self, prefix: str, limit: int = None) -> list:
+        """
+        Looks for the characters with a first or last name that starts with the given text, to autocomplete it.
+
+        :param prefix: The beginning of a first or last name
+        :param limit: Max number of characters to return, all of them if it is not set
+        :return: A list with the characters that match with the prefix
+        """
+        self.loader.ensure_loaded()
+        return self.name_index.complete(prefix, limit)
+
+    def get_character_by_id(self, chara_id: int) -> Character:
+        """
+        Search a character basic information by its id
+
+        :param chara_id: The identifier of the character
+        :return: The character with the given id, None if it doesn't exist
+        """
+        self.loader.ensure_loaded()
+        return self.characters_by_id.get(chara_id)
+
     def get_character_birthday(self, date: str) -> Character:
         """
         For a given date looks for a character with that date birthday and return it.
         :param date: A date in format %d/%m if this format is not used then it will never found a character.
         :return: The character that has a birthday in the given date
         """
-        for character in self.characters:
-            if character.birthday == date:
-                return self.client.get_character(character.id)
+        self.loader.ensure_loaded()
+        for character in self.characters_by_birthday.get(get_birthday_key(date), []):
+            return self.client.get_character(character.id)
+
+    async def get_character_birthday_async(self, date: str) -> Character:
+        """
+        Awaitable version of get_character_birthday, it uses the async client so the event loop is not blocked.
+        :param date: A date in format %d/%m if this format is not used then it will never found a character.
+        :return: The character that has a birthday in the given date, None if there is no one or it couldn't
+            be retrieved
+        """
+        await self.loader.ensure_loaded_async()
+        for character in self.characters_by_birthday.get(get_birthday_key(date), []):
+            try:
+                return await self.async_client.get_character(character.id)
+            except ClientError as error:
+                logging.error("[{0}] - Couldn't retrieve character [{1}] {2}".format(LOG_ID, character.id, error))
+                return None
+
+    async def get_characters_birthday_async(self, date: str) -> list:
+        """
+        For a given date looks for all the characters with that date birthday and return their detailed information.
+        :param date: A date in format %d/%m if this format is not used then it will never found a character.
+        :return: A list with the characters that have a birthday in the given date, the ones that couldn't
+            be retrieved are not included
+        """
+        await self.loader.ensure_loaded_async()
+        birthday_characters = []
+        for character in self.characters_by_birthday.get(get_birthday_key(date), []):
+            try:
+                birthday_characters.append(await self.async_client.get_character(character.id))
+            except ClientError as error:
+                logging.error("[{0}] - Couldn't retrieve character [{1}] {2}".format(LOG_ID, character.id, error))
+        return birthday_characters
+
+    def refresh(self, revalidate: bool = True) -> bool:
+        """
+        Revalidate the characters with the Karthuria API and, if they changed, index them and replace the current ones
+        at once. The refresh is saved in the snapshot. If they couldn't be loaded the current ones are kept.
+        It makes blocking requests, so it must not be called from the event loop.
+
+        :param revalidate: False to use the characters of the disk cache if they are still fresh
+        :return: True if the characters were loaded, False otherwise
+        """
+        characters = self.__load_characters(revalidate)
+        if len(characters) == 0 and len(self.characters) > 0:
+            return False
+        if characters is not self.characters:
+            self.__index_characters(characters)
+        self.refreshed_at = time.time()
+        if self.snapshot is not None and len(characters) > 0:
+            self.snapshot.save(SNAPSHOT_NAME, self, SNAPSHOT_ATTRIBUTES)
+        return len(characters) > 0
+
+    def __load(self) -> None:
+        """
+        Restore the characters of the snapshot and refresh them in the background, or load them from the Karthuria API
+        if there is no snapshot.
+
+        :return: None
+        """
+        if self.snapshot is not None and self.snapshot.restore(SNAPSHOT_NAME, self, SNAPSHOT_ATTRIBUTES):
+            threading.Thread(target=self.refresh, daemon=True).start()
+        else:
+            self.refresh(revalidate=False)
 
-    def __load_characters(self) -> list:
+    def __index_characters(self, characters: list) -> None:
+        """
+        Replace the loaded characters and build their indexes by id, birthday and name.
+
+        :param characters: A list with the characters information
+        :return: None
+        """
+        characters_by_birthday = {}
+        for character in characters:
+            characters_by_birthday.setdefault(get_birthday_key(character.birthday), []).append(character)
+        self.characters_by_id = {character.id: character for character in characters}
+        self.characters_by_birthday = characters_by_birthday
+        self.name_index = SearchIndex(characters, lambda character: character.name)
+        self.characters = characters
+
+    def __load_characters(self, revalidate: bool) -> list:
         """
         Calls Karthuria API to load characters basic information
 
+        :param revalidate: True to ask the API even if the disk cache has them fresh
         :return: A list with the characters information if is successful, otherwise an empty list
         """
         characters = []
         try:
-            characters = self.client.get_characters()
+            characters = self.client.get_characters(revalidate=revalidate)
             logging.debug('[{0}] - Characters information loaded successfully'.format(LOG_ID))
         except HTTPError as error:
             logging.error("[{0}] - Couldn't load characters information {1}".format(LOG_ID, error))
         return characters
+
+
+def get_birthday_key(date: str) -> tuple:
+    """
+    Build the key of the birthdays index for a given date.
+
+    :param date: A date in format %d/%m
+    :return: A tuple with the month and day of the date, None if the date doesn't have that format
+    """
+    try:
+        day, month = date.split('/')
+        return int(month), int(day)
+    except ValueError:
+        return None
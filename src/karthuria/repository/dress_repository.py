@@ -1,21 +1,46 @@
 import logging
+import threading
+import time
 
+from aiohttp import ClientError
 from requests import HTTPError
 
-from karthuria.client import KarthuriaClient
+from karthuria.async_client import AsyncKarthuriaClient
+from karthuria.cache.snapshot import CatalogSnapshot
+from karthuria.cache.memory_cache import MemoryCache, MISSING
+from karthuria.catalog_diff import CatalogDiff, get_incremental_diff
+from karthuria.client import KarthuriaClient, is_not_found_error
 from karthuria.model.character import Dress
+from utils.lazy_loader import LazyLoader
 
 LOG_ID = "DressRepository"
 
+SNAPSHOT_NAME = 'dresses'
+SNAPSHOT_ATTRIBUTES = ['dresses', 'dresses_by_id', 'dresses_by_character', 'refreshed_at']
+
 
 class DressRepository:
     """
-    Repository with the information of dresses
+    Repository with the information of dresses.
+    Dresses are searched by id or by character in indexes of the catalog loaded at the start, only the ones
+    that are not part of it are requested to the Karthuria API and added to the catalog.
+    In lazy mode the catalog is loaded the first time it is needed instead of at the start. With a snapshot the
+    indexed dresses of the last run are used right away while they are refreshed.
+    When a refresh only changes some dresses, only those are indexed again and the listeners receive the diff.
     """
 
-    def __init__(self, client: KarthuriaClient):
+    def __init__(self, client: KarthuriaClient, async_client: AsyncKarthuriaClient = None,
+                 cache: MemoryCache = None, lazy: bool = False, snapshot: CatalogSnapshot = None):
         self.client = client
-        self.dresses = self.__load_dresses()
+        self.async_client = async_client
+        self.cache = cache if cache is not None else MemoryCache()
+        self.snapshot = snapshot
+        self.refreshed_at = None
+        self.dresses = []
+        self.dresses_by_id = {}
+        self.dresses_by_character = {}
+        self.listeners = []
+        self.loader = LazyLoader(self.__load, lazy)
 
     def get_dress_by_id(self, dress_id: int) -> Dress:
         """
@@ -25,12 +50,44 @@ class DressRepository:
         :param dress_id: The id to search the dress
         :return: The Dress instance found for the given id
         """
+        self.loader.ensure_loaded()
+        if dress_id in self.dresses_by_id:
+            return self.dresses_by_id[dress_id]
+        dress = self.cache.get(dress_id)
+        if dress is not MISSING:
+            return dress
+
         dress = None
         try:
             dress = self.client.get_dress(dress_id)
+            self.__add_dress(dress)
             logging.debug('[{0}] - Dress wit id [{1}] retrieved successfully'.format(LOG_ID, dress_id))
         except HTTPError as error:
-            logging.error("[{0}] - Couldn't retrieve Dress with id [{1}]: {2}".format(LOG_ID, dress_id, error))
+            self.__cache_error(dress_id, error)
+        return dress
+
+    async def get_dress_by_id_async(self, dress_id: int) -> Dress:
+        """
+        Awaitable version of get_dress_by_id, it uses the async client so the event loop is not blocked.
+        If its not found returns None
+
+        :param dress_id: The id to search the dress
+        :return: The Dress instance found for the given id
+        """
+        await self.loader.ensure_loaded_async()
+        if dress_id in self.dresses_by_id:
+            return self.dresses_by_id[dress_id]
+        dress = self.cache.get(dress_id)
+        if dress is not MISSING:
+            return dress
+
+        dress = None
+        try:
+            dress = await self.async_client.get_dress(dress_id)
+            self.__add_dress(dress)
+            logging.debug('[{0}] - Dress wit id [{1}] retrieved successfully'.format(LOG_ID, dress_id))
+        except ClientError as error:
+            self.__cache_error(dress_id, error)
         return dress
 
     def get_dresses_by_character_id(self, character_id: int) -> list:
@@ -41,20 +98,173 @@ class DressRepository:
         :param character_id: The character id to get its dresses
         :return: The different Dresses instances found for the given id
         """
-        result = [dress for dress in self.dresses if dress.character == character_id]
-        if len(result) > 0:
-            return result
+        self.loader.ensure_loaded()
+        return self.dresses_by_character.get(character_id)
+
+    def add_listener(self, listener) -> None:
+        """
+        Add a function that is called each time a refresh adds, changes or removes dresses, with the CatalogDiff.
+        It is called from the thread that made the refresh.
+
+        :param listener: The function to call
+        :return: None
+        """
+        self.listeners.append(listener)
+
+    def notify_listeners(self, diff: CatalogDiff) -> None:
+        """
+        Call all the listeners with the changes of the dresses, an error in one of them doesn't stop the others.
+
+        :param diff: The added, changed and removed dresses
+        :return: None
+        """
+        for listener in self.listeners:
+            try:
+                listener(diff)
+            except Exception as error:
+                logging.error("[{0}] - Dresses listener failed with [{1}]: {2}".format(LOG_ID, diff, error))
+
+    def refresh(self, revalidate: bool = True) -> bool:
+        """
+        Revalidate the dresses with the Karthuria API and, if they changed, index them and replace the current ones
+        at once. The refresh is saved in the snapshot. If they couldn't be loaded the current ones are kept.
+        It makes blocking requests, so it must not be called from the event loop.
+
+        :param revalidate: False to use the dresses of the disk cache if they are still fresh
+        :return: True if the dresses were loaded, False otherwise
+        """
+        dresses = self.__load_dresses(revalidate)
+        if len(dresses) == 0 and len(self.dresses) > 0:
+            return False
+        diff = None
+        if dresses is not self.dresses:
+            diff = self.__apply_dresses(dresses)
+        self.refreshed_at = time.time()
+        if diff is not None and not diff.is_empty():
+            logging.info('[{0}] - Dresses refreshed, {1}'.format(LOG_ID, diff))
+            self.notify_listeners(diff)
+        if self.snapshot is not None and len(dresses) > 0:
+            self.snapshot.save(SNAPSHOT_NAME, self, SNAPSHOT_ATTRIBUTES)
+        return len(dresses) > 0
+
+    def __load(self) -> None:
+        """
+        Restore the dresses of the snapshot and refresh them in the background, or load them from the Karthuria API
+        if there is no snapshot.
 
-    def __load_dresses(self) -> list:
+        :return: None
+        """
+        if self.snapshot is not None and self.snapshot.restore(SNAPSHOT_NAME, self, SNAPSHOT_ATTRIBUTES):
+            threading.Thread(target=self.refresh, daemon=True).start()
+        else:
+            self.refresh(revalidate=False)
+
+    def __apply_dresses(self, dresses: list) -> CatalogDiff:
+        """
+        Replace the catalog of dresses, if its diff is against the current catalog only the dresses that changed
+        are indexed again, otherwise all the indexes are built again. Indexes are copied before changing them
+        so searches never see them partially updated.
+
+        :param dresses: A list with the dresses information
+        :return: The diff against the current catalog, None if it was built again
+        """
+        diff = get_incremental_diff(self.dresses, dresses)
+        if diff is None:
+            self.__set_dresses(dresses)
+            return None
+        dresses_by_id = dict(self.dresses_by_id)
+        dresses_by_character = dict(self.dresses_by_character)
+        for dress in diff.get_outgoing():
+            unindex_dress(dresses_by_id, dresses_by_character, dress)
+        for dress in diff.get_incoming():
+            previous_dress = dresses_by_id.get(dress.dress_id)
+            if previous_dress is not None:
+                unindex_dress(dresses_by_id, dresses_by_character, previous_dress)
+            dresses_by_id[dress.dress_id] = dress
+            dresses_by_character[dress.character] = dresses_by_character.get(dress.character, []) + [dress]
+        self.dresses_by_id = dresses_by_id
+        self.dresses_by_character = dresses_by_character
+        self.dresses = dresses
+        return diff
+
+    def __set_dresses(self, dresses: list) -> None:
+        """
+        Replace the catalog of dresses and its indexes, the indexes are built before replacing the previous ones
+        so searches never see them partially built.
+
+        :param dresses: A list with the dresses information
+        :return: None
+        """
+        dresses_by_character = {}
+        for dress in dresses:
+            dresses_by_character.setdefault(dress.character, []).append(dress)
+        self.dresses_by_id = {dress.dress_id: dress for dress in dresses}
+        self.dresses_by_character = dresses_by_character
+        self.dresses = dresses
+
+    def __add_dress(self, dress: Dress) -> None:
+        """
+        Merge a dress retrieved by its id into the catalog, so next searches don't need to request it again.
+
+        :param dress: The Dress retrieved from the Karthuria API
+        :return: None
+        """
+        if dress.dress_id not in self.dresses_by_id:
+            self.dresses.append(dress)
+            self.__index_dress(dress)
+
+    def __index_dress(self, dress: Dress) -> None:
+        """
+        Add a dress of the catalog to the indexes by id and by character.
+
+        :param dress: The Dress to index
+        :return: None
+        """
+        self.dresses_by_id[dress.dress_id] = dress
+        self.dresses_by_character.setdefault(dress.character, []).append(dress)
+
+    def __cache_error(self, dress_id: int, error: Exception) -> None:
+        """
+        Log an error retrieving a Dress and, if the dress doesn't exist, remember it to not ask for it again for a while.
+
+        :param dress_id: The id of the dress that couldn't be retrieved
+        :param error: The error raised by the client
+        :return: None
+        """
+        if is_not_found_error(error):
+            self.cache.put_not_found(dress_id)
+        logging.error("[{0}] - Couldn't retrieve Dress with id [{1}]: {2}".format(LOG_ID, dress_id, error))
+
+    def __load_dresses(self, revalidate: bool) -> list:
         """
         Calls Karthuria API to load dresses basic information
 
+        :param revalidate: True to ask the API even if the disk cache has them fresh
         :return: A list with the dresses information if is successful, otherwise an empty list
         """
         dresses = []
         try:
-            dresses = self.client.get_dresses()
+            dresses = self.client.get_dresses(revalidate=revalidate)
             logging.debug('[{0}] - Dresses information loaded successfully'.format(LOG_ID))
         except HTTPError as error:
             logging.error("[{0}] - Couldn't load dresses information {1}".format(LOG_ID, error))
         return dresses
+
+
+def unindex_dress(dresses_by_id: dict, dresses_by_character: dict, dress: Dress) -> None:
+    """
+    Remove a dress from copies of the indexes by id and by character, the list of its character is replaced
+    instead of changed because it is shared with the current index.
+
+    :param dresses_by_id: The index of dresses by id
+    :param dresses_by_character: The index of dresses by character
+    :param dress: The Dress to remove
+    :return: None
+    """
+    if dresses_by_id.get(dress.dress_id) is dress:
+        del dresses_by_id[dress.dress_id]
+    character_dresses = [indexed for indexed in dresses_by_character.get(dress.character, []) if indexed is not dress]
+    if len(character_dresses) > 0:
+        dresses_by_character[dress.character] = character_dresses
+    else:
+        dresses_by_character.pop(dress.character, None)
@@ -1,8 +1,11 @@
 import logging
 
+from aiohttp import ClientError
 from requests import HTTPError
 
-from karthuria.client import KarthuriaClient
+from karthuria.async_client import AsyncKarthuriaClient
+from karthuria.cache.memory_cache import MemoryCache, MISSING
+from karthuria.client import KarthuriaClient, is_not_found_error
 from karthuria.model.character import Enemy
 
 LOG_ID = "EnemyRepository"
@@ -13,8 +16,11 @@ class EnemyRepository:
     Repository with the information of enemies
     """
 
-    def __init__(self, client: KarthuriaClient):
+    def __init__(self, client: KarthuriaClient, async_client: AsyncKarthuriaClient = None,
+                 cache: MemoryCache = None):
         self.client = client
+        self.async_client = async_client
+        self.cache = cache if cache is not None else MemoryCache()
 
     def get_enemy_by_id(self, enemy_id: int) -> Enemy:
         """
@@ -24,10 +30,49 @@ class EnemyRepository:
         :param enemy_id: The id to search the Enemy
         :return: The Enemy instance found for the given id
         """
+        enemy = self.cache.get(enemy_id)
+        if enemy is not MISSING:
+            return enemy
+
         enemy = None
         try:
             enemy = self.client.get_enemy(enemy_id)
+            self.cache.put(enemy_id, enemy)
             logging.debug('[{0}] - Enemy wit id [{1}] retrieved successfully'.format(LOG_ID, enemy_id))
         except HTTPError as error:
-            logging.error("[{0}] - Couldn't retrieve Enemy with id [{1}]: {2}".format(LOG_ID, enemy_id, error))
+            self.__cache_error(enemy_id, error)
         return enemy
+
+    async def get_enemy_by_id_async(self, enemy_id: int) -> Enemy:
+        """
+        Awaitable version of get_enemy_by_id, it uses the async client so the event loop is not blocked.
+        If its not found returns None
+
+        :param enemy_id: The id to search the Enemy
+        :return: The Enemy instance found for the given id
+        """
+        enemy = self.cache.get(enemy_id)
+        if enemy is not MISSING:
+            return enemy
+
+        enemy = None
+        try:
+            enemy = await self.async_client.get_enemy(enemy_id)
+            self.cache.put(enemy_id, enemy)
+            logging.debug('[{0}] - Enemy wit id [{1}] retrieved successfully'.format(LOG_ID, enemy_id))
+        except ClientError as error:
+            self.__cache_error(enemy_id, error)
+        return enemy
+
+    def __cache_error(self, enemy_id: int, error: Exception) -> None:
+        """
+        Log an error retrieving an Enemy and, if the enemy doesn't exist, remember it to not ask for it again
+        for a while.
+
+        :param enemy_id: The id of the enemy that couldn't be retrieved
+        :param error: The error raised by the client
+        :return: None
+        """
+        if is_not_found_error(error):
+            self.cache.put_not_found(enemy_id)
+        logging.error("[{0}] - Couldn't retrieve Enemy with id [{1}]: {2}".format(LOG_ID, enemy_id, error))
@@ -1,20 +1,38 @@
 import logging
+import threading
+import time
 
 from requests.exceptions import HTTPError
 
+from karthuria.cache.snapshot import CatalogSnapshot
+from karthuria.catalog_diff import CatalogDiff, get_incremental_diff
 from karthuria.client import KarthuriaClient
+from karthuria.model.character import Equip
+from utils.lazy_loader import LazyLoader
 
 LOG_ID = "EquipRepository"
 
+SNAPSHOT_NAME = 'equips'
+SNAPSHOT_ATTRIBUTES = ['equips', 'equips_by_character', 'refreshed_at']
+
 
 class EquipRepository:
     """
-    Repository with the information of equips
+    Repository with the information of equips.
+    Equips are indexed by each of their characters when the catalog is loaded. In lazy mode the catalog is
+    loaded the first time it is needed instead of at the start. With a snapshot the indexed equips of the last
+    run are used right away while they are refreshed. A refresh that only changes some equips indexes only those
+    again and sends the diff to the listeners.
     """
 
-    def __init__(self, client: KarthuriaClient):
+    def __init__(self, client: KarthuriaClient, lazy: bool = False, snapshot: CatalogSnapshot = None):
         self.client = client
-        self.equips = self.__load_equips()
+        self.snapshot = snapshot
+        self.refreshed_at = None
+        self.equips = []
+        self.equips_by_character = {}
+        self.listeners = []
+        self.loader = LazyLoader(self.__load, lazy)
 
     def get_equips_by_character_id(self, character_id: int) -> list:
         """
@@ -24,21 +42,136 @@ class EquipRepository:
         :param character_id: The character id to get its equips
         :return: The different Equips instances found for the given id
         """
-        result = [equip for equip in self.equips if
-                  (equip.characters is not None and character_id in equip.characters)]
-        if len(result) > 0:
-            return result
+        self.loader.ensure_loaded()
+        return self.equips_by_character.get(character_id)
+
+    def add_listener(self, listener) -> None:
+        """
+        Add a function that is called each time a refresh adds, changes or removes equips, with the CatalogDiff.
+        It is called from the thread that made the refresh.
+
+        :param listener: The function to call
+        :return: None
+        """
+        self.listeners.append(listener)
+
+    def notify_listeners(self, diff: CatalogDiff) -> None:
+        """
+        Call all the listeners with the changes of the equips, an error in one of them doesn't stop the others.
+
+        :param diff: The added, changed and removed equips
+        :return: None
+        """
+        for listener in self.listeners:
+            try:
+                listener(diff)
+            except Exception as error:
+                logging.error("[{0}] - Equips listener failed with [{1}]: {2}".format(LOG_ID, diff, error))
+
+    def refresh(self, revalidate: bool = True) -> bool:
+        """
+        Revalidate the equips with the Karthuria API and, if they changed, index them and replace the current ones
+        at once. The refresh is saved in the snapshot. If they couldn't be loaded the current ones are kept.
+        It makes blocking requests, so it must not be called from the event loop.
+
+        :param revalidate: False to use the equips of the disk cache if they are still fresh
+        :return: True if the equips were loaded, False otherwise
+        """
+        equips = self.__load_equips(revalidate)
+        if len(equips) == 0 and len(self.equips) > 0:
+            return False
+        diff = None
+        if equips is not self.equips:
+            diff = self.__apply_equips(equips)
+        self.refreshed_at = time.time()
+        if diff is not None and not diff.is_empty():
+            logging.info('[{0}] - Equips refreshed, {1}'.format(LOG_ID, diff))
+            self.notify_listeners(diff)
+        if self.snapshot is not None and len(equips) > 0:
+            self.snapshot.save(SNAPSHOT_NAME, self, SNAPSHOT_ATTRIBUTES)
+        return len(equips) > 0
+
+    def __load(self) -> None:
+        """
+        Restore the equips of the snapshot and refresh them in the background, or load them from the Karthuria API
+        if there is no snapshot.
 
-    def __load_equips(self) -> list:
+        :return: None
+        """
+        if self.snapshot is not None and self.snapshot.restore(SNAPSHOT_NAME, self, SNAPSHOT_ATTRIBUTES):
+            threading.Thread(target=self.refresh, daemon=True).start()
+        else:
+            self.refresh(revalidate=False)
+
+    def __apply_equips(self, equips: list) -> CatalogDiff:
+        """
+        Replace the catalog of equips, if its diff is against the current catalog only the equips that changed are
+        indexed again, otherwise the index is built again. The lists of the characters that changed are copied
+        before changing them so searches never see them partially updated.
+
+        :param equips: A list with the equips information
+        :return: The diff against the current catalog, None if it was built again
+        """
+        diff = get_incremental_diff(self.equips, equips)
+        if diff is None:
+            self.__set_equips(equips)
+            return None
+        outgoing = diff.get_outgoing()
+        incoming = diff.get_incoming()
+        characters = {character_id for equip in outgoing + incoming for character_id in equip.characters or []}
+        equips_by_character = dict(self.equips_by_character)
+        for character_id in characters:
+            equips_by_character[character_id] = list(equips_by_character.get(character_id, []))
+        for equip in outgoing:
+            for character_id in set(equip.characters or []):
+                character_equips = equips_by_character[character_id]
+                character_equips[:] = [indexed for indexed in character_equips if indexed is not equip]
+        for equip in incoming:
+            index_equip(equips_by_character, equip)
+        for character_id in characters:
+            if len(equips_by_character[character_id]) == 0:
+                del equips_by_character[character_id]
+        self.equips_by_character = equips_by_character
+        self.equips = equips
+        return diff
+
+    def __set_equips(self, equips: list) -> None:
+        """
+        Replace the catalog of equips and its index by character, the index is built before replacing the previous
+        one so searches never see it partially built.
+
+        :param equips: A list with the equips information
+        :return: None
+        """
+        equips_by_character = {}
+        for equip in equips:
+            index_equip(equips_by_character, equip)
+        self.equips_by_character = equips_by_character
+        self.equips = equips
+
+    def __load_equips(self, revalidate: bool) -> list:
         """
         Calls Karthuria API to load equips basic information
 
+        :param revalidate: True to ask the API even if the disk cache has them fresh
         :return: A list with the equips information if is successful, otherwise an empty list
         """
         equips = []
         try:
-            equips = self.client.get_equips()
+            equips = self.client.get_equips(revalidate=revalidate)
             logging.debug('[{0}] - Equips information loaded successfully'.format(LOG_ID))
         except HTTPError as error:
             logging.error("[{0}] - Couldn't load equips information {1}".format(LOG_ID, error))
         return equips
+
+
+def index_equip(equips_by_character: dict, equip: Equip) -> None:
+    """
+    Add an equip of the catalog to the index of each of its characters.
+
+    :param equips_by_character: The index of equips by character
+    :param equip: The Equip to index
+    :return: None
+    """
+    for character_id in set(equip.characters or []):
+        equips_by_character.setdefault(character_id, []).append(equip)
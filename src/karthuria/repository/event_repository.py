@@ -1,20 +1,66 @@
+import asyncio
 import logging
+import threading
+import time
 
+from aiohttp import ClientError
 from requests import HTTPError
 
+from karthuria.async_client import AsyncKarthuriaClient
+from karthuria.cache.snapshot import CatalogSnapshot
+from karthuria.catalog_diff import CatalogDiff, get_incremental_diff
 from karthuria.client import KarthuriaClient
+from utils.lazy_loader import LazyLoader
 
 LOG_ID = "EventRepository"
 
+SNAPSHOT_NAME = 'events'
+SNAPSHOT_ATTRIBUTES = ['events', 'events_names', 'refreshed_at']
+
 
 class EventRepository:
     """
-    Repository with the information of events
+    Repository with the information of events.
+    Events names are indexed by id, each reload builds a new index and replaces the previous one at once so
+    searches never see a partially built index. In lazy mode the events are loaded the first time they are
+    needed instead of at the start. With a snapshot the events of the last run are used right away while they
+    are refreshed. When a reload only adds, renames or removes some events, only their names are updated and the
+    listeners receive the diff.
     """
 
-    def __init__(self, client: KarthuriaClient):
+    def __init__(self, client: KarthuriaClient, async_client: AsyncKarthuriaClient = None, lazy: bool = False,
+                 snapshot: CatalogSnapshot = None):
         self.client = client
-        self.events = self.__load_events()
+        self.async_client = async_client
+        self.snapshot = snapshot
+        self.refreshed_at = None
+        self.events = []
+        self.events_names = {}
+        self.listeners = []
+        self.loader = LazyLoader(self.__load, lazy)
+
+    def add_listener(self, listener) -> None:
+        """
+        Add a function that is called each time a reload adds, renames or removes events, with the CatalogDiff.
+        It is called from the thread or the event loop that made the reload.
+
+        :param listener: The function to call
+        :return: None
+        """
+        self.listeners.append(listener)
+
+    def notify_listeners(self, diff: CatalogDiff) -> None:
+        """
+        Call all the listeners with the changes of the events, an error in one of them doesn't stop the others.
+
+        :param diff: The added, renamed and removed events
+        :return: None
+        """
+        for listener in self.listeners:
+            try:
+                listener(diff)
+            except Exception as error:
+                logging.error("[{0}] - Events listener failed with [{1}]: {2}".format(LOG_ID, diff, error))
 
     def get_event_name_by_id(self, event_id: str) -> str:
         """
@@ -23,9 +69,19 @@ class EventRepository:
         :param event_id: Id of the event to search
         :return: The name of the event
         """
-        for event in self.events:
-            if str(event.event_id) == str(event_id):
-                return event.name
+        self.loader.ensure_loaded()
+        return self.events_names.get(str(event_id))
+
+    async def get_event_name_by_id_async(self, event_id: str) -> str:
+        """
+        Awaitable version of get_event_name_by_id, if the events weren't loaded yet they are loaded without
+        blocking the event loop.
+
+        :param event_id: Id of the event to search
+        :return: The name of the event
+        """
+        await self.loader.ensure_loaded_async()
+        return self.events_names.get(str(event_id))
 
     def get_current_events(self) -> dict:
         """
@@ -41,24 +97,136 @@ class EventRepository:
             logging.error("[{0}] - Couldn't retrieve current events {1}".format(LOG_ID, error))
         return current_events
 
+    async def get_current_events_async(self) -> dict:
+        """
+        Awaitable version of get_current_events, it uses the async client so the event loop is not blocked.
+
+        :return: A dict with the different type of ongoing events, like bosses or challenges
+        """
+        current_events = {}
+        try:
+            current_events = await self.async_client.get_current_events()
+            logging.debug('[{0}] - Current Events retrieved successfully'.format(LOG_ID))
+        except ClientError as error:
+            logging.error("[{0}] - Couldn't retrieve current events {1}".format(LOG_ID, error))
+        return current_events
+
     def reload_events(self) -> None:
         """
         Refresh the current event information of the API into the EventRepository.
-        This is a measure to keep data updated.
+        This is a measure to keep data updated. If the events couldn't be retrieved the previous information is kept.
+
+        :return: None
+        """
+        self.refresh()
+        self.loader.mark_loaded()
+
+    async def reload_events_async(self) -> None:
+        """
+        Awaitable version of reload_events, it uses the async client so the event loop is not blocked.
+        If the events couldn't be retrieved the previous information is kept.
+
+        :return: None
+        """
+        try:
+            events = await self.async_client.get_events(revalidate=True)
+            diff = self.__apply_events(events) if events is not self.events else None
+            self.refreshed_at = time.time()
+            self.loader.mark_loaded()
+            logging.debug('[{0}] - Events retrieved successfully'.format(LOG_ID))
+        except ClientError as error:
+            logging.error("[{0}] - Couldn't retrieve events {1}".format(LOG_ID, error))
+            return
+        self.__publish_diff(diff)
+        if self.snapshot is not None:
+            await asyncio.get_event_loop().run_in_executor(None, self.snapshot.save, SNAPSHOT_NAME, self,
+                                                           SNAPSHOT_ATTRIBUTES)
+
+    def refresh(self, revalidate: bool = True) -> bool:
+        """
+        Revalidate the events with the Karthuria API and, if they changed, index them and replace the current ones
+        at once. The refresh is saved in the snapshot. If they couldn't be loaded the current ones are kept.
+        It makes blocking requests, so it must not be called from the event loop.
+
+        :param revalidate: False to use the events of the disk cache if they are still fresh
+        :return: True if the events were loaded, False otherwise
+        """
+        events = self.__load_events(revalidate)
+        if len(events) == 0 and len(self.events) > 0:
+            return False
+        diff = None
+        if events is not self.events:
+            diff = self.__apply_events(events)
+        self.refreshed_at = time.time()
+        self.__publish_diff(diff)
+        if self.snapshot is not None and len(events) > 0:
+            self.snapshot.save(SNAPSHOT_NAME, self, SNAPSHOT_ATTRIBUTES)
+        return len(events) > 0
+
+    def __load(self) -> None:
+        """
+        Restore the events of the snapshot and refresh them in the background, or load them from the Karthuria API
+        if there is no snapshot.
+
+        :return: None
+        """
+        if self.snapshot is not None and self.snapshot.restore(SNAPSHOT_NAME, self, SNAPSHOT_ATTRIBUTES):
+            threading.Thread(target=self.refresh, daemon=True).start()
+        else:
+            self.refresh(revalidate=False)
+
+    def __apply_events(self, events: list) -> CatalogDiff:
+        """
+        Replace the loaded events, if their diff is against the current ones only the names that changed are updated
+        in a copy of the index, otherwise the index is built again.
+
+        :param events: A list with events names and ids
+        :return: The diff against the current events, None if the index was built again
+        """
+        diff = get_incremental_diff(self.events, events)
+        if diff is None:
+            self.__set_events(events)
+            return None
+        events_names = dict(self.events_names)
+        for event in diff.get_outgoing():
+            events_names.pop(str(event.event_id), None)
+        for event in diff.get_incoming():
+            events_names[str(event.event_id)] = event.name
+        self.events_names = events_names
+        self.events = events
+        return diff
+
+    def __publish_diff(self, diff: CatalogDiff) -> None:
+        """
+        Send to the listeners the changes of a reload, if there were any.
+
+        :param diff: The diff of the reload, None if it is unknown
+        :return: None
+        """
+        if diff is not None and not diff.is_empty():
+            logging.info('[{0}] - Events refreshed, {1}'.format(LOG_ID, diff))
+            self.notify_listeners(diff)
+
+    def __set_events(self, events: list) -> None:
+        """
+        Replace the loaded events and the index of their names by id.
 
+        :param events: A list with events names and ids
         :return: None
         """
-        self.events = self.__load_events()
+        self.events_names = {str(event.event_id): event.name for event in events}
+        self.events = events
 
-    def __load_events(self) -> list:
+    def __load_events(self, revalidate: bool) -> list:
         """
         Calls Karthuria API to get all events information, mostly its names
 
+        :param revalidate: True to ask the API even if the disk cache has them fresh
         :return: A list with events names and ids
         """
         events = []
         try:
-            events = self.client.get_events()
+            events = self.client.get_events(revalidate=revalidate)
             logging.debug('[{0}] - Events retrieved successfully'.format(LOG_ID))
         except HTTPError as error:
             logging.error("[{0}] - Couldn't retrieve events {1}".format(LOG_ID, error))
@@ -0,0 +1,110 @@
+import threading
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_POOL_PER_HOST = 10
+DEFAULT_KEEPALIVE_TIMEOUT = 30
+
+
+class PoolStats:
+    """
+    Counters of the connections used by a pooled session, to know how many requests reused an already
+    opened connection (pool hit) and how many needed a new TCP and TLS handshake.
+    """
+
+    def __init__(self):
+        self.new_connections = 0
+        self.reused_connections = 0
+        self.lock = threading.Lock()
+
+    def record(self, is_new_connection: bool) -> None:
+        """
+        Register that a request was sent through the pool
+
+        :param is_new_connection: True if the request needed to open a new connection
+        :return: None
+        """
+        with self.lock:
+            if is_new_connection:
+                self.new_connections += 1
+            else:
+                self.reused_connections += 1
+
+    def to_dict(self) -> dict:
+        """
+        Return the current counters of the pool
+
+        :return: A dictionary with the number of requests, new connections and reused connections
+        """
+        return {'requests': self.new_connections + self.reused_connections,
+                'new_connections': self.new_connections,
+                'reused_connections': self.reused_connections}
+
+    def __str__(self):
+        return '{requests} requests, {new_connections} new connections, ' \
+               '{reused_connections} reused connections'.format(**self.to_dict())
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    Requests adapter that keeps track in a PoolStats of the connections that are opened or reused by its pool
+    """
+
+    def __init__(self, stats: PoolStats, **kwargs):
+        self.stats = stats
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        pool = self.get_connection(request.url, kwargs.get('proxies'))
+        opened_connections = pool.num_connections
+        response = super().send(request, **kwargs)
+        self.stats.record(pool.num_connections > opened_connections)
+        return response
+
+
+def build_session(stats: PoolStats, pool_size: int = DEFAULT_POOL_SIZE,
+                  pool_per_host: int = DEFAULT_POOL_PER_HOST, **_) -> requests.Session:
+    """
+    Build a requests session with a connection pool that keeps the connections alive between requests.
+
+    :param stats: Counters where the pool hits and new connections are registered
+    :param pool_size: Number of hosts that can keep a pool of connections at the same time
+    :param pool_per_host: Max number of connections kept alive for each host
+    :return: A requests Session ready to be shared by all the requests of a client
+    """
+    session = requests.Session()
+    adapter = PooledHTTPAdapter(stats, pool_connections=pool_size, pool_maxsize=pool_per_host)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def build_async_session(stats: PoolStats, pool_size: int = DEFAULT_POOL_SIZE,
+                        pool_per_host: int = DEFAULT_POOL_PER_HOST,
+                        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT, **_) -> aiohttp.ClientSession:
+    """
+    Build an aiohttp session with a connection pool that keeps the connections alive between requests.
+    It must be called inside a running event loop.
+
+    :param stats: Counters where the pool hits and new connections are registered
+    :param pool_size: Max number of connections opened at the same time
+    :param pool_per_host: Max number of connections opened at the same time to the same host
+    :param keepalive_timeout: Seconds that an idle connection is kept alive to be reused
+    :return: An aiohttp ClientSession ready to be shared by all the requests of a client
+    """
+
+    async def on_connection_create_end(*_):
+        stats.record(True)
+
+    async def on_connection_reuseconn(*_):
+        stats.record(False)
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+    connector = aiohttp.TCPConnector(limit=pool_size, limit_per_host=pool_per_host,
+                                     keepalive_timeout=keepalive_timeout)
+    return aiohttp.ClientSession(connector=connector, trace_configs=[trace_config])
@@ -1,14 +1,20 @@
 import logging
 import logging.config
 import os
-import sys
 import traceback
 
 from discord.ext import commands
 
+from command.initializer import Initializer
 from utils.file_utils import load_json_file
+from utils.timeline import Timeline
 
 LOG_ID = 'KuroBotInitializer'
+CATALOGS_PHASE = 'catalogs'
+EXTENSIONS_PHASE = 'extensions'
+GATEWAY_PHASE = 'gateway'
+
+timeline = Timeline()
 settings_path = os.getenv('SETTINGS_PATH', 'settings.json')
 logging_path = os.getenv('LOGGING_PATH', 'logging.conf')
 
@@ -20,29 +26,67 @@ prefixes = config.get('prefixes')
 modules = config.get('commands')
 token = config.get('token')
 
-bot = commands.Bot(command_prefix=commands.when_mentioned_or(*prefixes), description=description)
+
+def build_bot(sharding_settings: dict) -> commands.Bot:
+    """
+    Build the discord bot with one gateway connection, or sharded if it was enabled in the settings.
+    Without 'shard_ids' the bot connects all the shards, with the 'shard_count' given or the one recommended by
+    discord. With 'shard_ids' only those shards are connected, so the bot can be split in several processes.
+
+    :param sharding_settings: Configuration of the shards with 'enabled', 'shard_count' and 'shard_ids'
+    :return: The discord bot
+    """
+    command_prefix = commands.when_mentioned_or(*prefixes)
+    if not sharding_settings.get('enabled', False):
+        return commands.Bot(command_prefix=command_prefix, description=description)
+    return commands.AutoShardedBot(command_prefix=command_prefix, description=description,
+                                   shard_count=sharding_settings.get('shard_count'),
+                                   shard_ids=sharding_settings.get('shard_ids'))
+
+
+bot = build_bot(config.get('sharding', {}))
+
+
+@bot.event
+async def on_shard_ready(shard_id: int):
+    logging.info('[{0}] Shard {1} ready'.format(LOG_ID, shard_id))
 
 
 @bot.event
 async def on_ready():
-    logging.info('[{0}] Getting ready {1}'.format(LOG_ID, bot.user.name))
+    if not timeline.is_finished(GATEWAY_PHASE):
+        timeline.finish(GATEWAY_PHASE)
+        logging.info('[{0}] Startup timeline: {1}'.format(LOG_ID, timeline))
+    logging.info('[{0}] Bot ready {1}!'.format(LOG_ID, bot.user.name))
+
+
+def load_extensions() -> None:
+    """
+    Load the commands of all the configured modules. It must be done only one time, before connecting the bot,
+    because on_ready is called again each time the bot reconnects.
+
+    :return: None
+    """
     logging.debug('[{0}] Loading commands...'.format(LOG_ID))
-    if __name__ == '__main__':
-        modules_loaded = 0
-        for module in modules:
-            try:
-                bot.load_extension(module)
-                logging.debug('\t' + module)
-                modules_loaded += 1
-            except Exception as details:
-                traceback.print_exc()
-                logging.error(f'Error loading the extension {module}', file=sys.stderr)
-                logging.error(details)
-
-        logging.debug(str(modules_loaded) + '/' + str(modules.__len__()) + ' modules loaded')
-        logging.debug('[{0}] Systems 100%'.format(LOG_ID))
-    logging.info('[{0}] Bot ready!'.format(LOG_ID))
+    modules_loaded = 0
+    for module in modules:
+        try:
+            bot.load_extension(module)
+            logging.debug('\t' + module)
+            modules_loaded += 1
+        except Exception as details:
+            traceback.print_exc()
+            logging.error(f'Error loading the extension {module}')
+            logging.error(details)
+    logging.debug(str(modules_loaded) + '/' + str(modules.__len__()) + ' modules loaded')
 
 
 if __name__ == "__main__":
+    with timeline.phase(CATALOGS_PHASE):
+        initializer = Initializer()
+    initializer.get_catalog_refresher().start(bot.loop)
+    with timeline.phase(EXTENSIONS_PHASE):
+        load_extensions()
+    logging.debug('[{0}] Systems 100%'.format(LOG_ID))
+    timeline.start(GATEWAY_PHASE)
     bot.run(token)
@@ -0,0 +1,20 @@
+import asyncio
+
+
+async def gather_with_limit(coroutines: list, limit: int) -> list:
+    """
+    Run the given coroutines concurrently, but never more than the given limit at the same time.
+    The results keep the same order of the coroutines and if one of them fails its exception is returned in its
+    position instead of cancelling the others.
+
+    :param coroutines: List of coroutines to execute
+    :param limit: Max number of coroutines that can be running at the same time
+    :return: A list with the result or the raised exception of each coroutine
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run_with_limit(coroutine):
+        async with semaphore:
+            return await coroutine
+
+    return await asyncio.gather(*[run_with_limit(coroutine) for coroutine in coroutines], return_exceptions=True)
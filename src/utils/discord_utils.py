@@ -1,5 +1,5 @@
 import discord
-from discord import Role
+from discord import Role, Client
 from discord.abc import GuildChannel
 from discord.ext.commands import Context
 
@@ -40,3 +40,17 @@ def get_channel_by_name(ctx: Context, channel_name: str) -> GuildChannel:
     for channel in channels:
         if channel.name == channel_name:
             return channel
+
+
+async def send_embed_payload(bot: Client, channel_id: int, content: str, embed_payload: dict) -> None:
+    """
+    Send a message with an embed that was already serialized with Embed.to_dict, so the same embed can be sent
+    to many channels without serializing it again for each one.
+
+    :param bot: The discord client that sends the message
+    :param channel_id: Id of the channel where the message is sent
+    :param content: Text of the message
+    :param embed_payload: The serialized embed
+    :return: None
+    """
+    await bot.http.send_message(channel_id, content, embed=embed_payload)
@@ -1,5 +1,7 @@
+import hashlib
 import json
 import os.path
+import tempfile
 
 
 def load_json_file(file_path: str) -> dict:
@@ -31,3 +33,114 @@ def is_file(file_path: str) -> bool:
     :return: True if is a file False otherwise
     """
     return os.path.isfile(file_path)
+
+
+def write_file_atomically(file_path: str, content: bytes) -> None:
+    """
+    Write a file in a temporary file of the same folder and then replace the original one,
+    so readers see either the old content or the new one but never a partial write.
+
+    :param file_path: File to write
+    :param content: Bytes to save in the file
+    :return: None
+    """
+    descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(file_path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'wb') as file:
+            file.write(content)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, file_path)
+    except OSError:
+        remove_file(temporary_path)
+        raise
+
+
+def remove_file(file_path: str) -> None:
+    """
+    Remove a file if it exists
+    :param file_path: Path were the file is
+    :return: None
+    """
+    try:
+        os.remove(file_path)
+    except FileNotFoundError:
+        pass
+
+
+def append_json_line(file_path: str, data: dict) -> None:
+    """
+    Append data as a new json line at the end of a file, creating it if it doesn't exist.
+    The line is flushed to disk before returning so it is not lost if the process stops.
+
+    :param file_path: File to append the given information
+    :param data: The data to be saved in the file
+    :return: None
+    """
+    line = json.dumps(data) + '\n'
+    with open(file_path, 'a', encoding='utf-8') as file:
+        file.write(line)
+        file.flush()
+        os.fsync(file.fileno())
+
+
+def load_json_lines(file_path: str) -> list:
+    """
+    Load all the json lines of a file, in the order they were appended.
+    A broken line, like the last one of an interrupted append, and the lines after it are ignored.
+
+    :param file_path: File to load its respective values
+    :return: A list with the data of each line, empty if the file doesn't exist
+    """
+    return read_json_lines(file_path)[0]
+
+
+def read_json_lines(file_path: str, offset: int = 0) -> tuple:
+    """
+    Load the json lines of a file that were appended after the given position.
+    A broken line, like the last one of an interrupted append, and the lines after it are ignored.
+
+    :param file_path: File to load its respective values
+    :param offset: Position in bytes of the file where the lines start
+    :return: A tuple with a list of the data of each line and the position where the next line will start
+    """
+    records = []
+    try:
+        with open(file_path, 'rb') as file:
+            file.seek(offset)
+            for line in file:
+                if not line.endswith(b'\n'):
+                    break
+                records.append(json.loads(line))
+                offset += len(line)
+    except (FileNotFoundError, ValueError):
+        pass
+    return records, offset
+
+
+def get_file_signature(file_path: str) -> tuple:
+    """
+    Return the last modification time and size of a file, if any of them changes the file has changed.
+
+    :param file_path: Path were the file is
+    :return: A tuple with the modification time in nanoseconds and the size in bytes, None if the file doesn't exist
+    """
+    try:
+        stat = os.stat(file_path)
+        return stat.st_mtime_ns, stat.st_size
+    except OSError:
+        return None
+
+
+def get_file_hash(file_path: str) -> str:
+    """
+    Calculate the hash of the content of a file.
+
+    :param file_path: Path were the file is
+    :return: The sha1 hex digest of the file, None if the file doesn't exist
+    """
+    try:
+        with open(file_path, 'rb') as file:
+            return hashlib.sha1(file.read()).hexdigest()
+    except OSError:
+        return None
@@ -0,0 +1,53 @@
+import asyncio
+import threading
+
+
+class LazyLoader:
+    """
+    Executes a load function only one time, the first time its result is needed instead of at the start.
+    When several threads or coroutines need it at the same time only one of them executes the load and the others
+    wait for it to finish (single flight).
+    """
+
+    def __init__(self, load, lazy: bool = True):
+        """
+        Initialize the LazyLoader
+
+        :param load: Function without arguments that loads the information
+        :param lazy: False to execute the load right now, True to wait until it is needed
+        """
+        self.load = load
+        self.loaded = False
+        self.lock = threading.Lock()
+        if not lazy:
+            self.ensure_loaded()
+
+    def ensure_loaded(self) -> None:
+        """
+        Execute the load if it wasn't executed yet, waiting for it if another thread is already executing it.
+
+        :return: None
+        """
+        if self.loaded:
+            return
+        with self.lock:
+            if not self.loaded:
+                self.load()
+                self.loaded = True
+
+    async def ensure_loaded_async(self) -> None:
+        """
+        Awaitable version of ensure_loaded, the load is executed in another thread so the event loop is not blocked.
+
+        :return: None
+        """
+        if not self.loaded:
+            await asyncio.get_event_loop().run_in_executor(None, self.ensure_loaded)
+
+    def mark_loaded(self) -> None:
+        """
+        Register that the information was already loaded in another way, like a reload, so the load is never executed.
+
+        :return: None
+        """
+        self.loaded = True
@@ -0,0 +1,129 @@
+TRIGRAM_SIZE = 3
+
+EXACT_MATCH = 0
+START_MATCH = 1
+WORD_START_MATCH = 2
+SUBSTRING_MATCH = 3
+
+
+class SearchIndex:
+    """
+    Precomputed index to search items by a text, like a name, without going through all the items on each search.
+    The words of each text are saved in a prefix trie, to find the ones that start with the query, and the
+    trigrams of each text in an inverted index, to find the ones that contain the query in any position.
+    Results are ranked by how good the match is and then by the order of the indexed items.
+    """
+
+    def __init__(self, items: list, get_text):
+        """
+        Initialize the SearchIndex
+
+        :param items: The items to index, the order is kept to sort matches that have the same rank
+        :param get_text: Function that returns the text to search of an item
+        """
+        self.items = items
+        self.texts = [get_text(item).lower() for item in items]
+        self.prefixes = {}
+        self.trigrams = {}
+        for position, text in enumerate(self.texts):
+            for word in text.split():
+                self.__add_word(word, position)
+            for trigram in get_trigrams(text):
+                self.trigrams.setdefault(trigram, set()).add(position)
+
+    def search(self, query: str, limit: int = None) -> list:
+        """
+        Search the items whose text contains the query, ignoring upper and lower case.
+        Items whose text is the query go first, then the ones that start with it, then the ones with a word that
+        starts with it and at last the ones that contain it anywhere.
+
+        :param query: The text to search
+        :param limit: Max number of items to return, all of them if it is not set
+        :return: A list with the matching items in order of relevance
+        """
+        query = query.lower().strip()
+        if len(query) == 0:
+            return []
+
+        ranked = sorted((self.__get_rank(query, position), position) for position in self.__get_candidates(query))
+        return [self.items[position] for _, position in ranked[:limit]]
+
+    def complete(self, prefix: str, limit: int = None) -> list:
+        """
+        Search the items with a word that starts with the given prefix, to autocomplete what is being written.
+
+        :param prefix: The beginning of a word
+        :param limit: Max number of items to return, all of them if it is not set
+        :return: A list with the matching items in the order they were indexed
+        """
+        positions = sorted(self.__get_word_prefix_positions(prefix.lower().strip()))
+        return [self.items[position] for position in positions[:limit]]
+
+    def __add_word(self, word: str, position: int) -> None:
+        """
+        Add a word to the prefix trie, each node keeps the positions of all the items with a word under it.
+
+        :param word: The word to add
+        :param position: Position of the item that has the word
+        :return: None
+        """
+        node = self.prefixes
+        for char in word:
+            node = node.setdefault(char, {})
+            node.setdefault(None, set()).add(position)
+
+    def __get_word_prefix_positions(self, prefix: str) -> set:
+        """
+        Search in the prefix trie the items with a word that starts with the given prefix.
+
+        :param prefix: The beginning of a word
+        :return: A set with the positions of the matching items
+        """
+        node = self.prefixes
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return set()
+        return node.get(None, set())
+
+    def __get_candidates(self, query: str) -> set:
+        """
+        Search the items whose text contains the query.
+        Queries shorter than a trigram can't use the trigram index so they are compared with every text.
+
+        :param query: The lowercase text to search
+        :return: A set with the positions of the matching items
+        """
+        trigrams = get_trigrams(query)
+        if len(trigrams) == 0:
+            candidates = range(len(self.texts))
+        else:
+            candidates = set.intersection(*[self.trigrams.get(trigram, set()) for trigram in trigrams])
+        return {position for position in candidates if query in self.texts[position]}
+
+    def __get_rank(self, query: str, position: int) -> int:
+        """
+        Measure how good is the match of an item text with the query, lower is better.
+
+        :param query: The lowercase text to search
+        :param position: Position of the item that contains the query
+        :return: The rank of the match
+        """
+        text = self.texts[position]
+        if text == query:
+            return EXACT_MATCH
+        if text.startswith(query):
+            return START_MATCH
+        if position in self.__get_word_prefix_positions(query):
+            return WORD_START_MATCH
+        return SUBSTRING_MATCH
+
+
+def get_trigrams(text: str) -> set:
+    """
+    Split a text in all its groups of three consecutive characters.
+
+    :param text: The text to split
+    :return: A set with the trigrams of the text, empty if the text is shorter than a trigram
+    """
+    return {text[index:index + TRIGRAM_SIZE] for index in range(len(text) - TRIGRAM_SIZE + 1)}
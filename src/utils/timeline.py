@@ -0,0 +1,68 @@
+import time
+from contextlib import contextmanager
+
+
+class Timeline:
+    """
+    Measures how long each phase of a process takes, like the startup of the bot, to know which one to improve.
+    Phases are reported in the order they started.
+    """
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.starts = {}
+        self.durations = {}
+
+    def start(self, name: str) -> None:
+        """
+        Start measuring a phase.
+
+        :param name: Name of the phase
+        :return: None
+        """
+        self.starts[name] = time.monotonic()
+
+    def finish(self, name: str) -> float:
+        """
+        Stop measuring a phase that was started.
+
+        :param name: Name of the phase
+        :return: Seconds that the phase took
+        """
+        self.durations[name] = time.monotonic() - self.starts[name]
+        return self.durations[name]
+
+    def is_finished(self, name: str) -> bool:
+        """
+        Validates if a phase was already measured.
+
+        :param name: Name of the phase
+        :return: True if the phase finished, False otherwise
+        """
+        return name in self.durations
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Measure the phase executed inside the context, even if it fails.
+
+        :param name: Name of the phase
+        """
+        self.start(name)
+        try:
+            yield
+        finally:
+            self.finish(name)
+
+    def get_elapsed(self) -> float:
+        """
+        Return the seconds since the timeline was created.
+
+        :return: Seconds since the start
+        """
+        return time.monotonic() - self.started_at
+
+    def __str__(self):
+        phases = ['{0} {1:.2f}s'.format(name, self.durations[name]) for name in self.starts if name in self.durations]
+        phases.append('total {0:.2f}s'.format(self.get_elapsed()))
+        return ', '.join(phases)
@@ -1,7 +1,10 @@
-from unittest.mock import patch
+import json
+import os
+from unittest.mock import patch, Mock
 
 from command.configuration.model.channel_type import ChannelType
 from command.configuration.repository.server_repository import ServerRepository
+from utils.file_utils import load_json_file, append_json_line
 
 TEST_JSON = 'test.json'
 TEST_SERVER = 'Test Server'
@@ -88,13 +91,13 @@ class TestCreateServer:
 
     @patch('command.configuration.repository.server_repository.is_file')
     @patch('command.configuration.repository.server_repository.load_json_file')
-    @patch('command.configuration.repository.server_repository.write_json_file')
-    def test_when_server_has_birthday_channel(self, mock_write_json, mock_load_json, mock_is_file,
+    @patch('command.configuration.repository.server_repository.append_json_line')
+    def test_when_server_has_birthday_channel(self, mock_append_json, mock_load_json, mock_is_file,
                                               server_with_channels):
         # Arrange
         mock_is_file.return_value = True
         mock_load_json.return_value = []
-        mock_write_json.return_value = None
+        mock_append_json.return_value = None
         repository = ServerRepository(TEST_JSON)
 
         expected_server_id = server_with_channels.server_id
@@ -121,12 +124,12 @@ class TestCreateServer:
 
     @patch('command.configuration.repository.server_repository.is_file')
     @patch('command.configuration.repository.server_repository.load_json_file')
-    @patch('command.configuration.repository.server_repository.write_json_file')
-    def test_when_server_has_event_channel(self, mock_write_json, mock_load_json, mock_is_file, server_with_channels):
+    @patch('command.configuration.repository.server_repository.append_json_line')
+    def test_when_server_has_event_channel(self, mock_append_json, mock_load_json, mock_is_file, server_with_channels):
         # Arrange
         mock_is_file.return_value = True
         mock_load_json.return_value = []
-        mock_write_json.return_value = None
+        mock_append_json.return_value = None
         repository = ServerRepository(TEST_JSON)
 
         expected_server_id = server_with_channels.server_id
@@ -153,13 +156,13 @@ class TestCreateServer:
 
     @patch('command.configuration.repository.server_repository.is_file')
     @patch('command.configuration.repository.server_repository.load_json_file')
-    @patch('command.configuration.repository.server_repository.write_json_file')
-    def test_when_server_already_exist(self, mock_write_json, mock_load_json, mock_is_file, server_with_channels,
+    @patch('command.configuration.repository.server_repository.append_json_line')
+    def test_when_server_already_exist(self, mock_append_json, mock_load_json, mock_is_file, server_with_channels,
                                        one_channels_server_info):
         # Arrange
         mock_is_file.return_value = True
         mock_load_json.return_value = one_channels_server_info
-        mock_write_json.return_value = None
+        mock_append_json.return_value = None
         repository = ServerRepository(TEST_JSON)
 
         expected_server_id = server_with_channels.server_id
@@ -188,12 +191,12 @@ class TestCreateServer:
 
     @patch('command.configuration.repository.server_repository.is_file')
     @patch('command.configuration.repository.server_repository.load_json_file')
-    @patch('command.configuration.repository.server_repository.write_json_file')
-    def test_when_server_dsa(self, mock_write_json, mock_load_json, mock_is_file):
+    @patch('command.configuration.repository.server_repository.append_json_line')
+    def test_when_server_dsa(self, mock_append_json, mock_load_json, mock_is_file):
         # Arrange
         mock_is_file.return_value = True
         mock_load_json.return_value = []
-        mock_write_json.side_effect = FileNotFoundError('Ups')
+        mock_append_json.side_effect = FileNotFoundError('Ups')
         repository = ServerRepository(TEST_JSON)
 
         expected_server_id = 1
@@ -214,6 +217,28 @@ class TestCreateServer:
         assert len(repository.servers) != 0
 
 
+    @patch('command.configuration.repository.server_repository.is_file')
+    @patch('command.configuration.repository.server_repository.load_json_file')
+    @patch('command.configuration.repository.server_repository.append_json_line')
+    def test_when_server_is_updated_keeps_its_order(self, mock_append_json, mock_load_json, mock_is_file,
+                                                    complete_server_info, one_channels_server_info):
+        # Arrange
+        mock_is_file.return_value = True
+        second_server = dict(one_channels_server_info[0], server_id=2, name='Second Server')
+        mock_load_json.return_value = complete_server_info + [second_server]
+        repository = ServerRepository(TEST_JSON)
+
+        # Act
+        repository.create_server(1, TEST_SERVER, 3, 'New Channel', ChannelType.EVENT, 3)
+
+        # Assert
+        saved_server = mock_append_json.call_args[0][1]
+        assert saved_server['server_id'] == 1
+        assert saved_server['event_channel']['name'] == 'New Channel'
+        assert [server.server_id for server in repository.servers] == [1, 2]
+        assert repository.find_server_by_id(2).name == 'Second Server'
+
+
 class TestReloadServers:
 
     @patch('command.configuration.repository.server_repository.is_file')
@@ -255,17 +280,69 @@ class TestReloadServers:
         assert result[0].event_channel.name == expected_event_channel_name
 
 
+    @patch('command.configuration.repository.server_repository.load_json_file', wraps=load_json_file)
+    def test_when_file_didnt_change(self, mock_load_json, tmp_path, complete_server_info):
+        # Arrange
+        servers_path = str(tmp_path / TEST_JSON)
+        with open(servers_path, 'w') as file:
+            json.dump(complete_server_info, file)
+        repository = ServerRepository(servers_path)
+        os.utime(servers_path, ns=(0, 0))
+
+        # Act
+        repository.reload_servers()
+
+        # Assert
+        assert mock_load_json.call_count == 1
+        assert len(repository.servers) == 1
+
+    @patch('command.configuration.repository.server_repository.load_json_file', wraps=load_json_file)
+    def test_when_only_journal_changed(self, mock_load_json, tmp_path, complete_server_info, one_channels_server_info):
+        # Arrange
+        servers_path = str(tmp_path / TEST_JSON)
+        with open(servers_path, 'w') as file:
+            json.dump(complete_server_info, file)
+        repository = ServerRepository(servers_path)
+        first_server = repository.find_server_by_id(1)
+        append_json_line(servers_path + '.journal', dict(one_channels_server_info[0], server_id=2))
+
+        # Act
+        repository.reload_servers()
+
+        # Assert
+        assert mock_load_json.call_count == 1
+        assert [server.server_id for server in repository.servers] == [1, 2]
+        assert repository.find_server_by_id(1) is first_server
+
+    def test_when_file_changed_keeps_unchanged_servers(self, tmp_path, complete_server_info, one_channels_server_info):
+        # Arrange
+        servers_path = str(tmp_path / TEST_JSON)
+        with open(servers_path, 'w') as file:
+            json.dump(complete_server_info, file)
+        repository = ServerRepository(servers_path)
+        first_server = repository.find_server_by_id(1)
+        with open(servers_path, 'w') as file:
+            json.dump(complete_server_info + [dict(one_channels_server_info[0], server_id=2)], file)
+
+        # Act
+        repository.reload_servers()
+
+        # Assert
+        assert [server.server_id for server in repository.servers] == [1, 2]
+        assert repository.find_server_by_id(1) is first_server
+
+
 class TestRemoveServerChannel:
 
     @patch('command.configuration.repository.server_repository.is_file')
     @patch('command.configuration.repository.server_repository.load_json_file')
-    @patch('command.configuration.repository.server_repository.write_json_file')
-    def test_when_birthday_channel_was_removed(self, mock_write_json, mock_load_json, mock_is_file,
+    @patch('command.configuration.repository.server_repository.append_json_line')
+    def test_when_birthday_channel_was_removed(self, mock_append_json, mock_load_json, mock_is_file,
                                                complete_server_info):
         # Arrange
         mock_is_file.return_value = True
         mock_load_json.return_value = complete_server_info
-        mock_write_json.return_value = None
+        mock_append_json.return_value = None
         repository = ServerRepository(TEST_JSON)
         expected_server_id = 1
 
@@ -279,12 +356,13 @@ class TestRemoveServerChannel:
 
     @patch('command.configuration.repository.server_repository.is_file')
     @patch('command.configuration.repository.server_repository.load_json_file')
-    @patch('command.configuration.repository.server_repository.write_json_file')
-    def test_when_events_channel_was_removed(self, mock_write_json, mock_load_json, mock_is_file, complete_server_info):
+    @patch('command.configuration.repository.server_repository.append_json_line')
+    def test_when_events_channel_was_removed(self, mock_append_json, mock_load_json, mock_is_file,
+                                             complete_server_info):
         # Arrange
         mock_is_file.return_value = True
         mock_load_json.return_value = complete_server_info
-        mock_write_json.return_value = None
+        mock_append_json.return_value = None
         repository = ServerRepository(TEST_JSON)
         expected_server_id = 1
 
@@ -298,13 +376,13 @@ class TestRemoveServerChannel:
 
     @patch('command.configuration.repository.server_repository.is_file')
     @patch('command.configuration.repository.server_repository.load_json_file')
-    @patch('command.configuration.repository.server_repository.write_json_file')
-    def test_when_some_channel_was_removed_but_server_wasnt_configured(self, mock_write_json, mock_load_json,
+    @patch('command.configuration.repository.server_repository.append_json_line')
+    def test_when_some_channel_was_removed_but_server_wasnt_configured(self, mock_append_json, mock_load_json,
                                                                        mock_is_file, complete_server_info):
         # Arrange
         mock_is_file.return_value = True
         mock_load_json.return_value = complete_server_info
-        mock_write_json.return_value = None
+        mock_append_json.return_value = None
         repository = ServerRepository(TEST_JSON)
         expected_server_id = 2
 
@@ -315,3 +393,96 @@ class TestRemoveServerChannel:
         assert len(repository.servers) != 0
         assert repository.servers[0].birthday_channel is not None
         assert repository.servers[0].event_channel is not None
+
+
+class TestJournal:
+
+    def test_when_changes_are_replayed(self, tmp_path, complete_server_info):
+        # Arrange
+        servers_path = str(tmp_path / TEST_JSON)
+        with open(servers_path, 'w') as file:
+            json.dump(complete_server_info, file)
+        repository = ServerRepository(servers_path)
+        repository.remove_server_channel(1, ChannelType.BIRTHDAY)
+        repository.create_server(2, 'Second Server', 3, 'New Channel', ChannelType.EVENT, 3)
+
+        # Act
+        result = ServerRepository(servers_path)
+
+        # Assert
+        assert result.journal_size == 2
+        assert [server.server_id for server in result.servers] == [1, 2]
+        assert result.find_server_by_id(1).birthday_channel is None
+        assert result.find_server_by_id(2).event_channel.name == 'New Channel'
+
+    def test_when_journal_is_compacted(self, tmp_path, complete_server_info):
+        # Arrange
+        servers_path = str(tmp_path / TEST_JSON)
+        with open(servers_path, 'w') as file:
+            json.dump(complete_server_info, file)
+        repository = ServerRepository(servers_path, compact_every=2)
+        repository.remove_server_channel(1, ChannelType.BIRTHDAY)
+
+        # Act
+        repository.create_server(2, 'Second Server', 3, 'New Channel', ChannelType.EVENT, 3)
+
+        # Assert
+        with open(servers_path) as file:
+            saved_servers = json.load(file)
+        assert repository.journal_size == 0
+        assert not (tmp_path / (TEST_JSON + '.journal')).exists()
+        assert [server['server_id'] for server in saved_servers] == [1, 2]
+        assert saved_servers[0]['birthday_channel'] == ''
+
+    def test_when_last_change_was_interrupted(self, tmp_path, complete_server_info):
+        # Arrange
+        servers_path = str(tmp_path / TEST_JSON)
+        with open(servers_path, 'w') as file:
+            json.dump(complete_server_info, file)
+        repository = ServerRepository(servers_path)
+        repository.remove_server_channel(1, ChannelType.BIRTHDAY)
+        with open(servers_path + '.journal', 'a') as file:
+            file.write('{"server_id": 2, "na')
+
+        # Act
+        result = ServerRepository(servers_path)
+
+        # Assert
+        assert len(result.servers) == 1
+        assert result.find_server_by_id(1).birthday_channel is None
+
+
+class TestListeners:
+
+    @patch('command.configuration.repository.server_repository.append_json_line')
+    def test_when_server_is_saved(self, _, tmp_path):
+        # Arrange
+        listener = Mock()
+        repository = ServerRepository(str(tmp_path / TEST_JSON))
+        repository.add_listener(listener)
+
+        # Act
+        repository.create_server(1, TEST_SERVER, 1, 'Test Channel', ChannelType.EVENT, 1)
+
+        # Assert
+        listener.assert_called_once_with(1, repository.find_server_by_id(1))
+
+    def test_when_reload_changes_servers(self, tmp_path, complete_server_info, one_channels_server_info):
+        # Arrange
+        servers_path = str(tmp_path / TEST_JSON)
+        second_server = dict(one_channels_server_info[0], server_id=2)
+        with open(servers_path, 'w') as file:
+            json.dump(complete_server_info + [second_server], file)
+        listener = Mock()
+        repository = ServerRepository(servers_path)
+        repository.add_listener(listener)
+        with open(servers_path, 'w') as file:
+            json.dump(one_channels_server_info, file)
+
+        # Act
+        repository.reload_servers()
+
+        # Assert
+        assert listener.call_count == 2
+        listener.assert_any_call(1, repository.find_server_by_id(1))
+        listener.assert_any_call(2, None)
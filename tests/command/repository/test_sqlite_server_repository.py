@@ -0,0 +1,123 @@
+import json
+
+from command.configuration.model.channel_type import ChannelType
+from command.configuration.repository.sqlite_server_repository import SqliteServerRepository
+
+TEST_DATABASE = 'test.db'
+TEST_JSON = 'test.json'
+TEST_SERVER = 'Test Server'
+
+
+class TestMigration:
+
+    def test_when_json_file_exists(self, tmp_path, complete_server_info):
+        # Arrange
+        servers_path = str(tmp_path / TEST_JSON)
+        with open(servers_path, 'w') as file:
+            json.dump(complete_server_info, file)
+
+        # Act
+        repository = SqliteServerRepository(str(tmp_path / TEST_DATABASE), servers_path)
+        result = repository.servers
+
+        # Assert
+        assert len(result) == 1
+        assert result[0].name == TEST_SERVER
+        assert result[0].birthday_channel.name == 'birthday-channel'
+        assert result[0].event_channel.announcement_rol == 2
+
+    def test_when_json_file_doesnt_exist(self, tmp_path):
+        # Act
+        repository = SqliteServerRepository(str(tmp_path / TEST_DATABASE), str(tmp_path / TEST_JSON))
+        result = repository.servers
+
+        # Assert
+        assert len(result) == 0
+
+    def test_when_database_was_already_migrated(self, tmp_path, complete_server_info):
+        # Arrange
+        database_path = str(tmp_path / TEST_DATABASE)
+        servers_path = str(tmp_path / TEST_JSON)
+        SqliteServerRepository(database_path, servers_path).close()
+        with open(servers_path, 'w') as file:
+            json.dump(complete_server_info, file)
+
+        # Act
+        repository = SqliteServerRepository(database_path, servers_path)
+        result = repository.servers
+
+        # Assert
+        assert len(result) == 0
+
+
+class TestFindServerById:
+
+    def test_when_server_is_found(self, tmp_path, complete_server_info):
+        # Arrange
+        servers_path = str(tmp_path / TEST_JSON)
+        with open(servers_path, 'w') as file:
+            json.dump(complete_server_info, file)
+        repository = SqliteServerRepository(str(tmp_path / TEST_DATABASE), servers_path)
+
+        # Act
+        result = repository.find_server_by_id(1)
+
+        # Assert
+        assert result.name == TEST_SERVER
+        assert result.event_channel.name == 'event-channel'
+
+    def test_when_server_is_not_found(self, tmp_path):
+        # Arrange
+        repository = SqliteServerRepository(str(tmp_path / TEST_DATABASE))
+
+        # Act
+        result = repository.find_server_by_id(1)
+
+        # Assert
+        assert result is None
+
+
+class TestSaveServer:
+
+    def test_when_server_is_created(self, tmp_path):
+        # Arrange
+        database_path = str(tmp_path / TEST_DATABASE)
+        repository = SqliteServerRepository(database_path)
+
+        # Act
+        repository.create_server(1, TEST_SERVER, 2, 'Test Channel', ChannelType.BIRTHDAY, 3)
+        repository.close()
+
+        # Assert
+        result = SqliteServerRepository(database_path).find_server_by_id(1)
+        assert result.name == TEST_SERVER
+        assert result.birthday_channel.channel_id == 2
+        assert result.birthday_channel.announcement_rol == 3
+        assert result.event_channel is None
+
+    def test_when_channel_is_removed(self, tmp_path, complete_server_info):
+        # Arrange
+        servers_path = str(tmp_path / TEST_JSON)
+        with open(servers_path, 'w') as file:
+            json.dump(complete_server_info, file)
+        repository = SqliteServerRepository(str(tmp_path / TEST_DATABASE), servers_path)
+
+        # Act
+        repository.remove_server_channel(1, ChannelType.BIRTHDAY)
+
+        # Assert
+        result = repository.find_server_by_id(1)
+        assert result.birthday_channel is None
+        assert result.event_channel is not None
+
+    def test_when_servers_keep_their_order(self, tmp_path):
+        # Arrange
+        repository = SqliteServerRepository(str(tmp_path / TEST_DATABASE))
+        repository.create_server(2, 'Second Server', 1, 'Test Channel', ChannelType.EVENT, 1)
+        repository.create_server(1, TEST_SERVER, 1, 'Test Channel', ChannelType.EVENT, 1)
+
+        # Act
+        repository.create_server(2, 'Second Server', 1, 'Test Channel', ChannelType.BIRTHDAY, 1)
+
+        # Assert
+        assert [server.server_id for server in repository.servers] == [2, 1]
@@ -0,0 +1,185 @@
+import asyncio
+from unittest.mock import Mock, patch
+
+from aiohttp import ClientError
+from discord import HTTPException
+
+from command.broadcaster import Broadcaster, BroadcastMessage, TokenBucket, is_transient_error
+from tests.mocks import CoroutineMock
+
+EMBED_PAYLOAD = {'title': 'Test'}
+
+
+def build_http_error(status: int) -> HTTPException:
+    response = Mock()
+    response.status = status
+    return HTTPException(response, 'Ups')
+
+
+def build_bot(side_effect=None) -> Mock:
+    bot = Mock()
+    bot.http.send_message = CoroutineMock(side_effect=side_effect)
+    return bot
+
+
+class TestBroadcast:
+
+    def test_when_all_messages_are_sent(self):
+        # Arrange
+        bot = build_bot()
+        broadcaster = Broadcaster(bot)
+        messages = [BroadcastMessage(channel_id, '@here', EMBED_PAYLOAD, 'Server') for channel_id in range(20)]
+
+        # Act
+        report = asyncio.run(broadcaster.broadcast('Test', messages))
+
+        # Assert
+        assert bot.http.send_message.call_count == 20
+        bot.http.send_message.assert_any_await(19, '@here', embed=EMBED_PAYLOAD)
+        assert report.sent == 20
+        assert report.failures == []
+
+    def test_when_concurrency_is_bounded(self):
+        # Arrange
+        running = []
+        max_running = []
+
+        async def send_message(*_, **__):
+            running.append(1)
+            max_running.append(len(running))
+            await asyncio.sleep(0)
+            running.pop()
+
+        bot = build_bot(send_message)
+        broadcaster = Broadcaster(bot, max_concurrency=3)
+        messages = [BroadcastMessage(channel_id, '', EMBED_PAYLOAD) for channel_id in range(10)]
+
+        # Act
+        asyncio.run(broadcaster.broadcast('Test', messages))
+
+        # Assert
+        assert max(max_running) == 3
+
+    @patch('command.broadcaster.asyncio.sleep', new_callable=CoroutineMock)
+    def test_when_error_is_transient(self, mock_sleep):
+        # Arrange
+        bot = build_bot([build_http_error(503), ClientError('Ups'), None])
+        broadcaster = Broadcaster(bot, backoff=1.0)
+
+        # Act
+        report = asyncio.run(broadcaster.broadcast('Test', [BroadcastMessage(1, '', EMBED_PAYLOAD)]))
+
+        # Assert
+        assert bot.http.send_message.call_count == 3
+        assert [call[0][0] for call in mock_sleep.call_args_list] == [1.0, 2.0]
+        assert report.sent == 1
+
+    @patch('command.broadcaster.asyncio.sleep', new_callable=CoroutineMock)
+    def test_when_retries_are_exhausted(self, _):
+        # Arrange
+        bot = build_bot(build_http_error(500))
+        broadcaster = Broadcaster(bot, max_retries=2)
+        message = BroadcastMessage(1, '', EMBED_PAYLOAD, 'Server')
+
+        # Act
+        report = asyncio.run(broadcaster.broadcast('Test', [message]))
+
+        # Assert
+        assert bot.http.send_message.call_count == 3
+        assert report.sent == 0
+        assert report.failures[0][0] is message
+
+    def test_when_error_is_not_transient(self):
+        # Arrange
+        bot = build_bot([build_http_error(403), None])
+        broadcaster = Broadcaster(bot)
+        messages = [BroadcastMessage(1, '', EMBED_PAYLOAD), BroadcastMessage(2, '', EMBED_PAYLOAD)]
+
+        # Act
+        report = asyncio.run(broadcaster.broadcast('Test', messages))
+
+        # Assert
+        assert bot.http.send_message.call_count == 2
+        assert report.sent == 1
+        assert len(report.failures) == 1
+
+
+class TestBroadcastShards:
+
+    def test_when_messages_are_in_several_shards(self):
+        # Arrange
+        bot = build_bot()
+        broadcaster = Broadcaster(bot)
+        messages_by_shard = {0: [BroadcastMessage(1, '', EMBED_PAYLOAD)],
+                             1: [BroadcastMessage(2, '', EMBED_PAYLOAD), BroadcastMessage(3, '', EMBED_PAYLOAD)]}
+
+        # Act
+        reports = asyncio.run(broadcaster.broadcast_shards('Test', messages_by_shard))
+
+        # Assert
+        assert bot.http.send_message.call_count == 3
+        assert [report.name for report in reports] == ['Test (shard 0)', 'Test (shard 1)']
+        assert [report.sent for report in reports] == [1, 2]
+
+    @patch('command.broadcaster.TokenBucket')
+    def test_when_shards_share_global_rate_limit(self, mock_token_bucket):
+        # Arrange
+        mock_token_bucket.return_value.acquire = CoroutineMock()
+        broadcaster = Broadcaster(build_bot(), global_rate=7, route_rate=2)
+        messages_by_shard = {0: [BroadcastMessage(1, '', EMBED_PAYLOAD)], 1: [BroadcastMessage(2, '', EMBED_PAYLOAD)]}
+
+        # Act
+        asyncio.run(broadcaster.broadcast_shards('Test', messages_by_shard))
+
+        # Assert
+        global_buckets = [call for call in mock_token_bucket.call_args_list if call[0][0] == 7]
+        assert len(global_buckets) == 1
+
+
+class TestTokenBucket:
+
+    @patch('command.broadcaster.asyncio.sleep', new_callable=CoroutineMock)
+    @patch('command.broadcaster.time.monotonic')
+    def test_when_rate_is_exceeded(self, mock_monotonic, mock_sleep):
+        # Arrange
+        mock_monotonic.return_value = 100.0
+
+        async def advance_time(seconds):
+            mock_monotonic.return_value += seconds
+
+        mock_sleep.side_effect = advance_time
+
+        async def acquire_three_times():
+            bucket = TokenBucket(2, 1.0)
+            for _ in range(3):
+                await bucket.acquire()
+
+        # Act
+        asyncio.run(acquire_three_times())
+
+        # Assert
+        mock_sleep.assert_called_once_with(0.5)
+
+
+class TestIsTransientError:
+
+    def test_when_error_is_a_rate_limit(self):
+        # Act
+        result = is_transient_error(build_http_error(429))
+
+        # Assert
+        assert result is True
+
+    def test_when_error_is_not_found(self):
+        # Act
+        result = is_transient_error(build_http_error(404))
+
+        # Assert
+        assert result is False
+
+    def test_when_error_is_a_timeout(self):
+        # Act
+        result = is_transient_error(asyncio.TimeoutError())
+
+        # Assert
+        assert result is True
@@ -0,0 +1,196 @@
+import asyncio
+from unittest.mock import Mock
+
+from command.configuration.model.channel_type import ChannelType
+from command.configuration.model.server import Server, Channel
+from command.configuration.repository.server_repository import ServerRepository
+from command.routing_table import RoutingTable
+
+BIRTHDAY_CHANNEL_ID = 10
+EVENT_CHANNEL_ID = 20
+ROLE_ID = 30
+
+
+def build_guild(guild_id: int, channel_ids: list = None, role_ids: list = None, shard_id: int = None) -> Mock:
+    guild = Mock()
+    guild.id = guild_id
+    guild.shard_id = shard_id
+    guild.name = 'Guild {0}'.format(guild_id)
+    channel_ids = channel_ids if channel_ids is not None else [BIRTHDAY_CHANNEL_ID, EVENT_CHANNEL_ID]
+    role_ids = role_ids if role_ids is not None else [ROLE_ID]
+    guild.get_channel.side_effect = lambda channel_id: Mock() if channel_id in channel_ids else None
+
+    def get_role(role_id):
+        if role_id not in role_ids:
+            return None
+        role = Mock()
+        role.mention = '<@&{0}>'.format(role_id)
+        return role
+
+    guild.get_role.side_effect = get_role
+    return guild
+
+
+def build_server(server_id: int, with_event_channel: bool = True) -> Server:
+    server = Server(server_id, 'Server {0}'.format(server_id))
+    server.add_birthday_channel(Channel(BIRTHDAY_CHANNEL_ID, 'birthday-channel', ROLE_ID))
+    if with_event_channel:
+        server.add_event_channel(Channel(EVENT_CHANNEL_ID, 'event-channel', ROLE_ID))
+    return server
+
+
+def build_routing_table(guilds: list, servers: list) -> tuple:
+    bot = Mock()
+    bot.guilds = guilds
+    bot.get_guild.side_effect = lambda guild_id: next((guild for guild in guilds if guild.id == guild_id), None)
+    servers_by_id = {server.server_id: server for server in servers}
+    server_repository = Mock(spec=ServerRepository)
+    server_repository.find_server_by_id.side_effect = servers_by_id.get
+    return RoutingTable(bot, server_repository), bot, server_repository
+
+
+class TestGetRoutes:
+
+    def test_when_guilds_are_configured(self):
+        # Arrange
+        routing_table, _, _ = build_routing_table([build_guild(1), build_guild(2), build_guild(3)],
+                                                  [build_server(1), build_server(2, with_event_channel=False)])
+
+        # Act
+        result = routing_table.get_routes(ChannelType.EVENT)
+
+        # Assert
+        assert len(result) == 1
+        assert result[0].guild_id == 1
+        assert result[0].channel_id == EVENT_CHANNEL_ID
+        assert result[0].mention == '<@&{0}>'.format(ROLE_ID)
+        assert [route.guild_id for route in routing_table.get_routes(ChannelType.BIRTHDAY)] == [1, 2]
+
+    def test_when_channel_or_role_dont_exist(self):
+        # Arrange
+        routing_table, _, _ = build_routing_table([build_guild(1, channel_ids=[BIRTHDAY_CHANNEL_ID], role_ids=[])],
+                                                  [build_server(1)])
+
+        # Act
+        result = routing_table.get_routes(ChannelType.BIRTHDAY)
+
+        # Assert
+        assert result[0].mention == ''
+        assert routing_table.get_routes(ChannelType.EVENT) == []
+
+    def test_when_routes_are_already_built(self):
+        # Arrange
+        routing_table, _, server_repository = build_routing_table([build_guild(1)], [build_server(1)])
+        routing_table.get_routes(ChannelType.EVENT)
+
+        # Act
+        routing_table.get_routes(ChannelType.EVENT)
+
+        # Assert
+        assert server_repository.find_server_by_id.call_count == 1
+
+
+class TestGetMessagesByShard:
+
+    def test_when_guilds_are_in_different_shards(self):
+        # Arrange
+        guilds = [build_guild(1, shard_id=0), build_guild(2, shard_id=1), build_guild(3, shard_id=1)]
+        routing_table, _, _ = build_routing_table(guilds, [build_server(1), build_server(2), build_server(3)])
+        embed_payload = {'title': 'Test'}
+
+        # Act
+        result = routing_table.get_messages_by_shard(ChannelType.EVENT, embed_payload)
+
+        # Assert
+        assert [message.label for message in result[0]] == ['Guild 1']
+        assert [message.label for message in result[1]] == ['Guild 2', 'Guild 3']
+        assert result[1][0].embed_payload is embed_payload
+        assert result[1][0].content == '<@&{0}>'.format(ROLE_ID)
+
+    def test_when_bot_is_not_sharded(self):
+        # Arrange
+        routing_table, _, _ = build_routing_table([build_guild(1), build_guild(2)], [build_server(1), build_server(2)])
+
+        # Act
+        result = routing_table.get_messages_by_shard(ChannelType.BIRTHDAY, {})
+
+        # Assert
+        assert list(result) == [0]
+        assert len(result[0]) == 2
+
+
+class TestUpdateServer:
+
+    def test_when_server_configuration_changed(self):
+        # Arrange
+        routing_table, _, _ = build_routing_table([build_guild(1), build_guild(2)], [build_server(1)])
+        routing_table.get_routes(ChannelType.EVENT)
+
+        # Act
+        routing_table.update_server(2, build_server(2))
+
+        # Assert
+        assert [route.guild_id for route in routing_table.get_routes(ChannelType.EVENT)] == [1, 2]
+
+    def test_when_server_was_removed(self):
+        # Arrange
+        routing_table, _, _ = build_routing_table([build_guild(1)], [build_server(1)])
+        routing_table.get_routes(ChannelType.EVENT)
+
+        # Act
+        routing_table.update_server(1, None)
+
+        # Assert
+        assert routing_table.get_routes(ChannelType.EVENT) == []
+
+
+class TestGuildEvents:
+
+    def test_when_bot_joins_a_guild(self):
+        # Arrange
+        guild = build_guild(2)
+        routing_table, bot, _ = build_routing_table([build_guild(1)], [build_server(1), build_server(2)])
+        routing_table.get_routes(ChannelType.EVENT)
+
+        # Act
+        asyncio.run(routing_table.update_guild(guild))
+
+        # Assert
+        assert [route.guild_id for route in routing_table.get_routes(ChannelType.EVENT)] == [1, 2]
+
+    def test_when_bot_leaves_a_guild(self):
+        # Arrange
+        guild = build_guild(1)
+        routing_table, _, _ = build_routing_table([guild], [build_server(1)])
+        routing_table.get_routes(ChannelType.EVENT)
+
+        # Act
+        asyncio.run(routing_table.remove_guild(guild))
+
+        # Assert
+        assert routing_table.get_routes(ChannelType.EVENT) == []
+        assert routing_table.get_routes(ChannelType.BIRTHDAY) == []
+
+    def test_when_role_is_deleted(self):
+        # Arrange
+        guild = build_guild(1)
+        routing_table, _, _ = build_routing_table([guild], [build_server(1)])
+        routing_table.get_routes(ChannelType.EVENT)
+        guild.get_role.side_effect = lambda _: None
+        role = Mock()
+        role.guild = guild
+
+        # Act
+        asyncio.run(routing_table.on_guild_role_change(role))
+
+        # Assert
+        assert routing_table.get_routes(ChannelType.EVENT)[0].mention == ''
+
+    def test_when_listeners_are_registered(self):
+        # Act
+        routing_table, bot, server_repository = build_routing_table([], [])
+
+        # Assert
+        server_repository.add_listener.assert_called_once_with(routing_table.update_server)
+        bot.add_listener.assert_any_call(routing_table.update_guild, 'on_guild_join')
+        bot.add_listener.assert_any_call(routing_table.remove_guild, 'on_guild_remove')
@@ -0,0 +1,157 @@
+import asyncio
+import json
+from datetime import datetime, date, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from command.scheduler import Scheduler
+from tests.mocks import CoroutineMock
+
+STATE_FILE = 'scheduler.json'
+UTC_OFFSET = -5
+JOB_NAME = 'birthday_reminder'
+
+
+def build_now(hour: int, minute: int = 0, day: int = 10) -> datetime:
+    return datetime(2021, 6, day, hour, minute, tzinfo=timezone(timedelta(hours=UTC_OFFSET)))
+
+
+@pytest.fixture
+def state_path(tmp_path) -> str:
+    return str(tmp_path / STATE_FILE)
+
+
+class TestGetNextRun:
+
+    def test_when_time_of_today_didnt_pass(self, state_path):
+        # Arrange
+        scheduler = Scheduler(state_path, UTC_OFFSET)
+        scheduler.add_job(JOB_NAME, '12:30', CoroutineMock())
+
+        # Act
+        with patch.object(scheduler, 'now', return_value=build_now(8)):
+            result = scheduler.get_next_run(JOB_NAME)
+
+        # Assert
+        assert result == build_now(12, 30)
+        assert result.utcoffset() == timedelta(hours=UTC_OFFSET)
+
+    def test_when_task_already_ran_today(self, state_path):
+        # Arrange
+        with open(state_path, 'w') as file:
+            json.dump({JOB_NAME: '2021-06-10'}, file)
+        scheduler = Scheduler(state_path, UTC_OFFSET)
+        scheduler.add_job(JOB_NAME, '12:30', CoroutineMock())
+
+        # Act
+        with patch.object(scheduler, 'now', return_value=build_now(13)):
+            result = scheduler.get_next_run(JOB_NAME)
+
+        # Assert
+        assert result == build_now(12, 30, day=11)
+
+    def test_when_task_doesnt_exist(self, state_path):
+        # Arrange
+        scheduler = Scheduler(state_path, UTC_OFFSET)
+
+        # Act
+        result = scheduler.get_next_run(JOB_NAME)
+
+        # Assert
+        assert result is None
+
+
+class TestRunPending:
+
+    def test_when_task_is_due(self, state_path):
+        # Arrange
+        callback = CoroutineMock()
+        scheduler = Scheduler(state_path, UTC_OFFSET)
+        scheduler.add_job(JOB_NAME, '12:30', callback)
+
+        # Act
+        with patch.object(scheduler, 'now', return_value=build_now(12, 30)):
+            asyncio.run(scheduler.run_pending())
+
+        # Assert
+        callback.assert_called_once()
+        with open(state_path) as file:
+            assert json.load(file) == {JOB_NAME: '2021-06-10'}
+
+    def test_when_task_is_not_due(self, state_path):
+        # Arrange
+        callback = CoroutineMock()
+        scheduler = Scheduler(state_path, UTC_OFFSET)
+        scheduler.add_job(JOB_NAME, '12:30', callback)
+
+        # Act
+        with patch.object(scheduler, 'now', return_value=build_now(12, 29)):
+            asyncio.run(scheduler.run_pending())
+
+        # Assert
+        callback.assert_not_called()
+
+    def test_when_bot_restarts_after_run(self, state_path):
+        # Arrange
+        callback = CoroutineMock()
+        scheduler = Scheduler(state_path, UTC_OFFSET)
+        scheduler.add_job(JOB_NAME, '12:30', callback)
+        with patch.object(scheduler, 'now', return_value=build_now(13)):
+            asyncio.run(scheduler.run_pending())
+        restarted_scheduler = Scheduler(state_path, UTC_OFFSET)
+        restarted_scheduler.add_job(JOB_NAME, '12:30', callback)
+
+        # Act
+        with patch.object(restarted_scheduler, 'now', return_value=build_now(23, 59)):
+            asyncio.run(restarted_scheduler.run_pending())
+
+        # Assert
+        callback.assert_called_once()
+
+    def test_when_runs_were_missed(self, state_path):
+        # Arrange
+        with open(state_path, 'w') as file:
+            json.dump({JOB_NAME: '2021-06-07'}, file)
+        callback = CoroutineMock()
+        scheduler = Scheduler(state_path, UTC_OFFSET)
+        scheduler.add_job(JOB_NAME, '12:30', callback)
+
+        # Act
+        with patch.object(scheduler, 'now', return_value=build_now(18)):
+            asyncio.run(scheduler.run_pending())
+            asyncio.run(scheduler.run_pending())
+
+        # Assert
+        callback.assert_called_once()
+        assert scheduler.last_runs[JOB_NAME] == date(2021, 6, 10)
+
+    def test_when_task_fails(self, state_path):
+        # Arrange
+        callback = CoroutineMock(side_effect=Exception('Test'))
+        scheduler = Scheduler(state_path, UTC_OFFSET)
+        scheduler.add_job(JOB_NAME, '12:30', callback)
+
+        # Act
+        with patch.object(scheduler, 'now', return_value=build_now(13)):
+            asyncio.run(scheduler.run_pending())
+            result = scheduler.get_next_run(JOB_NAME)
+
+        # Assert
+        callback.assert_called_once()
+        assert result == build_now(12, 30, day=11)
+
+    def test_when_state_file_is_corrupted(self, state_path):
+        # Arrange
+        with open(state_path, 'w') as file:
+            file.write('{"birthday_reminder": ')
+        callback = CoroutineMock()
+        scheduler = Scheduler(state_path, UTC_OFFSET)
+        scheduler.add_job(JOB_NAME, '12:30', callback)
+
+        # Act
+        with patch.object(scheduler, 'now', return_value=build_now(13)):
+            asyncio.run(scheduler.run_pending())
+
+        # Assert
+        callback.assert_called_once()
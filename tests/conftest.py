@@ -1,13 +1,16 @@
+import json
 from datetime import datetime, timedelta
-from unittest.mock import Mock
+from unittest.mock import Mock, MagicMock
 
 import pytest
+from aiohttp import ClientResponseError
 from discord import Role, TextChannel, Guild
 from requests import Response, HTTPError
 
 from command.configuration.model.server import Channel, Server
 from karthuria.model.character import Character, Dress, Enemy, Equip
 from karthuria.model.event import Event, Challenge, Boss
+from tests.mocks import AsyncContextManagerMock, CoroutineMock
 
 
 @pytest.fixture
@@ -67,6 +70,8 @@ def ok_characters_response():
     """
     response = Mock(spec=Response)
     response.ok = True
+    response.status_code = 200
+    response.headers = {}
     response.json.return_value = get_characters_sample_response()
 
     return response
@@ -81,6 +86,8 @@ def bad_response():
     """
     response = Mock(spec=Response)
     response.ok = False
+    response.status_code = 500
+    response.headers = {}
     response.raise_for_status.side_effect = HTTPError('Ups')
 
     return response
@@ -95,6 +102,8 @@ def ok_character_response():
     """
     response = Mock(spec=Response)
     response.ok = True
+    response.status_code = 200
+    response.headers = {}
     response.json.return_value = get_character_sample_response()
 
     return response
@@ -109,6 +118,8 @@ def ok_dress_response():
     """
     response = Mock(spec=Response)
     response.ok = True
+    response.status_code = 200
+    response.headers = {}
     response.json.return_value = get_dress_sample_response()
 
     return response
@@ -123,6 +134,8 @@ def ok_dresses_response():
     """
     response = Mock(spec=Response)
     response.ok = True
+    response.status_code = 200
+    response.headers = {}
     response.json.return_value = get_dresses_sample_response()
 
     return response
@@ -137,6 +150,8 @@ def ok_equips_response():
     """
     response = Mock(spec=Response)
     response.ok = True
+    response.status_code = 200
+    response.headers = {}
     response.json.return_value = get_equips_sample_response()
 
     return response
@@ -151,6 +166,8 @@ def ok_enemy_response():
     """
     response = Mock(spec=Response)
     response.ok = True
+    response.status_code = 200
+    response.headers = {}
     response.json.return_value = get_enemy_sample_response()
 
     return response
@@ -165,6 +182,8 @@ def ok_events_response():
     """
     response = Mock(spec=Response)
     response.ok = True
+    response.status_code = 200
+    response.headers = {}
     response.json.return_value = get_events_sample_response()
 
     return response
@@ -179,6 +198,8 @@ def ok_current_events_response():
     """
     response = Mock(spec=Response)
     response.ok = True
+    response.status_code = 200
+    response.headers = {}
     response.json.return_value = get_current_events_sample_response()
 
     return response
@@ -194,6 +215,8 @@ def only_challenge_current_events_response():
     complete_response = get_current_events_sample_response()
     response = Mock(spec=Response)
     response.ok = True
+    response.status_code = 200
+    response.headers = {}
     response.json.return_value = {
         'rogue': complete_response['rogue']
     }
@@ -201,6 +224,31 @@ def only_challenge_current_events_response():
     return response
 
 
+@pytest.fixture()
+def async_session():
+    """
+    Fixture to build an aiohttp session mock that always answers with the same response
+
+    :return: A function that receives the status, json body and headers of the response and returns the session mock
+    """
+
+    def build_session(status: int = 200, body: dict = None, headers: dict = None) -> MagicMock:
+        response = MagicMock()
+        response.status = status
+        response.headers = headers if headers is not None else {}
+        response.json = CoroutineMock(return_value=body)
+        response.read = CoroutineMock(return_value=json.dumps(body).encode('utf-8'))
+        if status >= 400:
+            response.raise_for_status.side_effect = ClientResponseError(Mock(), (), status=status, message='Ups')
+
+        session = MagicMock()
+        session.closed = False
+        session.get.return_value = AsyncContextManagerMock(response)
+        return session
+
+    return build_session
+
+
 @pytest.fixture()
 def complete_server_info():
     return [{
@@ -0,0 +1,125 @@
+import os
+import time
+
+from karthuria.cache.disk_cache import DiskCache, get_file_name
+
+TEST_TTL = {'/event/ww/current.json': 300, '/dress/*': 600}
+TEST_PATH = '/dress/1.json'
+
+
+class TestGetTtl:
+
+    def test_when_path_matches_a_pattern(self, tmp_path):
+        # Arrange
+        cache = DiskCache(str(tmp_path), ttl=TEST_TTL)
+
+        # Act
+        result = cache.get_ttl(TEST_PATH)
+
+        # Assert
+        assert result == 600
+
+    def test_when_path_does_not_match_any_pattern(self, tmp_path):
+        # Arrange
+        cache = DiskCache(str(tmp_path), ttl=TEST_TTL)
+
+        # Act
+        result = cache.get_ttl('/dress.json')
+
+        # Assert
+        assert result == 0
+
+
+class TestPut:
+
+    def test_when_response_is_saved(self, tmp_path):
+        # Arrange
+        cache = DiskCache(str(tmp_path), ttl=TEST_TTL)
+
+        # Act
+        cache.put(TEST_PATH, b'{"basicInfo": {}}', {'ETag': '"v1"'})
+        result = cache.get(TEST_PATH)
+
+        # Assert
+        assert result.body == b'{"basicInfo": {}}'
+        assert result.etag == '"v1"'
+        assert result.last_modified is None
+        assert cache.is_fresh(TEST_PATH, result)
+        assert [file for file in os.listdir(str(tmp_path)) if file.endswith('.tmp')] == []
+
+    def test_when_path_is_not_cached(self, tmp_path):
+        # Arrange
+        cache = DiskCache(str(tmp_path), ttl=TEST_TTL)
+
+        # Act
+        cache.put('/chara.json', b'{}', {})
+        result = cache.get('/chara.json')
+
+        # Assert
+        assert result is None
+        assert os.listdir(str(tmp_path)) == []
+
+    def test_when_max_bytes_are_exceeded(self, tmp_path):
+        # Arrange
+        body = b'x' * 100
+        cache = DiskCache(str(tmp_path), max_bytes=350, ttl=TEST_TTL)
+        cache.put('/dress/1.json', body, {})
+        cache.put('/dress/2.json', body, {})
+        cache.get('/dress/1.json')
+
+        # Act
+        cache.put('/dress/3.json', body, {})
+
+        # Assert
+        assert cache.get('/dress/1.json') is not None
+        assert cache.get('/dress/2.json') is None
+        assert cache.get('/dress/3.json') is not None
+        assert cache.total_bytes <= 350
+
+
+class TestIsFresh:
+
+    def test_when_ttl_expired(self, tmp_path):
+        # Arrange
+        cache = DiskCache(str(tmp_path), ttl=TEST_TTL)
+        cache.put(TEST_PATH, b'{}', {})
+        old_time = time.time() - 601
+        os.utime(os.path.join(str(tmp_path), get_file_name(TEST_PATH)), (old_time, old_time))
+
+        # Act
+        result = cache.is_fresh(TEST_PATH, cache.get(TEST_PATH))
+
+        # Assert
+        assert result is False
+
+    def test_when_expired_entry_is_touched(self, tmp_path):
+        # Arrange
+        cache = DiskCache(str(tmp_path), ttl=TEST_TTL)
+        cache.put(TEST_PATH, b'{}', {})
+        old_time = time.time() - 601
+        os.utime(os.path.join(str(tmp_path), get_file_name(TEST_PATH)), (old_time, old_time))
+
+        # Act
+        cache.touch(TEST_PATH)
+        result = cache.is_fresh(TEST_PATH, cache.get(TEST_PATH))
+
+        # Assert
+        assert result is True
+
+
+class TestLoadEntries:
+
+    def test_when_cache_is_restarted(self, tmp_path):
+        # Arrange
+        cache = DiskCache(str(tmp_path), ttl=TEST_TTL)
+        cache.put(TEST_PATH, b'{}', {'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+        open(os.path.join(str(tmp_path), 'interrupted.tmp'), 'w').close()
+
+        # Act
+        restarted_cache = DiskCache(str(tmp_path), ttl=TEST_TTL)
+        result = restarted_cache.get(TEST_PATH)
+
+        # Assert
+        assert result.get_headers() == {'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+        assert restarted_cache.total_bytes == cache.total_bytes
+        assert not os.path.exists(os.path.join(str(tmp_path), 'interrupted.tmp'))
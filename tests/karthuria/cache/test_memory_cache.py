@@ -0,0 +1,89 @@
+from unittest.mock import patch
+
+from karthuria.cache.memory_cache import MemoryCache, MISSING
+
+
+class TestGet:
+
+    def test_when_key_was_not_saved(self):
+        # Arrange
+        cache = MemoryCache()
+
+        # Act
+        result = cache.get(1)
+
+        # Assert
+        assert result is MISSING
+        assert cache.stats() == {'entries': 0, 'hits': 0, 'misses': 1}
+
+    def test_when_key_was_saved(self, dress):
+        # Arrange
+        cache = MemoryCache()
+        cache.put(1, dress)
+
+        # Act
+        result = cache.get(1)
+
+        # Assert
+        assert result is dress
+        assert cache.stats() == {'entries': 1, 'hits': 1, 'misses': 0}
+
+    def test_when_key_was_saved_as_not_found(self):
+        # Arrange
+        cache = MemoryCache()
+        cache.put_not_found(1)
+
+        # Act
+        result = cache.get(1)
+
+        # Assert
+        assert result is None
+
+    @patch('karthuria.cache.memory_cache.time.monotonic')
+    def test_when_value_expired(self, mock_monotonic, dress):
+        # Arrange
+        cache = MemoryCache(ttl=60)
+        mock_monotonic.return_value = 100
+        cache.put(1, dress)
+        mock_monotonic.return_value = 160
+
+        # Act
+        result = cache.get(1)
+
+        # Assert
+        assert result is MISSING
+        assert cache.stats()['entries'] == 0
+
+    @patch('karthuria.cache.memory_cache.time.monotonic')
+    def test_when_not_found_key_expired(self, mock_monotonic, dress):
+        # Arrange
+        cache = MemoryCache(ttl=60, negative_ttl=10)
+        mock_monotonic.return_value = 100
+        cache.put(1, dress)
+        cache.put_not_found(2)
+        mock_monotonic.return_value = 120
+
+        # Act
+        result = cache.get(2)
+
+        # Assert
+        assert result is MISSING
+        assert cache.get(1) is dress
+
+
+class TestPut:
+
+    def test_when_max_entries_is_exceeded(self, dress):
+        # Arrange
+        cache = MemoryCache(max_entries=2)
+        cache.put(1, dress)
+        cache.put(2, dress)
+        cache.get(1)
+
+        # Act
+        cache.put(3, dress)
+
+        # Assert
+        assert cache.get(2) is MISSING
+        assert cache.get(1) is dress
+        assert cache.get(3) is dress
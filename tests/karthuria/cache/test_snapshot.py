@@ -0,0 +1,76 @@
+import pickle
+
+from karthuria.cache.snapshot import CatalogSnapshot
+
+ATTRIBUTES = ['dresses', 'dresses_by_id']
+
+
+class Catalog:
+
+    def __init__(self, dresses: list = None):
+        self.dresses = dresses or []
+        self.dresses_by_id = {dress.dress_id: dress for dress in self.dresses}
+
+
+class TestRestore:
+
+    def test_when_snapshot_was_saved(self, tmp_path, dress):
+        # Arrange
+        snapshot = CatalogSnapshot(str(tmp_path))
+        snapshot.save('dresses', Catalog([dress]), ATTRIBUTES)
+        catalog = Catalog()
+
+        # Act
+        result = snapshot.restore('dresses', catalog, ATTRIBUTES)
+
+        # Assert
+        assert result
+        assert catalog.dresses[0].name == dress.name
+        assert catalog.dresses_by_id[dress.dress_id] is catalog.dresses[0]
+
+    def test_when_snapshot_doesnt_exist(self, tmp_path):
+        # Arrange
+        snapshot = CatalogSnapshot(str(tmp_path))
+        catalog = Catalog()
+
+        # Act
+        result = snapshot.restore('dresses', catalog, ATTRIBUTES)
+
+        # Assert
+        assert not result
+        assert catalog.dresses == []
+
+    def test_when_snapshot_is_corrupted(self, tmp_path):
+        # Arrange
+        snapshot = CatalogSnapshot(str(tmp_path))
+        with open(snapshot.get_path('dresses'), 'wb') as file:
+            file.write(b'not a snapshot')
+
+        # Act
+        result = snapshot.restore('dresses', Catalog(), ATTRIBUTES)
+
+        # Assert
+        assert not result
+
+    def test_when_snapshot_is_outdated(self, tmp_path, dress):
+        # Arrange
+        snapshot = CatalogSnapshot(str(tmp_path))
+        with open(snapshot.get_path('dresses'), 'wb') as file:
+            pickle.dump((0, {'dresses': [dress], 'dresses_by_id': {}}), file)
+
+        # Act
+        result = snapshot.restore('dresses', Catalog(), ATTRIBUTES)
+
+        # Assert
+        assert not result
+
+    def test_when_snapshot_misses_attributes(self, tmp_path, dress):
+        # Arrange
+        snapshot = CatalogSnapshot(str(tmp_path))
+        snapshot.save('dresses', Catalog([dress]), ['dresses'])
+
+        # Act
+        result = snapshot.restore('dresses', Catalog(), ATTRIBUTES)
+
+        # Assert
+        assert not result
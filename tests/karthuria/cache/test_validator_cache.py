@@ -0,0 +1,55 @@
+from karthuria.cache.validator_cache import ValidatorCache
+
+TEST_PATH = '/event.json'
+
+
+class TestGetHeaders:
+
+    def test_when_path_was_not_stored(self):
+        # Arrange
+        cache = ValidatorCache()
+
+        # Act
+        result = cache.get_headers(TEST_PATH)
+
+        # Assert
+        assert result == {}
+
+    def test_when_path_has_both_validators(self):
+        # Arrange
+        cache = ValidatorCache()
+        cache.store(TEST_PATH, {'ETag': '"abc"', 'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}, [])
+        expected_headers = {'If-None-Match': '"abc"', 'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+
+        # Act
+        result = cache.get_headers(TEST_PATH)
+
+        # Assert
+        assert result == expected_headers
+
+
+class TestStore:
+
+    def test_when_response_has_validators(self, event):
+        # Arrange
+        cache = ValidatorCache()
+        events = [event]
+
+        # Act
+        cache.store(TEST_PATH, {'ETag': '"abc"'}, events)
+
+        # Assert
+        assert cache.get_value(TEST_PATH) is events
+        assert cache.get_headers(TEST_PATH) == {'If-None-Match': '"abc"'}
+
+    def test_when_response_has_no_validators(self, event):
+        # Arrange
+        cache = ValidatorCache()
+        cache.store(TEST_PATH, {'ETag': '"abc"'}, [event])
+
+        # Act
+        cache.store(TEST_PATH, {}, [event])
+
+        # Assert
+        assert cache.get_value(TEST_PATH) is None
+        assert cache.get_headers(TEST_PATH) == {}
@@ -0,0 +1,95 @@
+import asyncio
+import time
+from unittest.mock import Mock, patch
+
+from karthuria.repository.catalog_refresher import CatalogRefresher
+from karthuria.repository.equip_repository import EquipRepository
+
+
+def build_repository(refresh_result=True, loaded=True) -> Mock:
+    repository = Mock()
+    repository.loader.loaded = loaded
+    repository.refreshed_at = None
+
+    def refresh():
+        if isinstance(refresh_result, Exception):
+            raise refresh_result
+        if refresh_result:
+            repository.refreshed_at = time.time()
+        return refresh_result
+
+    repository.refresh.side_effect = refresh
+    return repository
+
+
+class TestRefreshDue:
+
+    @patch('karthuria.repository.catalog_refresher.time.monotonic')
+    def test_when_only_one_catalog_is_due(self, mock_monotonic):
+        # Arrange
+        mock_monotonic.return_value = 0
+        characters = build_repository()
+        events = build_repository()
+        refresher = CatalogRefresher({'characters': characters, 'events': events}, {'events': 60}, 3600)
+        mock_monotonic.return_value = 60
+
+        # Act
+        asyncio.run(refresher.refresh_due())
+
+        # Assert
+        characters.refresh.assert_not_called()
+        events.refresh.assert_called_once()
+        assert refresher.next_refreshes['events'] == 120
+
+    def test_when_catalog_was_never_loaded(self):
+        # Arrange
+        dresses = build_repository(loaded=False)
+        refresher = CatalogRefresher({'dresses': dresses}, default_interval=0)
+
+        # Act
+        asyncio.run(refresher.refresh_due())
+
+        # Assert
+        dresses.refresh.assert_not_called()
+
+
+class TestRefresh:
+
+    def test_when_refresh_is_successful(self):
+        # Arrange
+        refresher = CatalogRefresher({'equips': build_repository()})
+
+        # Act
+        result = asyncio.run(refresher.refresh('equips'))
+
+        # Assert
+        assert result
+        assert refresher.get_refresh_ages()['equips'] < 1
+        assert refresher.failures['equips'] == 0
+
+    def test_when_refresh_fails(self):
+        # Arrange
+        refresher = CatalogRefresher({'equips': build_repository(Exception('Ups'))})
+
+        # Act
+        result = asyncio.run(refresher.refresh('equips'))
+
+        # Assert
+        assert not result
+        assert refresher.get_refresh_ages() == {'equips': None}
+        assert refresher.failures['equips'] == 1
+
+    def test_when_catalog_keeps_old_data(self, equip):
+        # Arrange
+        mock_client = Mock()
+        mock_client.get_equips.return_value = [equip]
+        repository = EquipRepository(mock_client)
+        mock_client.get_equips.return_value = []
+        refresher = CatalogRefresher({'equips': repository})
+
+        # Act
+        result = asyncio.run(refresher.refresh('equips'))
+
+        # Assert
+        assert not result
+        assert repository.get_equips_by_character_id(104) == [equip]
@@ -1,9 +1,15 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import Mock, patch
 
+from aiohttp import ClientError
 from requests import HTTPError
 
+from karthuria.async_client import AsyncKarthuriaClient
+from karthuria.cache.snapshot import CatalogSnapshot
 from karthuria.client import KarthuriaClient
+from karthuria.model.character import Character
 from karthuria.repository.character_repository import CharacterRepository
+from tests.mocks import build_async_mock
 
 
 class TestLoadCharacters:
@@ -62,6 +68,77 @@ class TestGetCharactersByName:
         assert response is None
 
 
+class TestSearchCharactersByName:
+
+    def test_when_several_characters_are_found(self, character):
+        # Arrange
+        other_character = Character(105, 'Maya Tendo', 1, 8, 1)
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_characters.return_value = [other_character, character]
+        repository = CharacterRepository(mock_client)
+
+        # Act
+        response = repository.search_characters_by_name('a')
+
+        # Assert
+        assert response == [other_character, character]
+
+    def test_when_a_name_starts_with_the_query(self, character):
+        # Arrange
+        other_character = Character(105, 'Maya Tendo', 1, 8, 1)
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_characters.return_value = [other_character, character]
+        repository = CharacterRepository(mock_client)
+
+        # Act
+        response = repository.search_characters_by_name('Cl')
+
+        # Assert
+        assert response == [character]
+
+
+class TestCompleteCharacterName:
+
+    def test_when_last_name_starts_with_prefix(self, character):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_characters.return_value = [character]
+        repository = CharacterRepository(mock_client)
+
+        # Act
+        response = repository.complete_character_name('sai')
+
+        # Assert
+        assert response == [character]
+
+
+class TestGetCharacterById:
+
+    def test_when_character_is_found(self, character):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_characters.return_value = [character]
+        repository = CharacterRepository(mock_client)
+
+        # Act
+        response = repository.get_character_by_id(104)
+
+        # Assert
+        assert response is character
+
+    def test_when_character_is_not_found(self, character):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_characters.return_value = [character]
+        repository = CharacterRepository(mock_client)
+
+        # Act
+        response = repository.get_character_by_id(101)
+
+        # Assert
+        assert response is None
+
+
 class TestGetCharacterBirthday:
 
     def test_when_is_somebody_birthday(self, character):
@@ -90,3 +167,153 @@ class TestGetCharacterBirthday:
 
         # Assert
         assert response is None
+
+    def test_when_date_has_another_format(self, character):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_characters.return_value = [character]
+        repository = CharacterRepository(mock_client)
+
+        # Act
+        response = repository.get_character_birthday('2021-08-01')
+
+        # Assert
+        mock_client.get_character.assert_not_called()
+        assert response is None
+
+
+class TestGetCharacterBirthdayAsync:
+
+    def test_when_is_somebody_birthday(self, character):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_characters.return_value = [character]
+        mock_async_client = build_async_mock(AsyncKarthuriaClient)
+        mock_async_client.get_character.return_value = character
+        repository = CharacterRepository(mock_client, mock_async_client)
+        expected_name = 'Claudine Saijo'
+
+        # Act
+        response = asyncio.run(repository.get_character_birthday_async('01/08'))
+
+        # Assert
+        mock_async_client.get_character.assert_called_with(104)
+        assert response.name == expected_name
+
+    def test_when_character_could_not_be_retrieved(self, character):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_characters.return_value = [character]
+        mock_async_client = build_async_mock(AsyncKarthuriaClient)
+        mock_async_client.get_character.side_effect = ClientError('Ups')
+        repository = CharacterRepository(mock_client, mock_async_client)
+
+        # Act
+        response = asyncio.run(repository.get_character_birthday_async('01/08'))
+
+        # Assert
+        assert response is None
+
+
+class TestGetCharactersBirthdayAsync:
+
+    def test_when_several_characters_share_birthday(self, character):
+        # Arrange
+        other_character = Character(105, 'Maya Tendo', 1, 8, 1)
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_characters.return_value = [character, other_character]
+        mock_async_client = build_async_mock(AsyncKarthuriaClient)
+        mock_async_client.get_character.side_effect = [character, other_character]
+        repository = CharacterRepository(mock_client, mock_async_client)
+
+        # Act
+        response = asyncio.run(repository.get_characters_birthday_async('01/08'))
+
+        # Assert
+        assert response == [character, other_character]
+
+    def test_when_is_nobody_birthday(self, character):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_characters.return_value = [character]
+        mock_async_client = build_async_mock(AsyncKarthuriaClient)
+        repository = CharacterRepository(mock_client, mock_async_client)
+
+        # Act
+        response = asyncio.run(repository.get_characters_birthday_async('01/09'))
+
+        # Assert
+        mock_async_client.get_character.assert_not_called()
+        assert response == []
+
+    def test_when_one_character_could_not_be_retrieved(self, character):
+        # Arrange
+        other_character = Character(105, 'Maya Tendo', 1, 8, 1)
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_characters.return_value = [character, other_character]
+        mock_async_client = build_async_mock(AsyncKarthuriaClient)
+        mock_async_client.get_character.side_effect = [ClientError('Ups'), other_character]
+        repository = CharacterRepository(mock_client, mock_async_client)
+
+        # Act
+        response = asyncio.run(repository.get_characters_birthday_async('01/08'))
+
+        # Assert
+        assert response == [other_character]
+
+    def test_when_characters_are_lazy(self, character):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_characters.return_value = [character]
+        mock_async_client = build_async_mock(AsyncKarthuriaClient)
+        mock_async_client.get_character.return_value = character
+        repository = CharacterRepository(mock_client, mock_async_client, lazy=True)
+        mock_client.get_characters.assert_not_called()
+
+        # Act
+        response = asyncio.run(repository.get_character_birthday_async('01/08'))
+
+        # Assert
+        assert response is character
+        mock_client.get_characters.assert_called_once()
+
+
+class TestSnapshot:
+
+    def test_when_characters_are_loaded(self, tmp_path, character):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_characters.return_value = [character]
+        snapshot = CatalogSnapshot(str(tmp_path))
+        CharacterRepository(mock_client, snapshot=snapshot)
+        mock_client.get_characters.reset_mock()
+
+        # Act
+        with patch('karthuria.repository.character_repository.threading.Thread') as mock_thread:
+            repository = CharacterRepository(mock_client, snapshot=snapshot)
+            response = repository.get_character_by_name('claudine')
+
+        # Assert
+        assert response.name == 'Claudine Saijo'
+        assert repository.get_character_birthday('01/08') is not None
+        mock_thread.return_value.start.assert_called_once()
+        mock_client.get_characters.assert_not_called()
+
+    def test_when_refresh_after_snapshot_fails(self, tmp_path, character):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_characters.return_value = [character]
+        snapshot = CatalogSnapshot(str(tmp_path))
+        CharacterRepository(mock_client, snapshot=snapshot)
+        mock_client.get_characters.side_effect = HTTPError('Ups')
+        with patch('karthuria.repository.character_repository.threading.Thread') as mock_thread:
+            repository = CharacterRepository(mock_client, snapshot=snapshot)
+        refresh = mock_thread.call_args[1]['target']
+
+        # Act
+        refresh()
+
+        # Assert
+        assert len(repository.get_characters()) == 1
+        assert snapshot.restore('characters', CharacterRepository(Mock(spec=KarthuriaClient), lazy=True),
+                                ['characters'])
@@ -1,9 +1,25 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import Mock, patch
 
-from requests import HTTPError
+from aiohttp import ClientError
+from requests import HTTPError, Response
 
+from karthuria.async_client import AsyncKarthuriaClient
+from karthuria.cache.snapshot import CatalogSnapshot
+from karthuria.catalog_diff import IncrementalParser
 from karthuria.client import KarthuriaClient
+from karthuria.model.character import Dress
 from karthuria.repository.dress_repository import DressRepository
+from tests.mocks import build_async_mock
+
+
+def convert_dress(_, basic_info: dict) -> Dress:
+    return Dress(basic_info['cardID'], basic_info['name'], basic_info['rarity'], basic_info['character'])
+
+
+def build_dresses_json(*dresses: Dress) -> dict:
+    return {str(dress.dress_id): {'basicInfo': {'cardID': dress.dress_id, 'name': dress.name, 'rarity': dress.rarity,
+                                                'character': dress.character}} for dress in dresses}
 
 
 class TestGetDressById:
@@ -11,6 +27,7 @@ class TestGetDressById:
     def test_when_dress_is_found(self, dress):
         # Arrange
         mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_dresses.return_value = []
         mock_client.get_dress.return_value = dress
         repository = DressRepository(mock_client)
         expected_name = 'Dress Test'
@@ -24,6 +41,7 @@ class TestGetDressById:
     def test_when_dress_is_not_found(self):
         # Arrange
         mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_dresses.return_value = []
         mock_client.get_dress.side_effect = HTTPError('Ups')
         repository = DressRepository(mock_client)
 
@@ -34,6 +52,129 @@ class TestGetDressById:
         assert response is None
 
 
+    def test_when_dress_is_cached(self, dress):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_dresses.return_value = []
+        mock_client.get_dress.return_value = dress
+        repository = DressRepository(mock_client)
+        repository.get_dress_by_id(1)
+
+        # Act
+        response = repository.get_dress_by_id(1)
+
+        # Assert
+        mock_client.get_dress.assert_called_once_with(1)
+        assert response is dress
+
+    def test_when_dress_does_not_exist(self):
+        # Arrange
+        not_found_response = Mock(spec=Response)
+        not_found_response.status_code = 404
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_dresses.return_value = []
+        mock_client.get_dress.side_effect = HTTPError('Not Found', response=not_found_response)
+        repository = DressRepository(mock_client)
+        repository.get_dress_by_id(2)
+
+        # Act
+        response = repository.get_dress_by_id(2)
+
+        # Assert
+        mock_client.get_dress.assert_called_once_with(2)
+        assert response is None
+
+    def test_when_dress_request_fails(self):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_dresses.return_value = []
+        mock_client.get_dress.side_effect = HTTPError('Ups')
+        repository = DressRepository(mock_client)
+        repository.get_dress_by_id(2)
+
+        # Act
+        repository.get_dress_by_id(2)
+
+        # Assert
+        assert mock_client.get_dress.call_count == 2
+
+    def test_when_dress_is_in_catalog(self, dress):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_dresses.return_value = [dress]
+        repository = DressRepository(mock_client)
+
+        # Act
+        response = repository.get_dress_by_id(1)
+
+        # Assert
+        mock_client.get_dress.assert_not_called()
+        assert response is dress
+
+    def test_when_dress_is_not_in_catalog(self, dress):
+        # Arrange
+        new_dress = Dress(2, 'New Dress Test', 4, 104)
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_dresses.return_value = [dress]
+        mock_client.get_dress.return_value = new_dress
+        repository = DressRepository(mock_client)
+
+        # Act
+        response = repository.get_dress_by_id(2)
+
+        # Assert
+        mock_client.get_dress.assert_called_once_with(2)
+        assert response is new_dress
+        assert repository.get_dresses_by_character_id(104) == [dress, new_dress]
+
+
+class TestGetDressByIdAsync:
+
+    def test_when_dress_is_found(self, dress):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_dresses.return_value = []
+        mock_async_client = build_async_mock(AsyncKarthuriaClient)
+        mock_async_client.get_dress.return_value = dress
+        repository = DressRepository(mock_client, mock_async_client)
+        expected_name = 'Dress Test'
+
+        # Act
+        response = asyncio.run(repository.get_dress_by_id_async(1))
+
+        # Assert
+        mock_async_client.get_dress.assert_called_with(1)
+        assert response.name == expected_name
+
+    def test_when_dress_is_in_catalog(self, dress):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_dresses.return_value = [dress]
+        mock_async_client = build_async_mock(AsyncKarthuriaClient)
+        repository = DressRepository(mock_client, mock_async_client)
+
+        # Act
+        response = asyncio.run(repository.get_dress_by_id_async(1))
+
+        # Assert
+        mock_async_client.get_dress.assert_not_called()
+        assert response is dress
+
+    def test_when_dress_is_not_found(self):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_dresses.return_value = []
+        mock_async_client = build_async_mock(AsyncKarthuriaClient)
+        mock_async_client.get_dress.side_effect = ClientError('Ups')
+        repository = DressRepository(mock_client, mock_async_client)
+
+        # Act
+        response = asyncio.run(repository.get_dress_by_id_async(2))
+
+        # Assert
+        assert response is None
+
+
 class TestGetDressesByCharacterId:
 
     def test_when_character_dresses_are_found(self, dress):
@@ -61,3 +202,85 @@ class TestGetDressesByCharacterId:
 
         # Assert
         assert response is None
+
+    def test_when_catalog_has_several_characters(self, dress):
+        # Arrange
+        other_dress = Dress(2, 'Other Dress Test', 4, 105)
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_dresses.return_value = [dress, other_dress]
+        repository = DressRepository(mock_client)
+
+        # Act
+        response = repository.get_dresses_by_character_id(105)
+
+        # Assert
+        assert response == [other_dress]
+
+
+class TestSnapshot:
+
+    def test_when_dresses_are_refreshed_after_snapshot(self, tmp_path, dress):
+        # Arrange
+        new_dress = Dress(2, 'Dress Test 2', 4, 104)
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_dresses.return_value = [dress]
+        snapshot = CatalogSnapshot(str(tmp_path))
+        DressRepository(mock_client, snapshot=snapshot)
+        mock_client.get_dresses.return_value = [dress, new_dress]
+        with patch('karthuria.repository.dress_repository.threading.Thread') as mock_thread:
+            repository = DressRepository(mock_client, snapshot=snapshot)
+        dresses_before_refresh = repository.get_dresses_by_character_id(104)
+
+        # Act
+        mock_thread.call_args[1]['target']()
+
+        # Assert
+        assert len(dresses_before_refresh) == 1
+        assert repository.get_dresses_by_character_id(104) == [dress, new_dress]
+        assert repository.get_dress_by_id(2) is new_dress
+
+
+class TestRefresh:
+
+    def test_when_only_some_dresses_changed(self, dress):
+        # Arrange
+        parser = IncrementalParser()
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_dresses.return_value = parser.parse(
+            'dresses', build_dresses_json(dress, Dress(2, 'Removed', 4, 104), Dress(3, 'Other', 4, 101)), convert_dress)
+        repository = DressRepository(mock_client)
+        other_character_dresses = repository.get_dresses_by_character_id(101)
+        diffs = []
+        repository.add_listener(diffs.append)
+        mock_client.get_dresses.return_value = parser.parse(
+            'dresses', build_dresses_json(dress, Dress(3, 'Other', 4, 101), Dress(4, 'New', 4, 104)), convert_dress)
+
+        # Act
+        result = repository.refresh()
+
+        # Assert
+        assert result
+        assert str(diffs[0]) == 'dresses: 1 added, 0 changed, 1 removed'
+        assert [indexed.dress_id for indexed in repository.get_dresses_by_character_id(104)] == [1, 4]
+        assert 2 not in repository.dresses_by_id
+        assert repository.get_dresses_by_character_id(101) is other_character_dresses
+
+    def test_when_listener_fails(self, dress):
+        # Arrange
+        parser = IncrementalParser()
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_dresses.return_value = parser.parse('dresses', build_dresses_json(dress), convert_dress)
+        repository = DressRepository(mock_client)
+        diffs = []
+        repository.add_listener(Mock(side_effect=ValueError('Ups')))
+        repository.add_listener(diffs.append)
+        mock_client.get_dresses.return_value = parser.parse(
+            'dresses', build_dresses_json(dress, Dress(2, 'New', 4, 104)), convert_dress)
+
+        # Act
+        result = repository.refresh()
+
+        # Assert
+        assert result
+        assert len(diffs) == 1
+        assert repository.get_dress_by_id(2).name == 'New'
@@ -1,9 +1,13 @@
+import asyncio
 from unittest.mock import Mock
 
-from requests import HTTPError
+from aiohttp import ClientError
+from requests import HTTPError, Response
 
+from karthuria.async_client import AsyncKarthuriaClient
 from karthuria.client import KarthuriaClient
 from karthuria.repository.enemy_repository import EnemyRepository
+from tests.mocks import build_async_mock
 
 
 class TestGetEnemyById:
@@ -32,3 +36,75 @@ class TestGetEnemyById:
 
         # Assert
         assert response is None
+
+
+    def test_when_enemy_is_cached(self, enemy):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_enemy.return_value = enemy
+        repository = EnemyRepository(mock_client)
+        repository.get_enemy_by_id(1)
+
+        # Act
+        response = repository.get_enemy_by_id(1)
+
+        # Assert
+        mock_client.get_enemy.assert_called_once_with(1)
+        assert response is enemy
+
+    def test_when_enemy_does_not_exist(self):
+        # Arrange
+        not_found_response = Mock(spec=Response)
+        not_found_response.status_code = 404
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_enemy.side_effect = HTTPError('Not Found', response=not_found_response)
+        repository = EnemyRepository(mock_client)
+        repository.get_enemy_by_id(2)
+
+        # Act
+        response = repository.get_enemy_by_id(2)
+
+        # Assert
+        mock_client.get_enemy.assert_called_once_with(2)
+        assert response is None
+
+    def test_when_enemy_request_fails(self):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_enemy.side_effect = HTTPError('Ups')
+        repository = EnemyRepository(mock_client)
+        repository.get_enemy_by_id(2)
+
+        # Act
+        repository.get_enemy_by_id(2)
+
+        # Assert
+        assert mock_client.get_enemy.call_count == 2
+
+class TestGetEnemyByIdAsync:
+
+    def test_when_enemy_is_found(self, enemy):
+        # Arrange
+        mock_async_client = build_async_mock(AsyncKarthuriaClient)
+        mock_async_client.get_enemy.return_value = enemy
+        repository = EnemyRepository(Mock(spec=KarthuriaClient), mock_async_client)
+        expected_name = 'Enemy Test'
+
+        # Act
+        response = asyncio.run(repository.get_enemy_by_id_async(1))
+
+        # Assert
+        mock_async_client.get_enemy.assert_called_with(1)
+        assert response.name == expected_name
+
+    def test_when_enemy_is_not_found(self):
+        # Arrange
+        mock_async_client = build_async_mock(AsyncKarthuriaClient)
+        mock_async_client.get_enemy.side_effect = ClientError('Ups')
+        repository = EnemyRepository(Mock(spec=KarthuriaClient), mock_async_client)
+
+        # Act
+        response = asyncio.run(repository.get_enemy_by_id_async(2))
+
+        # Assert
+        assert response is None
@@ -2,10 +2,16 @@ from unittest.mock import Mock
 
 from requests import HTTPError
 
+from karthuria.catalog_diff import IncrementalParser
 from karthuria.client import KarthuriaClient
+from karthuria.model.character import Equip
 from karthuria.repository.equip_repository import EquipRepository
 
 
+def convert_equip(_, basic_info: dict) -> Equip:
+    return Equip(basic_info['id'], basic_info['characters'])
+
+
 class TestGetEquipByCharacterId:
 
     def test_when_character_equips_are_found(self, equip):
@@ -33,3 +39,93 @@ class TestGetEquipByCharacterId:
 
         # Assert
         assert response is None
+
+    def test_when_equip_has_several_characters(self, equip):
+        # Arrange
+        shared_equip = Equip(2, [101, 104])
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_equips.return_value = [equip, shared_equip, Equip(3, None)]
+        repository = EquipRepository(mock_client)
+
+        # Act
+        response = repository.get_equips_by_character_id(104)
+
+        # Assert
+        assert response == [equip, shared_equip]
+        assert repository.get_equips_by_character_id(101) == [shared_equip]
+
+    def test_when_catalog_is_lazy(self, equip):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_equips.return_value = [equip]
+        repository = EquipRepository(mock_client, lazy=True)
+        mock_client.get_equips.assert_not_called()
+
+        # Act
+        response = repository.get_equips_by_character_id(104)
+        repository.get_equips_by_character_id(104)
+
+        # Assert
+        assert response == [equip]
+        mock_client.get_equips.assert_called_once()
+
+
+class TestRefresh:
+
+    def test_when_catalog_changed(self, equip):
+        # Arrange
+        new_equip = Equip(2, [104])
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_equips.return_value = [equip]
+        repository = EquipRepository(mock_client)
+        mock_client.get_equips.return_value = [equip, new_equip]
+
+        # Act
+        result = repository.refresh()
+
+        # Assert
+        assert result
+        assert repository.get_equips_by_character_id(104) == [equip, new_equip]
+        assert repository.refreshed_at is not None
+
+    def test_when_catalog_didnt_change(self, equip):
+        # Arrange
+        equips = [equip]
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_equips.return_value = equips
+        repository = EquipRepository(mock_client)
+        equips_by_character = repository.equips_by_character
+
+        # Act
+        result = repository.refresh()
+
+        # Assert
+        assert result
+        assert repository.equips_by_character is equips_by_character
+
+    def test_when_only_some_equips_changed(self):
+        # Arrange
+        parser = IncrementalParser()
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_equips.return_value = parser.parse('equips', {
+            '1': {'basicInfo': {'id': 1, 'characters': [104]}},
+            '2': {'basicInfo': {'id': 2, 'characters': [101]}}
+        }, convert_equip)
+        repository = EquipRepository(mock_client)
+        other_character_equips = repository.get_equips_by_character_id(101)
+        diffs = []
+        repository.add_listener(diffs.append)
+        mock_client.get_equips.return_value = parser.parse('equips', {
+            '1': {'basicInfo': {'id': 1, 'characters': [104, 105]}},
+            '2': {'basicInfo': {'id': 2, 'characters': [101]}}
+        }, convert_equip)
+
+        # Act
+        result = repository.refresh()
+
+        # Assert
+        assert result
+        assert len(diffs) == 1
+        assert len(diffs[0].changed) == 1
+        assert repository.get_equips_by_character_id(105)[0].equip_id == 1
+        assert repository.get_equips_by_character_id(101) is other_character_equips
@@ -1,11 +1,16 @@
+import asyncio
 import datetime
 from unittest.mock import Mock
 
+from aiohttp import ClientError
 from requests import HTTPError
 
-from karthuria.client import KarthuriaClient
+from karthuria.async_client import AsyncKarthuriaClient
+from karthuria.catalog_diff import IncrementalParser
+from karthuria.client import KarthuriaClient, parse_events_incrementally
 from karthuria.model.event import Event
 from karthuria.repository.event_repository import EventRepository
+from tests.mocks import build_async_mock
 
 
 class TestLoadEvents:
@@ -41,6 +46,7 @@ class TestGetCurrentEvents:
     def test_when_all_events_are_present(self, complete_current_events):
         # Arrange
         mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_events.return_value = []
         mock_client.get_current_events.return_value = complete_current_events
         repository = EventRepository(mock_client)
 
@@ -60,6 +66,7 @@ class TestGetCurrentEvents:
     def test_when_current_events_are_unsuccessful(self):
         # Arrange
         mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_events.return_value = []
         mock_client.get_current_events.side_effect = HTTPError('Ups')
         repository = EventRepository(mock_client)
 
@@ -70,6 +77,39 @@ class TestGetCurrentEvents:
         assert len(response) == 0
 
 
+class TestGetCurrentEventsAsync:
+
+    def test_when_all_events_are_present(self, complete_current_events):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_events.return_value = []
+        mock_async_client = build_async_mock(AsyncKarthuriaClient)
+        mock_async_client.get_current_events.return_value = complete_current_events
+        repository = EventRepository(mock_client, mock_async_client)
+
+        # Act
+        response = asyncio.run(repository.get_current_events_async())
+
+        # Assert
+        assert response['events'][0].event_id == 1
+        assert response['challenges'][0].event_id == 2
+        assert response['bosses'][0].event_id == 3
+
+    def test_when_current_events_are_unsuccessful(self):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_events.return_value = []
+        mock_async_client = build_async_mock(AsyncKarthuriaClient)
+        mock_async_client.get_current_events.side_effect = ClientError('Ups')
+        repository = EventRepository(mock_client, mock_async_client)
+
+        # Act
+        response = asyncio.run(repository.get_current_events_async())
+
+        # Assert
+        assert len(response) == 0
+
+
 class TestGetEventNameById:
 
     def test_when_event_is_found(self, event):
@@ -97,6 +137,64 @@ class TestGetEventNameById:
         # Assert
         assert response is None
 
+    def test_when_id_is_a_string(self, event):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_events.return_value = [event]
+        repository = EventRepository(mock_client)
+        expected_name = 'Event Test'
+
+        # Act
+        response = repository.get_event_name_by_id('1')
+
+        # Assert
+        assert response == expected_name
+
+    def test_when_events_are_lazy(self, event):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_events.return_value = [event]
+        repository = EventRepository(mock_client, lazy=True)
+        mock_client.get_events.assert_not_called()
+
+        # Act
+        response = repository.get_event_name_by_id(1)
+
+        # Assert
+        assert response == 'Event Test'
+        mock_client.get_events.assert_called_once()
+
+
+class TestGetEventNameByIdAsync:
+
+    def test_when_events_are_lazy(self, event):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_events.return_value = [event]
+        repository = EventRepository(mock_client, lazy=True)
+
+        # Act
+        response = asyncio.run(repository.get_event_name_by_id_async(1))
+
+        # Assert
+        assert response == 'Event Test'
+        mock_client.get_events.assert_called_once()
+
+    def test_when_events_were_reloaded(self, event):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_async_client = build_async_mock(AsyncKarthuriaClient)
+        mock_async_client.get_events.return_value = [event]
+        repository = EventRepository(mock_client, mock_async_client, lazy=True)
+        asyncio.run(repository.reload_events_async())
+
+        # Act
+        response = asyncio.run(repository.get_event_name_by_id_async(1))
+
+        # Assert
+        assert response == 'Event Test'
+        mock_client.get_events.assert_not_called()
+
 
 class TestReloadEvents:
 
@@ -132,3 +230,59 @@ class TestReloadEvents:
         # Assert
         assert len(response) == 1
         assert response[0].event_id == 1
+
+    def test_when_event_is_renamed(self):
+        # Arrange
+        parser = IncrementalParser()
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_events.return_value = parse_events_incrementally(
+            {'1': {'name': {'ja': 'イベント', 'en': None}}}, parser)
+        repository = EventRepository(mock_client)
+        diffs = []
+        repository.add_listener(diffs.append)
+        mock_client.get_events.return_value = parse_events_incrementally(
+            {'1': {'name': {'ja': 'イベント', 'en': 'Event'}}}, parser)
+
+        # Act
+        repository.reload_events()
+
+        # Assert
+        assert repository.get_event_name_by_id(1) == 'Event'
+        assert len(diffs) == 1
+        assert diffs[0].changed[0][0].name == 'イベント'
+
+
+class TestReloadEventsAsync:
+
+    def test_when_new_data_is_added(self, event):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_events.return_value = [event]
+        mock_async_client = build_async_mock(AsyncKarthuriaClient)
+        mock_async_client.get_events.return_value = [event, Event(2, name='Event Test 2')]
+        repository = EventRepository(mock_client, mock_async_client)
+
+        # Act
+        asyncio.run(repository.reload_events_async())
+        response = repository.events
+
+        # Assert
+        assert len(response) == 2
+        assert response[1].event_id == 2
+        assert repository.get_event_name_by_id(2) == 'Event Test 2'
+
+    def test_when_reload_is_unsuccessful(self, event):
+        # Arrange
+        mock_client = Mock(spec=KarthuriaClient)
+        mock_client.get_events.return_value = [event]
+        mock_async_client = build_async_mock(AsyncKarthuriaClient)
+        mock_async_client.get_events.side_effect = ClientError('Ups')
+        repository = EventRepository(mock_client, mock_async_client)
+
+        # Act
+        asyncio.run(repository.reload_events_async())
+        response = repository.events
+
+        # Assert
+        assert len(response) == 1
+        assert response[0].event_id == 1
@@ -0,0 +1,188 @@
+import asyncio
+
+import pytest
+from aiohttp import ClientResponseError
+
+from karthuria.async_client import AsyncKarthuriaClient
+from karthuria.model.color import Color
+from karthuria.model.school import School
+
+client = AsyncKarthuriaClient('test_url', 'test_cdn_url')
+
+
+class TestGetCharacters:
+
+    def test_when_response_is_successful(self, async_session, ok_characters_response):
+        # Arrange
+        client.session = async_session(body=ok_characters_response.json())
+        expected_name = 'Claudine Saijo'
+
+        # Act
+        response = asyncio.run(client.get_characters())
+
+        # Assert
+        client.session.get.assert_called_with('test_url/chara.json', headers={})
+        assert len(response) == 1
+        assert response[0].name == expected_name
+        assert response[0].school.description == School.SEISHO.description
+
+    def test_when_response_is_no_successful(self, async_session):
+        # Arrange
+        client.session = async_session(status=500)
+        expected_error_message = 'Ups'
+
+        # Act
+        with pytest.raises(ClientResponseError) as exception:
+            asyncio.run(client.get_characters())
+
+        # Assert
+        assert exception.value.message == expected_error_message
+
+
+class TestGetCharacter:
+
+    def test_when_response_is_successful(self, async_session, ok_character_response):
+        # Arrange
+        client.session = async_session(body=ok_character_response.json())
+        expected_name = 'Claudine Saijo'
+        expected_seiyuu = 'Aina Aiba'
+
+        # Act
+        response = asyncio.run(client.get_character(104))
+
+        # Assert
+        client.session.get.assert_called_with('test_url/chara/104.json', headers={})
+        assert response.name == expected_name
+        assert response.seiyuu == expected_seiyuu
+        assert response.color.rgb == Color.CLAUDINE.rgb
+
+    def test_when_response_is_no_successful(self, async_session):
+        # Arrange
+        client.session = async_session(status=404)
+
+        # Act
+        with pytest.raises(ClientResponseError) as exception:
+            asyncio.run(client.get_character(104))
+
+        # Assert
+        assert exception.value.status == 404
+
+
+class TestGetDress:
+
+    def test_when_response_is_successful(self, async_session, ok_dress_response):
+        # Arrange
+        client.session = async_session(body=ok_dress_response.json())
+        expected_name = 'Tristan'
+
+        # Act
+        response = asyncio.run(client.get_dress(1050009))
+
+        # Assert
+        client.session.get.assert_called_with('test_url/dress/1050009.json', headers={})
+        assert response.name == expected_name
+        assert response.dress_id == 1050009
+
+
+class TestGetDresses:
+
+    def test_when_response_is_successful(self, async_session, ok_dresses_response):
+        # Arrange
+        client.session = async_session(body=ok_dresses_response.json())
+        expected_id = 1010002
+
+        # Act
+        response = asyncio.run(client.get_dresses())
+
+        # Assert
+        assert len(response) == 2
+        assert response[1].dress_id == expected_id
+
+
+class TestGetCatalog:
+
+    def test_when_catalog_was_not_modified(self, async_session, ok_dresses_response):
+        # Arrange
+        conditional_client = AsyncKarthuriaClient('test_url', 'test_cdn_url')
+        conditional_client.session = async_session(body=ok_dresses_response.json(), headers={'ETag': '"v1"'})
+        first_response = asyncio.run(conditional_client.get_dresses())
+        conditional_client.session = async_session(status=304)
+
+        # Act
+        second_response = asyncio.run(conditional_client.get_dresses())
+
+        # Assert
+        conditional_client.session.get.assert_called_with('test_url/dress.json', headers={'If-None-Match': '"v1"'})
+        assert second_response is first_response
+
+
+class TestGetEquips:
+
+    def test_when_response_is_successful(self, async_session, ok_equips_response):
+        # Arrange
+        client.session = async_session(body=ok_equips_response.json())
+
+        # Act
+        response = asyncio.run(client.get_equips())
+
+        # Assert
+        assert len(response) == 2
+        assert response[0].characters == [104]
+        assert response[1].characters is None
+
+
+class TestGetEnemy:
+
+    def test_when_response_is_successful(self, async_session, ok_enemy_response):
+        # Arrange
+        client.session = async_session(body=ok_enemy_response.json())
+        expected_name = 'Resentful Andrew'
+
+        # Act
+        response = asyncio.run(client.get_enemy(9006204))
+
+        # Assert
+        client.session.get.assert_called_with('test_url/enemy/9006204_0.json', headers={})
+        assert response.name == expected_name
+        assert response.enemy_id == 900620402
+
+
+class TestGetEvents:
+
+    def test_when_response_is_successful(self, async_session, ok_events_response):
+        # Arrange
+        client.session = async_session(body=ok_events_response.json())
+        expected_name = 'Hello to Halloween'
+
+        # Act
+        response = asyncio.run(client.get_events())
+
+        # Assert
+        assert len(response) == 2
+        assert response[0].name == expected_name
+
+
+class TestGetCurrentEvents:
+
+    def test_when_response_is_successful(self, async_session, ok_current_events_response):
+        # Arrange
+        client.session = async_session(body=ok_current_events_response.json())
+
+        # Act
+        response = asyncio.run(client.get_current_events())
+
+        # Assert
+        assert len(response['events']) == 1
+        assert len(response['challenges']) == 2
+        assert len(response['bosses']) == 2
+
+    def test_when_response_is_no_successful(self, async_session):
+        # Arrange
+        client.session = async_session(status=503)
+
+        # Act
+        with pytest.raises(ClientResponseError) as exception:
+            asyncio.run(client.get_current_events())
+
+        # Assert
+        assert exception.value.status == 503
@@ -0,0 +1,91 @@
+from karthuria.catalog_diff import IncrementalParser, get_incremental_diff
+from karthuria.model.character import Equip
+
+
+def convert_equip(_, basic_info: dict) -> Equip:
+    return Equip(basic_info['id'], basic_info['characters'])
+
+
+def build_catalog_json(*equips: tuple) -> dict:
+    return {str(equip_id): {'basicInfo': {'id': equip_id, 'characters': characters}} for equip_id, characters in equips}
+
+
+class TestParse:
+
+    def test_when_catalog_is_parsed_the_first_time(self):
+        # Arrange
+        parser = IncrementalParser()
+
+        # Act
+        catalog = parser.parse('equips', build_catalog_json((1, [104]), (2, [101])), convert_equip)
+
+        # Assert
+        assert [equip.equip_id for equip in catalog] == [1, 2]
+        assert catalog.diff.is_initial()
+        assert len(catalog.diff.added) == 2
+
+    def test_when_entries_are_added_changed_and_removed(self):
+        # Arrange
+        parser = IncrementalParser()
+        previous = parser.parse('equips', build_catalog_json((1, [104]), (2, [101]), (3, [102])), convert_equip)
+
+        # Act
+        catalog = parser.parse('equips', build_catalog_json((1, [104]), (2, [101, 102]), (4, [103])), convert_equip)
+
+        # Assert
+        assert not catalog.diff.is_initial()
+        assert catalog.diff.previous_version == previous.version
+        assert [equip.equip_id for equip in catalog.diff.added] == [4]
+        assert catalog.diff.changed == [(previous[1], catalog[1])]
+        assert catalog.diff.removed == [previous[2]]
+        assert catalog[0] is previous[0]
+
+    def test_when_catalog_didnt_change(self):
+        # Arrange
+        parser = IncrementalParser()
+        previous = parser.parse('equips', build_catalog_json((1, [104])), convert_equip)
+
+        # Act
+        catalog = parser.parse('equips', build_catalog_json((1, [104])), convert_equip)
+
+        # Assert
+        assert catalog.diff.is_empty()
+        assert catalog[0] is previous[0]
+
+    def test_when_raw_information_is_not_the_basic_info(self):
+        # Arrange
+        parser = IncrementalParser()
+        parser.parse('events', {'1': {'name': 'Old'}}, lambda key, name: name, lambda event: event['name'])
+
+        # Act
+        catalog = parser.parse('events', {'1': {'name': 'New'}}, lambda key, name: name, lambda event: event['name'])
+
+        # Assert
+        assert catalog.diff.changed == [('Old', 'New')]
+
+
+class TestGetIncrementalDiff:
+
+    def test_when_diff_is_against_current_catalog(self):
+        # Arrange
+        parser = IncrementalParser()
+        current = parser.parse('equips', build_catalog_json((1, [104])), convert_equip)
+        catalog = parser.parse('equips', build_catalog_json((2, [104])), convert_equip)
+
+        # Act
+        diff = get_incremental_diff(current, catalog)
+
+        # Assert
+        assert diff is catalog.diff
+
+    def test_when_diff_is_against_another_catalog(self):
+        # Arrange
+        parser = IncrementalParser()
+        parser.parse('equips', build_catalog_json((1, [104])), convert_equip)
+        catalog = parser.parse('equips', build_catalog_json((2, [104])), convert_equip)
+
+        # Act
+        diff = get_incremental_diff([], catalog)
+
+        # Assert
+        assert diff is None
@@ -1,9 +1,11 @@
-from unittest.mock import patch
+import json
+import time
+from unittest.mock import patch, Mock
 
 import pytest
-import requests
-from requests import HTTPError
+from requests import HTTPError, Response
 
+from karthuria.cache.disk_cache import DiskCache
 from karthuria.client import KarthuriaClient
 from karthuria.model.color import Color
 from karthuria.model.school import School
@@ -18,7 +20,7 @@ class TestGetCharacters:
         expected_name = 'Claudine Saijo'
 
         # Act
-        with patch.object(requests, 'get', return_value=ok_characters_response) as requests_mock:
+        with patch.object(client.session, 'get', return_value=ok_characters_response) as requests_mock:
             response = client.get_characters()
 
         # Assert
@@ -33,7 +35,7 @@ class TestGetCharacters:
         expected_error_message = 'Ups'
 
         # Act
-        with patch.object(requests, 'get', return_value=bad_response) as requests_mock:
+        with patch.object(client.session, 'get', return_value=bad_response) as requests_mock:
             with pytest.raises(HTTPError) as exception:
                 client.get_characters()
 
@@ -50,7 +52,7 @@ class TestGetCharacter:
         expected_seiyuu = 'Aina Aiba'
 
         # Act
-        with patch.object(requests, 'get', return_value=ok_character_response) as requests_mock:
+        with patch.object(client.session, 'get', return_value=ok_character_response) as requests_mock:
             response = client.get_character(1)
 
         # Assert
@@ -66,7 +68,7 @@ class TestGetCharacter:
         expected_error_message = 'Ups'
 
         # Act
-        with patch.object(requests, 'get', return_value=bad_response) as requests_mock:
+        with patch.object(client.session, 'get', return_value=bad_response) as requests_mock:
             with pytest.raises(HTTPError) as exception:
                 client.get_character(1)
 
@@ -82,7 +84,7 @@ class TestGetDress:
         expected_name = 'Tristan'
 
         # Act
-        with patch.object(requests, 'get', return_value=ok_dress_response) as requests_mock:
+        with patch.object(client.session, 'get', return_value=ok_dress_response) as requests_mock:
             response = client.get_dress(1)
 
         # Assert
@@ -95,7 +97,7 @@ class TestGetDress:
         expected_error_message = 'Ups'
 
         # Act
-        with patch.object(requests, 'get', return_value=bad_response) as requests_mock:
+        with patch.object(client.session, 'get', return_value=bad_response) as requests_mock:
             with pytest.raises(HTTPError) as exception:
                 client.get_dress(1)
 
@@ -111,7 +113,7 @@ class TestGetDresses:
         expected_id = 1010002
 
         # Act
-        with patch.object(requests, 'get', return_value=ok_dresses_response) as requests_mock:
+        with patch.object(client.session, 'get', return_value=ok_dresses_response) as requests_mock:
             response = client.get_dresses()
 
         # Assert
@@ -124,7 +126,7 @@ class TestGetDresses:
         expected_error_message = 'Ups'
 
         # Act
-        with patch.object(requests, 'get', return_value=bad_response) as requests_mock:
+        with patch.object(client.session, 'get', return_value=bad_response) as requests_mock:
             with pytest.raises(HTTPError) as exception:
                 client.get_dresses()
 
@@ -140,7 +142,7 @@ class TestGetEquips:
         expected_id = '2000021'
 
         # Act
-        with patch.object(requests, 'get', return_value=ok_equips_response) as requests_mock:
+        with patch.object(client.session, 'get', return_value=ok_equips_response) as requests_mock:
             response = client.get_equips()
 
         # Assert
@@ -155,7 +157,7 @@ class TestGetEquips:
         expected_error_message = 'Ups'
 
         # Act
-        with patch.object(requests, 'get', return_value=bad_response) as requests_mock:
+        with patch.object(client.session, 'get', return_value=bad_response) as requests_mock:
             with pytest.raises(HTTPError) as exception:
                 client.get_equips()
 
@@ -172,7 +174,7 @@ class TestGetEnemy:
         expected_rarity = 1
 
         # Act
-        with patch.object(requests, 'get', return_value=ok_enemy_response) as requests_mock:
+        with patch.object(client.session, 'get', return_value=ok_enemy_response) as requests_mock:
             response = client.get_enemy(1)
 
         # Assert
@@ -186,7 +188,7 @@ class TestGetEnemy:
         expected_error_message = 'Ups'
 
         # Act
-        with patch.object(requests, 'get', return_value=bad_response) as requests_mock:
+        with patch.object(client.session, 'get', return_value=bad_response) as requests_mock:
             with pytest.raises(HTTPError) as exception:
                 client.get_enemy(1)
 
@@ -203,7 +205,7 @@ class TestGetEvents:
         expected_event_id = '101'
 
         # Act
-        with patch.object(requests, 'get', return_value=ok_events_response) as requests_mock:
+        with patch.object(client.session, 'get', return_value=ok_events_response) as requests_mock:
             response = client.get_events()
 
         # Assert
@@ -218,7 +220,7 @@ class TestGetEvents:
         expected_error_message = 'Ups'
 
         # Act
-        with patch.object(requests, 'get', return_value=bad_response) as requests_mock:
+        with patch.object(client.session, 'get', return_value=bad_response) as requests_mock:
             with pytest.raises(HTTPError) as exception:
                 client.get_events()
 
@@ -227,6 +229,115 @@ class TestGetEvents:
         assert str(exception.value) == expected_error_message
 
 
+class TestGetCatalog:
+
+    def test_when_catalog_was_not_modified(self, ok_events_response):
+        # Arrange
+        conditional_client = KarthuriaClient('test_url', 'test_cdn_url')
+        etag_response = Mock(spec=Response)
+        etag_response.ok = True
+        etag_response.status_code = 200
+        etag_response.headers = {'ETag': '"v1"'}
+        etag_response.json.return_value = ok_events_response.json()
+        not_modified_response = Mock(spec=Response)
+        not_modified_response.ok = False
+        not_modified_response.status_code = 304
+
+        # Act
+        with patch.object(conditional_client.session, 'get',
+                          side_effect=[etag_response, not_modified_response]) as requests_mock:
+            first_response = conditional_client.get_events()
+            second_response = conditional_client.get_events()
+
+        # Assert
+        requests_mock.assert_called_with('test_url/event.json', headers={'If-None-Match': '"v1"'})
+        assert etag_response.json.call_count == 1
+        assert second_response is first_response
+
+    def test_when_catalog_was_modified(self, ok_events_response):
+        # Arrange
+        conditional_client = KarthuriaClient('test_url', 'test_cdn_url')
+        ok_events_response.headers = {'ETag': '"v1"'}
+
+        # Act
+        with patch.object(conditional_client.session, 'get', return_value=ok_events_response):
+            first_response = conditional_client.get_events()
+            second_response = conditional_client.get_events()
+        ok_events_response.headers = {}
+
+        # Assert
+        assert second_response is not first_response
+        assert len(second_response) == 2
+
+
+class TestDiskCache:
+
+    def test_when_response_is_fresh_in_disk(self, tmp_path, ok_dress_response):
+        # Arrange
+        disk_cache = DiskCache(str(tmp_path), ttl={'/dress/*': 600})
+        disk_cache.put('/dress/1050009.json', json.dumps(ok_dress_response.json()).encode('utf-8'), {})
+        cached_client = KarthuriaClient('test_url', 'test_cdn_url', disk_cache=disk_cache)
+        expected_name = 'Tristan'
+
+        # Act
+        with patch.object(cached_client.session, 'get') as requests_mock:
+            response = cached_client.get_dress(1050009)
+
+        # Assert
+        requests_mock.assert_not_called()
+        assert response.name == expected_name
+
+    def test_when_response_is_saved_in_disk(self, tmp_path, ok_enemy_response):
+        # Arrange
+        disk_cache = DiskCache(str(tmp_path), ttl={'/enemy/*': 600})
+        cached_client = KarthuriaClient('test_url', 'test_cdn_url', disk_cache=disk_cache)
+        ok_enemy_response.content = json.dumps(ok_enemy_response.json()).encode('utf-8')
+
+        # Act
+        with patch.object(cached_client.session, 'get', return_value=ok_enemy_response) as requests_mock:
+            first_response = cached_client.get_enemy(9006204)
+            second_response = cached_client.get_enemy(9006204)
+
+        # Assert
+        assert requests_mock.call_count == 1
+        assert first_response.name == second_response.name
+
+    def test_when_expired_response_was_not_modified(self, tmp_path, ok_events_response):
+        # Arrange
+        disk_cache = DiskCache(str(tmp_path), ttl={'/event.json': 0.01})
+        disk_cache.put('/event.json', json.dumps(ok_events_response.json()).encode('utf-8'), {'ETag': '"v1"'})
+        cached_client = KarthuriaClient('test_url', 'test_cdn_url', disk_cache=disk_cache)
+        not_modified_response = Mock(spec=Response)
+        not_modified_response.ok = False
+        not_modified_response.status_code = 304
+        time.sleep(0.02)
+
+        # Act
+        with patch.object(cached_client.session, 'get', return_value=not_modified_response) as requests_mock:
+            response = cached_client.get_events()
+
+        # Assert
+        requests_mock.assert_called_with('test_url/event.json', headers={'If-None-Match': '"v1"'})
+        assert len(response) == 2
+
+    def test_when_fresh_response_must_be_revalidated(self, tmp_path, ok_events_response):
+        # Arrange
+        disk_cache = DiskCache(str(tmp_path), ttl={'/event.json': 600})
+        disk_cache.put('/event.json', json.dumps(ok_events_response.json()).encode('utf-8'), {'ETag': '"v1"'})
+        cached_client = KarthuriaClient('test_url', 'test_cdn_url', disk_cache=disk_cache)
+        not_modified_response = Mock(spec=Response)
+        not_modified_response.ok = False
+        not_modified_response.status_code = 304
+
+        # Act
+        with patch.object(cached_client.session, 'get', return_value=not_modified_response) as requests_mock:
+            response = cached_client.get_events(revalidate=True)
+
+        # Assert
+        requests_mock.assert_called_with('test_url/event.json', headers={'If-None-Match': '"v1"'})
+        assert len(response) == 2
+
+
 class TestGetCurrentEvents:
     def test_when_response_is_successful(self, ok_current_events_response):
         # Arrange
@@ -235,7 +346,7 @@ class TestGetCurrentEvents:
         expected_boss_id = 900620202
 
         # Act
-        with patch.object(requests, 'get', return_value=ok_current_events_response) as requests_mock:
+        with patch.object(client.session, 'get', return_value=ok_current_events_response) as requests_mock:
             response = client.get_current_events()
 
         # Assert
@@ -253,7 +364,7 @@ class TestGetCurrentEvents:
         expected_challenge_id = 1080009
 
         # Act
-        with patch.object(requests, 'get', return_value=only_challenge_current_events_response) as requests_mock:
+        with patch.object(client.session, 'get', return_value=only_challenge_current_events_response) as requests_mock:
             response = client.get_current_events()
 
         # Assert
@@ -269,7 +380,7 @@ class TestGetCurrentEvents:
         expected_error_message = 'Ups'
 
         # Act
-        with patch.object(requests, 'get', return_value=bad_response) as requests_mock:
+        with patch.object(client.session, 'get', return_value=bad_response) as requests_mock:
             with pytest.raises(HTTPError) as exception:
                 client.get_current_events()
 
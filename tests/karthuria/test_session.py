@@ -0,0 +1,95 @@
+import asyncio
+from unittest.mock import patch, Mock
+
+from requests import PreparedRequest
+from requests.adapters import HTTPAdapter
+
+from karthuria.session import PoolStats, PooledHTTPAdapter, build_session, build_async_session
+
+
+class TestRecord:
+
+    def test_when_connection_is_new(self):
+        # Arrange
+        stats = PoolStats()
+
+        # Act
+        stats.record(True)
+
+        # Assert
+        assert stats.to_dict() == {'requests': 1, 'new_connections': 1, 'reused_connections': 0}
+
+    def test_when_connection_is_reused(self):
+        # Arrange
+        stats = PoolStats()
+        expected_str = '2 requests, 1 new connections, 1 reused connections'
+
+        # Act
+        stats.record(True)
+        stats.record(False)
+
+        # Assert
+        assert stats.reused_connections == 1
+        assert str(stats) == expected_str
+
+
+class TestSend:
+
+    def test_when_requests_share_the_same_connection(self):
+        # Arrange
+        stats = PoolStats()
+        adapter = PooledHTTPAdapter(stats)
+        pool = Mock()
+        pool.num_connections = 0
+        request = PreparedRequest()
+        request.prepare(method='GET', url='https://test_url/chara.json')
+
+        def open_first_connection(*_, **__):
+            pool.num_connections = 1
+
+        # Act
+        with patch.object(adapter, 'get_connection', return_value=pool):
+            with patch.object(HTTPAdapter, 'send', side_effect=open_first_connection):
+                adapter.send(request)
+                adapter.send(request)
+
+        # Assert
+        assert stats.new_connections == 1
+        assert stats.reused_connections == 1
+
+
+class TestBuildSession:
+
+    def test_when_pool_is_configured(self):
+        # Arrange
+        stats = PoolStats()
+
+        # Act
+        session = build_session(stats, pool_size=2, pool_per_host=5, keepalive_timeout=10)
+        adapter = session.get_adapter('https://karth.top/api')
+
+        # Assert
+        assert isinstance(adapter, PooledHTTPAdapter)
+        assert adapter.stats is stats
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 5
+
+
+class TestBuildAsyncSession:
+
+    def test_when_pool_is_configured(self):
+        # Arrange
+        stats = PoolStats()
+
+        async def build_and_close():
+            session = build_async_session(stats, pool_size=20, pool_per_host=4, keepalive_timeout=10)
+            connector = session.connector
+            await session.close()
+            return connector
+
+        # Act
+        connector = asyncio.run(build_and_close())
+
+        # Assert
+        assert connector.limit == 20
+        assert connector.limit_per_host == 4
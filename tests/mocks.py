@@ -0,0 +1,41 @@
+import inspect
+from unittest.mock import Mock, MagicMock
+
+
+class CoroutineMock(MagicMock):
+    """
+    Mock of a coroutine function that works with Python 3.7, where unittest.mock.AsyncMock doesn't exist.
+    Calling it returns a coroutine that, when awaited, registers the call and returns the configured value or raises
+    the configured side effect, so awaits are asserted with the assert_called methods.
+    """
+
+    async def __call__(self, *args, **kwargs):
+        return super().__call__(*args, **kwargs)
+
+
+class AsyncContextManagerMock:
+    """
+    Async context manager that returns the given value when it is entered, like the responses of an aiohttp session
+    """
+
+    def __init__(self, value):
+        self.value = value
+
+    async def __aenter__(self):
+        return self.value
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        return False
+
+
+def build_async_mock(spec) -> Mock:
+    """
+    Build a Mock of a class whose coroutine methods are CoroutineMock, as Python 3.8 does with Mock(spec=...).
+
+    :param spec: The class to mock
+    :return: The Mock with the attributes of the class
+    """
+    mock = Mock(spec=spec)
+    for name, _ in inspect.getmembers(spec, inspect.iscoroutinefunction):
+        setattr(mock, name, CoroutineMock())
+    return mock
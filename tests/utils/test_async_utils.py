@@ -0,0 +1,58 @@
+import asyncio
+
+from utils.async_utils import gather_with_limit
+
+
+class TestGatherWithLimit:
+
+    def test_when_all_coroutines_are_successful(self):
+        # Arrange
+        async def delayed_value(value: int, delay: float) -> int:
+            await asyncio.sleep(delay)
+            return value
+
+        coroutines = [delayed_value(1, 0.03), delayed_value(2, 0.01), delayed_value(3, 0.02)]
+        expected_result = [1, 2, 3]
+
+        # Act
+        result = asyncio.run(gather_with_limit(coroutines, 2))
+
+        # Assert
+        assert result == expected_result
+
+    def test_when_one_coroutine_fails(self):
+        # Arrange
+        async def value(number: int) -> int:
+            if number == 2:
+                raise ValueError('Ups')
+            return number
+
+        coroutines = [value(1), value(2), value(3)]
+
+        # Act
+        result = asyncio.run(gather_with_limit(coroutines, 2))
+
+        # Assert
+        assert result[0] == 1
+        assert isinstance(result[1], ValueError)
+        assert result[2] == 3
+
+    def test_when_limit_is_reached(self):
+        # Arrange
+        running = []
+        max_running = []
+
+        async def track() -> None:
+            running.append(1)
+            max_running.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+
+        coroutines = [track() for _ in range(10)]
+        expected_max_running = 3
+
+        # Act
+        asyncio.run(gather_with_limit(coroutines, expected_max_running))
+
+        # Assert
+        assert max(max_running) == expected_max_running
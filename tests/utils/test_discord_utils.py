@@ -1,8 +1,11 @@
-from unittest.mock import patch
+import asyncio
+from unittest.mock import patch, Mock
 
 import pytest
+from discord import Embed
 
-from utils.discord_utils import get_discord_color, get_rol, get_channel_by_name
+from tests.mocks import CoroutineMock
+from utils.discord_utils import get_discord_color, get_rol, get_channel_by_name, send_embed_payload
 
 
 class TestGetDiscordColor:
@@ -84,3 +87,18 @@ class TestGetChannelByName:
 
         # Assert
         assert result is None
+
+
+class TestSendEmbedPayload:
+
+    def test_when_payload_is_sent(self):
+        # Arrange
+        bot = Mock()
+        bot.http.send_message = CoroutineMock()
+        embed_payload = Embed(title='Test').to_dict()
+
+        # Act
+        asyncio.run(send_embed_payload(bot, 1, 'Test', embed_payload))
+
+        # Assert
+        bot.http.send_message.assert_called_once_with(1, 'Test', embed=embed_payload)
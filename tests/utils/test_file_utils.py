@@ -3,7 +3,8 @@ from json import JSONDecodeError
 
 import pytest
 
-from utils.file_utils import load_json_file, write_json_file, is_file
+from utils.file_utils import load_json_file, write_json_file, is_file, write_file_atomically, remove_file, \
+    append_json_line, load_json_lines, read_json_lines, get_file_signature, get_file_hash
 
 
 class TestLoadJsonFile:
@@ -112,3 +113,158 @@ class TestIsFile:
 
         # Assert
         assert expected_result == result
+
+
+class TestWriteFileAtomically:
+
+    def test_when_file_doesnt_exist(self, tmp_path):
+        # Arrange
+        file_path = str(tmp_path / 'atomic.json')
+        expected_content = b'{"key": "value"}'
+
+        # Act
+        write_file_atomically(file_path, expected_content)
+
+        # Assert
+        with open(file_path, 'rb') as file:
+            assert file.read() == expected_content
+        assert len(list(tmp_path.iterdir())) == 1
+
+    def test_when_file_is_replaced(self, tmp_path):
+        # Arrange
+        file_path = str(tmp_path / 'atomic.json')
+        write_file_atomically(file_path, b'old')
+
+        # Act
+        write_file_atomically(file_path, b'new')
+
+        # Assert
+        with open(file_path, 'rb') as file:
+            assert file.read() == b'new'
+
+
+class TestRemoveFile:
+
+    def test_when_file_exist(self, tmp_path):
+        # Arrange
+        file_path = tmp_path / 'remove.json'
+        file_path.write_text('{}')
+
+        # Act
+        remove_file(str(file_path))
+
+        # Assert
+        assert not file_path.exists()
+
+    def test_when_file_doesnt_exist(self, tmp_path):
+        # Arrange
+        file_path = str(tmp_path / 'remove.json')
+
+        # Act
+        remove_file(file_path)
+
+        # Assert
+        assert is_file(file_path) is False
+
+
+class TestAppendJsonLine:
+
+    def test_when_lines_are_appended(self, tmp_path):
+        # Arrange
+        file_path = str(tmp_path / 'test.journal')
+
+        # Act
+        append_json_line(file_path, {'key': 1})
+        append_json_line(file_path, {'key': 2})
+
+        # Assert
+        with open(file_path) as file:
+            assert file.read() == '{"key": 1}\n{"key": 2}\n'
+
+
+class TestLoadJsonLines:
+
+    def test_when_file_doesnt_exist(self, tmp_path):
+        # Act
+        result = load_json_lines(str(tmp_path / 'test.journal'))
+
+        # Assert
+        assert result == []
+
+    def test_when_last_line_is_broken(self, tmp_path):
+        # Arrange
+        file_path = tmp_path / 'test.journal'
+        file_path.write_text('{"key": 1}\n{"key": 2}\n{"ke')
+
+        # Act
+        result = load_json_lines(str(file_path))
+
+        # Assert
+        assert result == [{'key': 1}, {'key': 2}]
+
+
+class TestReadJsonLines:
+
+    def test_when_reading_from_offset(self, tmp_path):
+        # Arrange
+        file_path = str(tmp_path / 'test.journal')
+        append_json_line(file_path, {'key': 1})
+        _, offset = read_json_lines(file_path)
+        append_json_line(file_path, {'key': 2})
+
+        # Act
+        result, new_offset = read_json_lines(file_path, offset)
+
+        # Assert
+        assert result == [{'key': 2}]
+        assert new_offset == os.path.getsize(file_path)
+
+    def test_when_last_line_is_incomplete(self, tmp_path):
+        # Arrange
+        file_path = tmp_path / 'test.journal'
+        file_path.write_text('{"key": 1}\n{"key": 2}')
+
+        # Act
+        result, offset = read_json_lines(str(file_path))
+
+        # Assert
+        assert result == [{'key': 1}]
+        assert offset == len('{"key": 1}\n')
+
+
+class TestGetFileSignature:
+
+    def test_when_file_exist(self, tmp_path):
+        # Arrange
+        file_path = tmp_path / 'test.txt'
+        file_path.write_bytes(b'test')
+
+        # Act
+        result = get_file_signature(str(file_path))
+
+        # Assert
+        assert result == (os.stat(file_path).st_mtime_ns, 4)
+
+    def test_when_file_doesnt_exist(self, tmp_path):
+        # Act
+        result = get_file_signature(str(tmp_path / 'test.txt'))
+
+        # Assert
+        assert result is None
+
+
+class TestGetFileHash:
+
+    def test_when_content_is_the_same(self, tmp_path):
+        # Arrange
+        first_path = tmp_path / 'first.txt'
+        second_path = tmp_path / 'second.txt'
+        first_path.write_bytes(b'test')
+        second_path.write_bytes(b'test')
+
+        # Act
+        result = get_file_hash(str(first_path))
+
+        # Assert
+        assert result == get_file_hash(str(second_path))
+        assert get_file_hash(str(tmp_path / 'other.txt')) is None
@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+from utils.lazy_loader import LazyLoader
+
+
+class TestInit:
+
+    def test_when_loader_is_not_lazy(self):
+        # Arrange
+        load = Mock()
+
+        # Act
+        loader = LazyLoader(load, lazy=False)
+
+        # Assert
+        load.assert_called_once()
+        assert loader.loaded
+
+    def test_when_loader_is_lazy(self):
+        # Arrange
+        load = Mock()
+
+        # Act
+        loader = LazyLoader(load)
+
+        # Assert
+        load.assert_not_called()
+        assert not loader.loaded
+
+
+class TestEnsureLoaded:
+
+    def test_when_it_is_called_several_times(self):
+        # Arrange
+        load = Mock()
+        loader = LazyLoader(load)
+
+        # Act
+        loader.ensure_loaded()
+        loader.ensure_loaded()
+
+        # Assert
+        load.assert_called_once()
+
+    def test_when_threads_need_it_at_the_same_time(self):
+        # Arrange
+        calls = []
+
+        def load():
+            calls.append(1)
+            time.sleep(0.05)
+
+        loader = LazyLoader(load)
+        threads = [threading.Thread(target=loader.ensure_loaded) for _ in range(5)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert len(calls) == 1
+
+    def test_when_load_fails(self):
+        # Arrange
+        load = Mock(side_effect=[Exception('Ups'), None])
+        loader = LazyLoader(load)
+
+        # Act
+        try:
+            loader.ensure_loaded()
+        except Exception:
+            pass
+        loader.ensure_loaded()
+
+        # Assert
+        assert load.call_count == 2
+        assert loader.loaded
+
+
+class TestEnsureLoadedAsync:
+
+    def test_when_coroutines_need_it_at_the_same_time(self):
+        # Arrange
+        load = Mock(side_effect=lambda: time.sleep(0.05))
+        loader = LazyLoader(load)
+
+        async def ensure_loaded_five_times():
+            await asyncio.gather(*[loader.ensure_loaded_async() for _ in range(5)])
+
+        # Act
+        asyncio.run(ensure_loaded_five_times())
+
+        # Assert
+        load.assert_called_once()
+
+
+class TestMarkLoaded:
+
+    def test_when_it_was_loaded_in_another_way(self):
+        # Arrange
+        load = Mock()
+        loader = LazyLoader(load)
+
+        # Act
+        loader.mark_loaded()
+        loader.ensure_loaded()
+
+        # Assert
+        load.assert_not_called()
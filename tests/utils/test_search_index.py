@@ -0,0 +1,106 @@
+from utils.search_index import SearchIndex, get_trigrams
+
+NAMES = ['Karen Aijo', 'Hikari Kagura', 'Mahiru Tsuyuzaki', 'Claudine Saijo', 'Maya Tendo', 'Kaoruko Hanayagi']
+
+
+class TestSearch:
+
+    def test_when_query_is_a_full_name(self):
+        # Arrange
+        index = SearchIndex(NAMES, lambda name: name)
+
+        # Act
+        result = index.search('claudine saijo')
+
+        # Assert
+        assert result == ['Claudine Saijo']
+
+    def test_when_query_matches_several_names(self):
+        # Arrange
+        index = SearchIndex(NAMES, lambda name: name)
+
+        # Act
+        result = index.search('Ka')
+
+        # Assert
+        assert result == ['Karen Aijo', 'Kaoruko Hanayagi', 'Hikari Kagura']
+
+    def test_when_query_is_in_the_middle_of_a_name(self):
+        # Arrange
+        index = SearchIndex(NAMES, lambda name: name)
+
+        # Act
+        result = index.search('aijo')
+
+        # Assert
+        assert result == ['Karen Aijo', 'Claudine Saijo']
+
+    def test_when_limit_is_set(self):
+        # Arrange
+        index = SearchIndex(NAMES, lambda name: name)
+
+        # Act
+        result = index.search('aijo', limit=1)
+
+        # Assert
+        assert result == ['Karen Aijo']
+
+    def test_when_nothing_matches(self):
+        # Arrange
+        index = SearchIndex(NAMES, lambda name: name)
+
+        # Act
+        result = index.search('Futaba')
+
+        # Assert
+        assert result == []
+
+    def test_when_query_is_empty(self):
+        # Arrange
+        index = SearchIndex(NAMES, lambda name: name)
+
+        # Act
+        result = index.search('  ')
+
+        # Assert
+        assert result == []
+
+
+class TestComplete:
+
+    def test_when_prefix_starts_first_and_last_names(self):
+        # Arrange
+        index = SearchIndex(NAMES, lambda name: name)
+
+        # Act
+        result = index.complete('Ka')
+
+        # Assert
+        assert result == ['Karen Aijo', 'Hikari Kagura', 'Kaoruko Hanayagi']
+
+    def test_when_prefix_is_in_the_middle_of_a_name(self):
+        # Arrange
+        index = SearchIndex(NAMES, lambda name: name)
+
+        # Act
+        result = index.complete('ijo')
+
+        # Assert
+        assert result == []
+
+
+class TestGetTrigrams:
+
+    def test_when_text_is_shorter_than_a_trigram(self):
+        # Act
+        result = get_trigrams('ab')
+
+        # Assert
+        assert result == set()
+
+    def test_when_text_has_several_trigrams(self):
+        # Act
+        result = get_trigrams('maya')
+
+        # Assert
+        assert result == {'may', 'aya'}
@@ -0,0 +1,51 @@
+from unittest.mock import patch
+
+import pytest
+
+from utils.timeline import Timeline
+
+
+class TestPhase:
+
+    @patch('utils.timeline.time.monotonic')
+    def test_when_phases_finish(self, mock_monotonic):
+        # Arrange
+        mock_monotonic.side_effect = [0.0, 1.0, 3.5, 3.5, 4.0, 4.5]
+        timeline = Timeline()
+
+        # Act
+        with timeline.phase('catalogs'):
+            pass
+        with timeline.phase('extensions'):
+            pass
+
+        # Assert
+        assert timeline.durations == {'catalogs': 2.5, 'extensions': 0.5}
+        assert str(timeline) == 'catalogs 2.50s, extensions 0.50s, total 4.50s'
+
+    def test_when_phase_fails(self):
+        # Arrange
+        timeline = Timeline()
+
+        # Act
+        with pytest.raises(ValueError):
+            with timeline.phase('catalogs'):
+                raise ValueError('Test')
+
+        # Assert
+        assert timeline.is_finished('catalogs')
+
+
+class TestIsFinished:
+
+    def test_when_phase_is_running(self):
+        # Arrange
+        timeline = Timeline()
+        timeline.start('gateway')
+
+        # Act
+        result = timeline.is_finished('gateway')
+
+        # Assert
+        assert not result
+        assert str(timeline).startswith('total')